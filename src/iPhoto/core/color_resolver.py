@@ -215,7 +215,8 @@ def compute_color_statistics(image: QImage, *, max_sample_size: int = 1024) -> C
         return ColorStats()
     pixel_region = surface[:, : width * 4].reshape((height, width, 4))
 
-    bgr = pixel_region[..., :3].astype(np.float32, copy=False) / np.float32(255.0)
+    channels = pixel_region[..., :3]
+    bgr = channels.astype(np.float32, copy=False) / np.float32(255.0)
     b = bgr[..., 0]
     g = bgr[..., 1]
     r = bgr[..., 2]
@@ -223,7 +224,10 @@ def compute_color_statistics(image: QImage, *, max_sample_size: int = 1024) -> C
     max_c = np.maximum(np.maximum(r, g), b)
     min_c = np.minimum(np.minimum(r, g), b)
     delta = max_c - min_c
-    saturation = np.where(max_c <= 0.0, 0.0, delta / (max_c + 1e-8))
+    # The channels are 8-bit, so HSV saturation depends only on the (max, min)
+    # byte pair and can be gathered from a precomputed table.
+    max_8 = channels.max(axis=-1)
+    saturation = _SATURATION_LUT[max_8, channels.min(axis=-1)]
     value = max_c
 
     delta_safe = np.where(delta > 1e-8, delta, 1.0)
@@ -248,9 +252,9 @@ def compute_color_statistics(image: QImage, *, max_sample_size: int = 1024) -> C
     bin_indices = np.clip((saturation * 64.0).astype(np.int64), 0, 63)
     hist = np.bincount(bin_indices.ravel(), minlength=64)
 
-    lin_r = _srgb_to_linear(r)
-    lin_g = _srgb_to_linear(g)
-    lin_b = _srgb_to_linear(b)
+    lin_r = _SRGB_TO_LINEAR_LUT[channels[..., 2]]
+    lin_g = _SRGB_TO_LINEAR_LUT[channels[..., 1]]
+    lin_b = _SRGB_TO_LINEAR_LUT[channels[..., 0]]
 
     sum_lin_r = float(np.sum(lin_r, dtype=np.float64))
     sum_lin_g = float(np.sum(lin_g, dtype=np.float64))
@@ -337,6 +341,23 @@ def _srgb_to_linear(channel: float | np.ndarray) -> float | np.ndarray:
     return linear
 
 
+def _build_saturation_lut() -> np.ndarray:
+    """Return the HSV saturation for every 8-bit ``(max, min)`` channel pair."""
+
+    levels = np.arange(256, dtype=np.float32) / np.float32(255.0)
+    max_c = levels[:, np.newaxis]
+    delta = max_c - levels[np.newaxis, :]
+    return np.where(max_c <= 0.0, 0.0, delta / (max_c + 1e-8)).astype(np.float32)
+
+
+# 8-bit lookup tables used by :func:`compute_color_statistics` in place of the
+# per-pixel power and division.  Entries where ``min > max`` are never read.
+_SRGB_TO_LINEAR_LUT = np.asarray(
+    _srgb_to_linear(np.arange(256, dtype=np.float32) / np.float32(255.0)), dtype=np.float32
+)
+_SATURATION_LUT = _build_saturation_lut()
+
+
 __all__ = [
     "COLOR_KEYS",
     "COLOR_RANGES",
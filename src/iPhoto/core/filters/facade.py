@@ -71,14 +71,11 @@ def apply_adjustments(
     # relying on Qt's copy-on-write semantics keeps the function efficient while
     # guaranteeing we never mutate the caller's instance in-place.
     result = image.convertToFormat(QImage.Format.Format_ARGB32)
-
-    # ``convertToFormat`` can return a shallow copy that still references the
-    # original pixel buffer when no conversion was required.  Creating an
-    # explicit deep copy ensures Qt allocates a dedicated, writable buffer so
-    # the fast adjustment path below never attempts to mutate a read-only view.
-    # Without this defensive copy, edits made to previously cached images could
-    # crash when the shared buffer exposes a read-only ``memoryview``.
-    result = result.copy()
+    # When no conversion was required ``result`` is a shallow copy that still
+    # references the caller's pixel buffer.  The Pillow path only reads from it
+    # and the early exit hands out a copy-on-write handle, so the deep copy is
+    # deferred until one of the in-place paths below actually needs it.
+    shares_source = image.format() == QImage.Format.Format_ARGB32
 
     # Extract and normalize all adjustment parameters
     brilliance = float(adjustments.get("Brilliance", 0.0))
@@ -221,7 +218,12 @@ def apply_adjustments(
                 )
         return transformed
 
-    # Pillow path not available, use JIT or fallback path
+    # Pillow path not available, use JIT or fallback path.  These mutate the
+    # buffer in-place, so make sure it is private first.  Without the explicit
+    # deep copy, edits made to previously cached images could crash when the
+    # shared buffer exposes a read-only ``memoryview``.
+    if shares_source:
+        result = result.copy()
     bytes_per_line = result.bytesPerLine()
 
     # Compute color statistics if needed
@@ -11,9 +11,13 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from collections.abc import Sequence
+
 import numpy as np
 from PySide6.QtGui import QImage
 
+from .numpy_executor import _is_neutral_color
+from .numpy_executor import apply_color_previews as _apply_color_previews_numpy
 from .utils import _resolve_pixel_buffer
 
 logger = logging.getLogger(__name__)
@@ -224,3 +228,44 @@ def apply_color_adjustments_inplace_qimage(
         gain_g,
         gain_b,
     )
+
+
+def apply_color_previews_qimage(
+    image: QImage,
+    params: Sequence[tuple[float, float, float]],
+    gain_r: float,
+    gain_g: float,
+    gain_b: float,
+) -> list[QImage]:
+    """Return one copy of *image* per ``(saturation, vibrance, cast)`` entry in *params*.
+
+    With a compiled kernel (AOT or JIT) every variant is a single fused pass
+    over a copy of the source, which beats the NumPy broadcast for slider
+    strips.  Without one the NumPy batch implementation is used instead.
+    """
+
+    if not (_AOT_AVAILABLE or _JIT_AVAILABLE):
+        return _apply_color_previews_numpy(image, params, gain_r, gain_g, gain_b)
+
+    source = image.convertToFormat(QImage.Format.Format_ARGB32)
+    results: list[QImage] = []
+    try:
+        for saturation, vibrance, cast in params:
+            if _is_neutral_color(saturation, vibrance, cast):
+                # Nothing to apply; share the source buffer instead of copying it.
+                results.append(QImage(source))
+                continue
+            result = source.copy()
+            apply_color_adjustments_inplace_qimage(
+                result,
+                saturation,
+                vibrance,
+                cast,
+                gain_r,
+                gain_g,
+                gain_b,
+            )
+            results.append(result)
+    except (BufferError, RuntimeError, TypeError):
+        return _apply_color_previews_numpy(image, params, gain_r, gain_g, gain_b)
+    return results
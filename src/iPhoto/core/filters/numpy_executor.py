@@ -8,6 +8,8 @@ compilation is unavailable (e.g., in Nuitka-packaged builds without AOT).
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
+
 import numpy as np
 from PySide6.QtGui import QImage
 
@@ -116,6 +118,137 @@ def _np_apply_color_transform(
     return r, g, b
 
 
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def _np_color_transform_rgb8(
+    rgb8: np.ndarray,
+    saturation: float | np.ndarray,
+    vibrance: float | np.ndarray,
+    cast: float | np.ndarray,
+    gains: tuple[float, float, float],
+) -> np.ndarray:
+    """Fused variant of :func:`_np_apply_color_transform` for ``(H, W, 3)`` 8-bit RGB.
+
+    The maths runs directly on the 0-255 scale and the result is returned
+    unrounded in ``[0, 255]``, which saves the separate normalise and rescale
+    passes around the kernel.  Internally the channels are laid out planar
+    (``(3, H, W)``) so that the luma blend ``luma + scale * (rgb - luma)``
+    broadcasts over whole rows; broadcasting against a trailing axis of three
+    would run NumPy's inner loops three elements at a time.  The returned
+    array is an ``(..., H, W, 3)`` view of that planar buffer.  The scalar
+    parameters may also be arrays shaped ``(N, 1, 1, 1)``, in which case a
+    ``(N, H, W, 3)`` stack is returned with one adjusted copy of *rgb8* per
+    entry.
+    """
+
+    rgb = np.moveaxis(rgb8, -1, 0).astype(np.float32, order="C")
+    mix = (1.0 - cast) + np.asarray(gains, dtype=np.float32).reshape(3, 1, 1) * cast
+    rgb = rgb * np.asarray(mix, dtype=np.float32)
+    luma = _LUMA_WEIGHTS[0] * rgb[..., 0:1, :, :]
+    luma += _LUMA_WEIGHTS[1] * rgb[..., 1:2, :, :]
+    luma += _LUMA_WEIGHTS[2] * rgb[..., 2:3, :, :]
+    w = 1.0 - np.minimum(np.abs(luma - 127.5) * np.float32(2.0 / 255.0), 1.0)
+    chroma_scale = (1.0 + saturation) * (1.0 + vibrance * w)
+    rgb -= luma
+    rgb *= chroma_scale
+    rgb += luma
+    np.clip(rgb, 0.0, 255.0, out=rgb)
+    return np.moveaxis(rgb, -3, -1)
+
+
+def _is_neutral_color(saturation: float, vibrance: float, cast: float) -> bool:
+    """Return ``True`` when the Color transform would leave pixels unchanged."""
+
+    return abs(saturation) <= 1e-6 and abs(vibrance) <= 1e-6 and cast <= 1e-6
+
+
+def _argb32_from_rgb(rgb: np.ndarray, alpha: np.ndarray) -> QImage | None:
+    """Return a new ``Format_ARGB32`` image holding the 8-bit *rgb* and *alpha* planes."""
+
+    height, width = alpha.shape
+    result = QImage(width, height, QImage.Format.Format_ARGB32)
+    view, guard = _resolve_pixel_buffer(result)
+    _ = guard
+    out = _prepare_pixel_view(
+        np.frombuffer(view, dtype=np.uint8, count=result.bytesPerLine() * height),
+        width,
+        height,
+        result.bytesPerLine(),
+    )
+    if out is None:
+        return None
+    out[..., 2::-1] = rgb
+    out[..., 3] = alpha
+    return result
+
+
+def apply_color_previews(
+    image: QImage,
+    params: Sequence[tuple[float, float, float]],
+    gain_r: float,
+    gain_g: float,
+    gain_b: float,
+) -> list[QImage]:
+    """Return one copy of *image* per ``(saturation, vibrance, cast)`` entry in *params*.
+
+    This is the preview-sized counterpart of :func:`apply_adjustments` for
+    callers that know no tone or B&W adjustment is active.  The source pixels
+    are read once and every variant is evaluated in the same broadcast
+    expression over a leading ``(N, H, W, 3)`` axis, so a whole slider strip
+    costs one kernel invocation rather than one per thumbnail.
+    """
+
+    source = image.convertToFormat(QImage.Format.Format_ARGB32)
+    width = source.width()
+    height = source.height()
+    bytes_per_line = source.bytesPerLine()
+    pixels = _prepare_pixel_view(
+        np.frombuffer(source.constBits(), dtype=np.uint8, count=bytes_per_line * height),
+        width,
+        height,
+        bytes_per_line,
+    )
+    # Neutral entries (typically the slider's centre tick) leave every pixel
+    # unchanged, so they share the source buffer instead of entering the stack.
+    active = [index for index, entry in enumerate(params) if not _is_neutral_color(*entry)]
+    results: list[QImage] = [QImage(source) for _ in params]
+    if pixels is None or not active:
+        return results
+
+    saturation, vibrance, cast = (
+        np.asarray(column, dtype=np.float32).reshape(-1, 1, 1, 1)
+        for column in zip(*(params[index] for index in active))
+    )
+    # ``Format_ARGB32`` stores pixels as BGRA in memory; reversing the first
+    # three channels yields RGB.
+    frames = _np_color_transform_rgb8(
+        pixels[..., 2::-1], saturation, vibrance, cast, (gain_r, gain_g, gain_b)
+    )
+    np.rint(frames, out=frames)
+
+    alpha = pixels[..., 3]
+    for index, frame in zip(active, frames):
+        result = _argb32_from_rgb(frame, alpha)
+        if result is not None:
+            results[index] = result
+    return results
+
+
+def apply_color_preview(
+    image: QImage,
+    saturation: float,
+    vibrance: float,
+    cast: float,
+    gain_r: float,
+    gain_g: float,
+    gain_b: float,
+) -> QImage:
+    """Return a copy of *image* with only the Color adjustments applied."""
+
+    return apply_color_previews(image, [(saturation, vibrance, cast)], gain_r, gain_g, gain_b)[0]
+
+
 def _bw_unsigned_to_signed(value: float) -> float:
     """Remap a value from [0, 1] to [-1, 1] range."""
     return float(max(-1.0, min(1.0, float(value) * 2.0 - 1.0)))
@@ -408,22 +541,23 @@ def apply_color_adjustments_inplace_buffer(
     gain_g: float,
     gain_b: float,
 ) -> None:
-    """Apply only color adjustments using NumPy vectorization."""
+    """Apply only color adjustments using NumPy vectorization.
+
+    The luma/chroma blend runs on the interleaved 8-bit channels through
+    :func:`_np_color_transform_rgb8`, avoiding the planar split, the
+    normalise/rescale passes and the per-channel temporaries.  Results are
+    rounded like the compiled kernel's ``_float_to_uint8``.
+    """
 
     pixels_view = _prepare_pixel_view(buffer, width, height, bytes_per_line)
     if pixels_view is None:
         return
 
-    b_float = pixels_view[..., 0].astype(np.float32) / 255.0
-    g_float = pixels_view[..., 1].astype(np.float32) / 255.0
-    r_float = pixels_view[..., 2].astype(np.float32) / 255.0
-
-    r_float, g_float, b_float = _np_apply_color_transform(
-        r_float, g_float, b_float,
-        saturation, vibrance, cast,
-        gain_r, gain_g, gain_b
+    # ``Format_ARGB32`` stores pixels as BGRA in memory; reversing the first
+    # three channels yields RGB (and writes back in the same order).
+    rgb_view = pixels_view[..., 2::-1]
+    adjusted = _np_color_transform_rgb8(
+        rgb_view, saturation, vibrance, cast, (gain_r, gain_g, gain_b)
     )
-
-    pixels_view[..., 0] = (b_float * 255.0).astype(np.uint8)
-    pixels_view[..., 1] = (g_float * 255.0).astype(np.uint8)
-    pixels_view[..., 2] = (r_float * 255.0).astype(np.uint8)
+    np.rint(adjusted, out=adjusted)
+    rgb_view[...] = adjusted
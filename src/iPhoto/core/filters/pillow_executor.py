@@ -15,6 +15,7 @@ from .algorithms import _apply_channel_adjustments, _float_to_uint8
 from .utils import _resolve_pixel_buffer
 
 _PILLOW_SUPPORT = load_pillow()
+_IDENTITY_LUT: list[int] = list(range(256))
 
 
 def build_adjustment_lut(
@@ -55,6 +56,15 @@ def apply_adjustments_with_lut(image: QImage, lut: Sequence[int]) -> QImage | No
     if support is None or support.Image is None or support.ImageQt is None:
         return None
 
+    if list(lut) == _IDENTITY_LUT:
+        # Neutral tone settings (e.g. Color or B&W previews) produce the
+        # identity curve.  Pillow's round trip would allocate several full-size
+        # buffers per call just to reproduce the input, so hand back a private
+        # ARGB32 copy for the in-place colour and B&W passes instead.
+        if image.format() != QImage.Format.Format_ARGB32:
+            return image.convertToFormat(QImage.Format.Format_ARGB32)
+        return image.copy()
+
     try:
         width = image.width()
         height = image.height()
@@ -64,14 +74,14 @@ def apply_adjustments_with_lut(image: QImage, lut: Sequence[int]) -> QImage | No
         # to expose a contiguous ``memoryview`` over the QImage data across the
         # various Qt/Python binding permutations.  Reusing it avoids the
         # ``setsize`` AttributeError that PySide raises (and which previously
-        # forced us down the slow fallback path).
-        view, buffer_guard = _resolve_pixel_buffer(image)
-
-        # Pillow is only interested in the raw byte sequence and copies it once
-        # we immediately call ``copy()`` on the resulting image.  Passing the
-        # ``memoryview`` directly therefore avoids an intermediate ``bytes``
-        # allocation while the guard keeps the underlying Qt wrapper alive long
-        # enough for Pillow to finish its own copy.
+        # forced us down the slow fallback path).  The pixels are only read, so
+        # the view comes from ``constBits()`` and never detaches a shared image.
+        view, buffer_guard = _resolve_pixel_buffer(image, writable=False)
+
+        # Pillow is only interested in the raw byte sequence.  ``Image.point``
+        # below writes its result into a fresh image, so the source view only
+        # has to stay valid until then; the guard keeps the underlying Qt
+        # wrapper alive for the duration of the call.
         buffer = view if isinstance(view, memoryview) else memoryview(view)
         guard = buffer_guard
         _ = guard  # Explicitly anchor the guard for the duration of the call.
@@ -83,7 +93,7 @@ def apply_adjustments_with_lut(image: QImage, lut: Sequence[int]) -> QImage | No
             "BGRA",
             bytes_per_line,
             1,
-        ).copy()
+        )
 
         # ``Image.point`` applies per-channel lookup tables in native code.  We
         # reuse the same curve for RGB while preserving the alpha channel via an
@@ -10,7 +10,9 @@ from __future__ import annotations
 from PySide6.QtGui import QImage
 
 
-def _resolve_pixel_buffer(image: QImage) -> tuple[memoryview, object]:
+def _resolve_pixel_buffer(
+    image: QImage, *, writable: bool = True
+) -> tuple[memoryview, object]:
     """Return a writable 1-D :class:`memoryview` over *image*'s pixels.
 
     Qt offers subtly different behaviours across bindings when exposing the
@@ -25,11 +27,15 @@ def _resolve_pixel_buffer(image: QImage) -> tuple[memoryview, object]:
     as long as the view is in scope.  Losing that reference allows the garbage
     collector to reclaim the temporary wrapper, which would corrupt future
     writes when Python keeps using the now-dangling ``memoryview``.
+
+    Pass ``writable=False`` when the caller only reads the pixels.  The view is
+    then taken from ``constBits()``, which unlike ``bits()`` does not force Qt
+    to detach (deep copy) an image whose buffer is shared with other handles.
     """
 
     bytes_per_line = image.bytesPerLine()
     height = image.height()
-    buffer = image.bits()
+    buffer = image.bits() if writable else image.constBits()
     expected_size = bytes_per_line * height
 
     # Preserve a reference to the original object so its lifetime matches the
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable, Sequence
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
 
 from PySide6.QtCore import QObject, QRunnable, Qt, Signal
 from PySide6.QtGui import QImage
@@ -28,17 +29,44 @@ class ThumbnailGeneratorSignals(QObject):
         super().__init__(parent)
 
 
+@dataclass
+class _Strip:
+    """Previews requested for one slider, reported through its own signals."""
+
+    values: list[float]
+    generator: Optional[Callable[[QImage, float], QImage]]
+    batch_generator: Optional[Callable[[QImage, Sequence[float]], Sequence[QImage]]]
+    target_height: int
+    generation_id: int
+    signals: ThumbnailGeneratorSignals
+
+
 class ThumbnailGeneratorWorker(QRunnable):
-    """Generate adjustment previews in a :class:`QThreadPool` worker."""
+    """Generate adjustment previews in a :class:`QThreadPool` worker.
+
+    When *batch_generator* is supplied it receives the scaled base image and
+    every tick value at once and must return one preview per value, which lets
+    vectorised filters evaluate the whole strip in a single call.  Otherwise
+    *generator* is invoked once per value.
+
+    Several sliders fed from the same source image can share one worker: a
+    worker built without a generator has no strip of its own, and each
+    :meth:`add_strip` call returns the signals object that strip reports
+    through.  The source is scaled once per distinct target height.
+
+    :meth:`cancel` stops the worker between ticks once its previews are no
+    longer wanted, e.g. because the slider received a new image.
+    """
 
     def __init__(
         self,
         source_image: QImage,
-        values: Sequence[float],
-        generator: Callable[[QImage, float], QImage],
+        values: Sequence[float] = (),
+        generator: Callable[[QImage, float], QImage] | None = None,
         *,
-        target_height: int,
-        generation_id: int,
+        target_height: int = 1,
+        generation_id: int = 0,
+        batch_generator: Callable[[QImage, Sequence[float]], Sequence[QImage]] | None = None,
     ) -> None:
         super().__init__()
         self.setAutoDelete(True)
@@ -46,49 +74,108 @@ class ThumbnailGeneratorWorker(QRunnable):
         # ``QImage`` implements implicit sharing, therefore copying it here keeps the caller's
         # instance detached even when the worker manipulates the data from another thread.
         self._source_image = QImage(source_image)
-        self._values = list(values)
-        self._generator = generator
-        self._target_height = max(1, int(target_height))
-        self._generation_id = generation_id
+        self._strips: list[_Strip] = []
+        # Plain attribute writes are atomic under the GIL, so the GUI thread can flip
+        # this flag while ``run`` polls it between ticks.
+        self._cancelled = False
         self.signals = ThumbnailGeneratorSignals()
+        if generator is not None or batch_generator is not None:
+            self._strips.append(
+                _Strip(
+                    list(values),
+                    generator,
+                    batch_generator,
+                    max(1, int(target_height)),
+                    generation_id,
+                    self.signals,
+                )
+            )
+
+    def add_strip(
+        self,
+        values: Sequence[float],
+        generator: Callable[[QImage, float], QImage],
+        *,
+        target_height: int,
+        generation_id: int,
+        batch_generator: Callable[[QImage, Sequence[float]], Sequence[QImage]] | None = None,
+    ) -> ThumbnailGeneratorSignals:
+        """Queue another slider's previews on this worker (GUI thread, before starting)."""
+
+        signals = ThumbnailGeneratorSignals()
+        self._strips.append(
+            _Strip(
+                list(values),
+                generator,
+                batch_generator,
+                max(1, int(target_height)),
+                generation_id,
+                signals,
+            )
+        )
+        return signals
+
+    def has_strips(self) -> bool:
+        """Return ``True`` when at least one slider requested previews."""
+
+        return bool(self._strips)
+
+    def cancel(self) -> None:
+        """Ask the worker to stop producing previews as soon as possible."""
+
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Return ``True`` once :meth:`cancel` has been called."""
+
+        return self._cancelled
 
     # ------------------------------------------------------------------
     def run(self) -> None:  # type: ignore[override]
         """Execute the thumbnail generation loop on a background thread."""
 
-        if not self._values:
-            self.signals.finished.emit(self._generation_id)
-            return
-
-        if self._source_image.isNull():
-            self.signals.finished.emit(self._generation_id)
-            return
-
-        try:
-            base = self._source_image.scaledToHeight(
-                self._target_height,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            if base.isNull():
-                base = QImage(self._source_image)
-
-            # Convert once so the worker always feeds a predictable pixel format into the
-            # preview generator, regardless of the source image's colour space.
-            base = base.convertToFormat(QImage.Format.Format_ARGB32)
-
-            for index, value in enumerate(self._values):
-                # Provide a detached copy so filter routines are free to mutate their input.
-                preview_source = QImage(base)
-                result = self._generator(preview_source, float(value))
-                if result.isNull():
+        bases: dict[int, QImage] = {}
+        for strip in self._strips:
+            try:
+                if self._cancelled or not strip.values or self._source_image.isNull():
                     continue
-                converted = result.convertToFormat(QImage.Format.Format_ARGB32)
-                self.signals.thumbnail_ready.emit(index, converted, self._generation_id)
-        except Exception as exc:  # pragma: no cover - defensive logging path
-            LOGGER.exception("Thumbnail generation failed")
-            self.signals.error.emit(self._generation_id, str(exc))
-        finally:
-            self.signals.finished.emit(self._generation_id)
+                base = bases.get(strip.target_height)
+                if base is None:
+                    base = self._scaled_base(strip.target_height)
+                    bases[strip.target_height] = base
+                self._generate(strip, base)
+            except Exception as exc:  # pragma: no cover - defensive logging path
+                LOGGER.exception("Thumbnail generation failed")
+                strip.signals.error.emit(strip.generation_id, str(exc))
+            finally:
+                strip.signals.finished.emit(strip.generation_id)
+
+    def _scaled_base(self, target_height: int) -> QImage:
+        base = self._source_image.scaledToHeight(
+            target_height,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        if base.isNull():
+            base = QImage(self._source_image)
+
+        # Convert once so the worker always feeds a predictable pixel format into the
+        # preview generator, regardless of the source image's colour space.
+        return base.convertToFormat(QImage.Format.Format_ARGB32)
+
+    def _generate(self, strip: _Strip, base: QImage) -> None:
+        if strip.batch_generator is not None:
+            results = strip.batch_generator(QImage(base), [float(v) for v in strip.values])
+        else:
+            # Provide a detached copy so filter routines are free to mutate their input.
+            results = (strip.generator(QImage(base), float(value)) for value in strip.values)
+
+        for index, result in enumerate(results):
+            if self._cancelled:
+                break
+            if result.isNull():
+                continue
+            converted = result.convertToFormat(QImage.Format.Format_ARGB32)
+            strip.signals.thumbnail_ready.emit(index, converted, strip.generation_id)
 
 
 __all__ = ["ThumbnailGeneratorSignals", "ThumbnailGeneratorWorker"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import OrderedDict, deque
 from enum import IntEnum
+from functools import lru_cache
 import hashlib
 import logging
 import os
@@ -73,6 +74,19 @@ def stat_mtime_ns(stat_result: os.stat_result) -> int:
     return int(stamp)
 
 
+@lru_cache(maxsize=4096)
+def _path_digest(abs_path: Path) -> str:
+    """Return the filename digest for *abs_path*, memoised per path.
+
+    Resolving the path costs a syscall per component and the digest is
+    recomputed for every request of the same asset, so both are cached.
+    BLAKE2b is kept (rather than a faster non-cryptographic hash) so that
+    thumbnails already written to disk keep their filenames.
+    """
+    path_str = str(abs_path.resolve())
+    return hashlib.blake2b(path_str.encode("utf-8"), digest_size=20).hexdigest()
+
+
 def generate_cache_path(library_root: Path, abs_path: Path, size: QSize, stamp: int) -> Path:
     """
     Generate the file path for a cached thumbnail image.
@@ -87,8 +101,7 @@ def generate_cache_path(library_root: Path, abs_path: Path, size: QSize, stamp:
         Path: The path to the cache file for the thumbnail image.
     """
     # Use absolute path for global uniqueness
-    path_str = str(abs_path.resolve())
-    digest = hashlib.blake2b(path_str.encode("utf-8"), digest_size=20).hexdigest()
+    digest = _path_digest(abs_path)
     filename = f"{digest}_{stamp}_{size.width()}x{size.height()}.png"
     return library_root / WORK_DIR_NAME / "thumbs" / filename
 
@@ -280,7 +293,11 @@ class ThumbnailJob(QRunnable):
         return None
 
     def _render_image(self) -> Optional[QImage]:  # pragma: no cover - worker helper
-        image = image_loader.load_qimage(self._abs_path, self._size)
+        # Decode straight to the size that covers the square canvas so that
+        # _composite_canvas only crops instead of upscaling a fitted image.
+        image = image_loader.load_qimage(
+            self._abs_path, self._size, Qt.AspectRatioMode.KeepAspectRatioByExpanding
+        )
         if image is None:
             return None
         raw_adjustments = sidecar.load_adjustments(self._abs_path)
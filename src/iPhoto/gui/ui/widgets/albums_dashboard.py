@@ -3,15 +3,21 @@
 from __future__ import annotations
 from collections import deque
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 from PySide6.QtCore import (
+    QEvent,
+    QMutex,
+    QMutexLocker,
     QObject,
     QPoint,
+    QRect,
+    QRectF,
     QRunnable,
     QSize,
     Qt,
     QThreadPool,
+    QTimer,
     Signal,
 )
 from PySide6.QtGui import (
@@ -23,24 +29,28 @@ from PySide6.QtGui import (
     QPainter,
     QPainterPath,
     QPixmap,
+    QPixmapCache,
     QRadialGradient,
 )
 from PySide6.QtWidgets import (
     QFrame,
-    QGraphicsDropShadowEffect,
+    QGraphicsBlurEffect,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
     QHBoxLayout,
     QLabel,
+    QLayoutItem,
     QScrollArea,
+    QSizePolicy,
+    QSpacerItem,
     QVBoxLayout,
     QWidget,
 )
 
-from ....utils.pathutils import ensure_work_dir
 from ....cache.index_store import IndexStore
-from ....config import WORK_DIR_NAME
 from ....media_classifier import get_media_type, MediaType
 from ....models.album import Album
-from ..tasks.thumbnail_loader import ThumbnailJob, generate_cache_path, stat_mtime_ns
+from ..tasks.thumbnail_loader import ThumbnailJob, stat_mtime_ns
 from .flow_layout import FlowLayout
 from ..icon import load_icon
 
@@ -56,13 +66,45 @@ class RoundedImageView(QWidget):
         super().__init__(parent)
         self.setFixedSize(80, 80)
         self._pixmap: QPixmap | None = None
+        self._scaled: QPixmap | None = None
         self._placeholder: QPixmap | None = None
         self._bg_color = QColor("#B0BEC5")
 
     def setPixmap(self, pixmap: QPixmap) -> None:
         self._pixmap = pixmap
+        self._scaled = None
         self.update()
 
+    def resizeEvent(self, event) -> None:
+        self._scaled = None
+        super().resizeEvent(event)
+
+    def _scaled_pixmap(self) -> QPixmap:
+        """Return the cover scaled to fill the widget, computing it at most once."""
+
+        assert self._pixmap is not None
+        if self._scaled is not None:
+            return self._scaled
+        target = self.size()
+        source = self._pixmap
+        if source.size() == target:
+            self._scaled = source
+            return source
+        # Large downscales: shrink cheaply to twice the target first so the
+        # smooth (bilinear) pass only touches a small image.
+        if min(source.width(), source.height()) > 2 * max(target.width(), target.height()):
+            source = source.scaled(
+                target * 2,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.FastTransformation,
+            )
+        self._scaled = source.scaled(
+            target,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        return self._scaled
+
     def setPlaceholder(self, pixmap: QPixmap) -> None:
         self._placeholder = pixmap
         self.update()
@@ -90,11 +132,7 @@ class RoundedImageView(QWidget):
 
         if self._pixmap and not self._pixmap.isNull():
             # Scale cover to fill
-            scaled = self._pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+            scaled = self._scaled_pixmap()
             x = (self.width() - scaled.width()) // 2
             y = (self.height() - scaled.height()) // 2
             painter.drawPixmap(x, y, scaled)
@@ -108,11 +146,129 @@ class RoundedImageView(QWidget):
                 painter.drawPixmap(px, py, self._placeholder)
 
 
+# Visible card body and the transparent margins around it that hold the shadow.
+# Vertical margins are asymmetric because the shadow is offset downwards.
+CARD_BODY_SIZE = QSize(260, 80)
+CARD_SHADOW_BLUR = 18
+CARD_SHADOW_OFFSET_Y = 4
+CARD_MARGIN_X = 10
+CARD_MARGIN_TOP = 6
+CARD_MARGIN_BOTTOM = 14
+
+
+def _render_card_shadow() -> QPixmap:
+    """Pre-render the blurred drop shadow shared by every :class:`AlbumCard`."""
+
+    width = CARD_BODY_SIZE.width() + 2 * CARD_MARGIN_X
+    height = CARD_BODY_SIZE.height() + CARD_MARGIN_TOP + CARD_MARGIN_BOTTOM
+
+    shape = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    shape.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    path = QPainterPath()
+    body = QRectF(
+        CARD_MARGIN_X,
+        CARD_MARGIN_TOP + CARD_SHADOW_OFFSET_Y,
+        CARD_BODY_SIZE.width(),
+        CARD_BODY_SIZE.height(),
+    )
+    path.addRoundedRect(body, 12, 12)
+    painter.fillPath(path, QColor(0, 0, 0, 25))
+    painter.end()
+
+    # Blur through a throwaway scene so the result matches QGraphicsDropShadowEffect.
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+    blur = QGraphicsBlurEffect()
+    blur.setBlurRadius(CARD_SHADOW_BLUR)
+    item.setGraphicsEffect(blur)
+    scene.addItem(item)
+
+    result = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+    result.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(result)
+    scene.render(painter, QRectF(0, 0, width, height), QRectF(0, 0, width, height))
+    painter.end()
+    return QPixmap.fromImage(result)
+
+
 class AlbumCard(QFrame):
-    """Card widget representing a single album."""
+    """Card widget representing a single album.
+
+    The drop shadow is painted from a pixmap shared by all cards instead of a
+    per-card ``QGraphicsDropShadowEffect``, which would force every card to be
+    composited offscreen with its own blur cache.  The widget therefore
+    reserves transparent margins around the visible body for the shadow.
+    """
 
     clicked = Signal(Path)
 
+    # Shared rules for every card, installed once on the dashboard's scroll
+    # content so Qt parses them a single time instead of once per card.
+    # Note: Background color is handled in paintEvent for the light source effect
+    STYLESHEET = """
+        /* Parent container: rounded corners handled in paintEvent */
+        #AlbumCard {
+            border-radius: 12px;
+        }
+
+        /* Right text part: transparent */
+        #TextPart {
+            background-color: transparent;
+        }
+
+        #AlbumTitle {
+            color: #1d1d1f;
+            font-size: 14px;
+            font-weight: 600;
+            background: transparent;
+        }
+
+        #AlbumCount {
+            color: #86868b;
+            font-size: 13px;
+            background: transparent;
+        }
+    """
+
+    # Outer widget size including the shadow margins.
+    SIZE = QSize(
+        CARD_BODY_SIZE.width() + 2 * CARD_MARGIN_X,
+        CARD_BODY_SIZE.height() + CARD_MARGIN_TOP + CARD_MARGIN_BOTTOM,
+    )
+    # Width available to the title: body minus the 80px cover and text margins.
+    TITLE_MAX_WIDTH = CARD_BODY_SIZE.width() - 80 - 15 - 10
+
+    _shadow: QPixmap | None = None
+    _placeholder: QPixmap | None = None
+    _title_metrics: QFontMetrics | None = None
+
+    @classmethod
+    def _title_font_metrics(cls) -> QFontMetrics:
+        """Metrics for the #AlbumTitle font, shared by every card."""
+
+        if cls._title_metrics is None:
+            font = QFont()
+            font.setPixelSize(14)
+            font.setWeight(QFont.Weight.DemiBold)
+            cls._title_metrics = QFontMetrics(font)
+        return cls._title_metrics
+
+    @classmethod
+    def _shadow_pixmap(cls) -> QPixmap:
+        if cls._shadow is None:
+            cls._shadow = _render_card_shadow()
+        return cls._shadow
+
+    @classmethod
+    def _placeholder_pixmap(cls) -> QPixmap:
+        """Rasterise the placeholder icon once and share it between cards."""
+
+        if cls._placeholder is None:
+            cls._placeholder = load_icon("photo.on.rectangle", color="#FFFFFF").pixmap(32, 32)
+        return cls._placeholder
+
     def __init__(
         self,
         path: Path,
@@ -125,23 +281,22 @@ class AlbumCard(QFrame):
         self.setMouseTracking(True)
         self._cursor_pos: QPoint | None = None
 
-        # 1. Container dimensions
-        self.setFixedSize(260, 80)
+        # 1. Container dimensions (body plus shadow margins)
+        self._body_rect = QRect(QPoint(CARD_MARGIN_X, CARD_MARGIN_TOP), CARD_BODY_SIZE)
+        self.setFixedSize(self.SIZE)
         self.setObjectName("AlbumCard")
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
         # 2. Layout
         self.layout = QHBoxLayout(self)  # type: ignore[assignment]
-        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.layout.setContentsMargins(CARD_MARGIN_X, CARD_MARGIN_TOP, CARD_MARGIN_X, CARD_MARGIN_BOTTOM)
         self.layout.setSpacing(0)
 
         # 3. Left side: Image
         self.image_view = RoundedImageView(self)
         self.image_view.setObjectName("ImagePart")
         # Placeholder icon or text until image loads
-        self.image_view.setPlaceholder(
-            load_icon("photo.on.rectangle", color="#FFFFFF").pixmap(32, 32)
-        )
+        self.image_view.setPlaceholder(self._placeholder_pixmap())
 
         # 4. Right side: Metadata
         self.text_container = QWidget()
@@ -155,16 +310,12 @@ class AlbumCard(QFrame):
 
         # Title
         self.title_label = QLabel()
-        self.title_label.setStyleSheet(
-            "color: #1d1d1f; font-size: 14px; font-weight: 600; background: transparent;"
-        )
+        self.title_label.setObjectName("AlbumTitle")
         self.set_title(title)
 
         # Count
         self.count_label = QLabel(str(count))
-        self.count_label.setStyleSheet(
-            "color: #86868b; font-size: 13px; background: transparent;"
-        )
+        self.count_label.setObjectName("AlbumCount")
 
         self.text_layout.addWidget(self.title_label)
         self.text_layout.addWidget(self.count_label)
@@ -172,23 +323,6 @@ class AlbumCard(QFrame):
         self.layout.addWidget(self.image_view)
         self.layout.addWidget(self.text_container)
 
-        # 5. Stylesheet
-        # Note: Background color is handled in paintEvent for the light source effect
-        self.setStyleSheet("""
-            /* Parent container: rounded corners handled in paintEvent */
-            #AlbumCard {
-                border-radius: 12px;
-            }
-
-            /* Right text part: transparent */
-            #TextPart {
-                background-color: transparent;
-            }
-        """)
-
-        # 6. Shadow
-        self.add_shadow()
-
     def mouseMoveEvent(self, event) -> None:
         self._cursor_pos = event.position().toPoint()
         self.update()
@@ -200,16 +334,19 @@ class AlbumCard(QFrame):
         super().leaveEvent(event)
 
     def mousePressEvent(self, event) -> None:
-        if event.button() == Qt.MouseButton.LeftButton:
+        if event.button() == Qt.MouseButton.LeftButton and self._body_rect.contains(
+            event.position().toPoint()
+        ):
             self.clicked.emit(self.path)
         super().mousePressEvent(event)
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._shadow_pixmap())
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         path = QPainterPath()
-        path.addRoundedRect(self.rect(), 12, 12)
+        path.addRoundedRect(QRectF(self._body_rect), 12, 12)
 
         if self._cursor_pos:
             # Highlight effect: Radial gradient from cursor
@@ -222,33 +359,78 @@ class AlbumCard(QFrame):
             # Default state
             painter.fillPath(path, QColor("#F5F5F7"))
 
-    def add_shadow(self) -> None:
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(18)
-        shadow.setXOffset(0)
-        shadow.setYOffset(4)
-        shadow.setColor(QColor(0, 0, 0, 25))
-        self.setGraphicsEffect(shadow)
+    @property
+    def title(self) -> str:
+        """The full, un-elided album title."""
+        return self._title
 
     def set_title(self, title: str) -> None:
-        """Set the title with truncation if it exceeds 25 characters."""
-        if len(title) > 25:
-            truncated = title[:25] + "..."
-            self.title_label.setText(truncated)
-            self.title_label.setToolTip(title)
-        else:
-            self.title_label.setText(title)
-            self.title_label.setToolTip("")
+        """Set the title, eliding it to the pixel width available on the card."""
+        self._title = title
+        elided = self._title_font_metrics().elidedText(
+            title, Qt.TextElideMode.ElideRight, self.TITLE_MAX_WIDTH
+        )
+        self.title_label.setText(elided)
+        self.title_label.setToolTip(title if elided != title else "")
 
     def set_cover_image(self, pixmap: QPixmap) -> None:
         """Update the cover image."""
         self.image_view.setPixmap(pixmap)
 
 
+AlbumResult = tuple["AlbumNode", int, Optional[Path], Path, int]
+
+
 class DashboardLoaderSignals(QObject):
-    """Signals for the dashboard data loader."""
+    """Signals for the dashboard data loader.
+
+    Workers do not emit per album. They :meth:`post` their result into a
+    mutex-guarded queue that a GUI-thread timer drains every
+    ``BATCH_INTERVAL_MS``, delivering everything that arrived in that window
+    through a single :attr:`albumsReady` emission.  Because :meth:`flush`
+    always runs on the GUI thread, receivers can connect with
+    ``Qt.DirectConnection`` and no per-album arguments are marshalled across
+    threads.
+    """
+
+    BATCH_INTERVAL_MS = 16
+
+    # list of (node, count, cover_path, album_root, generation)
+    albumsReady = Signal(list)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._pending: deque[AlbumResult] = deque()
+        self._outstanding = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.BATCH_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def expect(self, count: int) -> None:
+        """Register *count* dispatched workers and start draining (GUI thread)."""
+
+        self._outstanding += count
+        if self._outstanding > 0 and not self._timer.isActive():
+            self._timer.start()
+
+    def post(self, result: AlbumResult) -> None:
+        """Queue a worker result; safe to call from any thread."""
+
+        with QMutexLocker(self._mutex):
+            self._pending.append(result)
+
+    def flush(self) -> None:
+        """Emit all queued results at once and stop once every worker reported."""
 
-    albumReady = Signal(object, int, object, object, int)  # node, count, cover_path, album_root, generation
+        with QMutexLocker(self._mutex):
+            batch = list(self._pending)
+            self._pending.clear()
+        self._outstanding = max(0, self._outstanding - len(batch))
+        if self._outstanding == 0:
+            self._timer.stop()
+        if batch:
+            self.albumsReady.emit(batch)
 
 
 class AlbumDataWorker(QRunnable):
@@ -336,23 +518,57 @@ class AlbumDataWorker(QRunnable):
             if candidate.exists():
                 cover_path = candidate
 
-        self.signals.albumReady.emit(self.node, count, cover_path, self.node.path, self.generation)
+        self.signals.post((self.node, count, cover_path, self.node.path, self.generation))
+
+
+# Minimum ``QPixmapCache`` budget (in KiB) so a dashboard's worth of 512x512 covers
+# stays resident across refreshes instead of being re-decoded from disk.
+DASHBOARD_PIXMAP_CACHE_KB = 64 * 1024
 
 
 class DashboardThumbnailLoader(QObject):
-    """Simplified thumbnail loader for dashboard cards."""
+    """Simplified thumbnail loader for dashboard cards.
+
+    Requests never touch the filesystem on the GUI thread: stat calls, cache
+    validation and PNG decoding all happen inside :class:`ThumbnailJob`, which
+    delivers a ``QImage`` that is converted to a ``QPixmap`` in
+    :meth:`_handle_result`.  Covers already held in ``QPixmapCache`` are shown
+    immediately while the job re-validates their stamp in the background.
+
+    When *on_ready* is given, finished covers are handed to it directly from
+    the GUI-thread result slot instead of being re-emitted through
+    :attr:`thumbnailReady`, saving one signal dispatch per cover.
+    """
 
     thumbnailReady = Signal(Path, QPixmap)  # album_root, pixmap
-    _delivered = Signal(tuple, QImage, str)  # key (album_root_str, rel, width, height, stamp), image, rel
+    # key (album_root_str, rel, width, height, stamp), worker-decoded QImage or None, rel
+    _delivered = Signal(object, object, str)
+    _validation_success = Signal(object)  # key (album_root_str, rel, width, height, stamp)
 
-    def __init__(self, parent: QObject | None = None, library_root: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        library_root: Optional[Path] = None,
+        on_ready: Callable[[Path, QPixmap], None] | None = None,
+    ) -> None:
         super().__init__(parent)
         self._pool = QThreadPool.globalInstance()
+        self._on_ready = on_ready
         self._delivered.connect(self._handle_result)
+        self._validation_success.connect(self._handle_validation_success)
         # Map base keys (album_root_str, rel, width, height) to queued album root Paths
         self._key_to_root: dict[tuple[str, str, int, int], deque[Path]] = {}
         self._resolved_roots: dict[Path, str] = {}
+        # Stamp of the pixmap last stored in QPixmapCache for each base key
+        self._memory_stamps: dict[tuple[str, str, int, int], int] = {}
         self._library_root = library_root
+        if QPixmapCache.cacheLimit() < DASHBOARD_PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(DASHBOARD_PIXMAP_CACHE_KB)
+
+    @staticmethod
+    def _memory_key(base_key: tuple[str, str, int, int], stamp: int) -> str:
+        root_str, rel, width, height = base_key
+        return f"dashboard|{root_str}|{rel}|{stamp}|{width}x{height}"
 
     def request_with_absolute_key(self, album_root: Path, image_path: Path, size: QSize) -> None:
         # To avoid rel collision across albums, we use the absolute path string as the 'rel' identifier
@@ -362,85 +578,85 @@ class DashboardThumbnailLoader(QObject):
         # Use library root if available, otherwise fallback to album root
         effective_library_root = self._library_root if self._library_root else album_root
 
-        try:
-            work_dir = ensure_work_dir(effective_library_root, WORK_DIR_NAME)
-            thumbs_dir = work_dir / "thumbs"
-            thumbs_dir.mkdir(parents=True, exist_ok=True)
-        except OSError:
-            return
-
-        try:
-            stat = image_path.stat()
-        except OSError:
-            return
-        stamp = stat_mtime_ns(stat)
-
-        # Use standardized generator with absolute path
-        cache_path = generate_cache_path(effective_library_root, image_path, size, stamp)
+        job_root_str = self._album_root_str(album_root)
+        base_key: tuple[str, str, int, int] = (job_root_str, unique_rel, size.width(), size.height())
 
-        if cache_path.exists():
-            pixmap = QPixmap(str(cache_path))
-            if not pixmap.isNull():
-                self.thumbnailReady.emit(album_root, pixmap)
-                return
+        # Serve the in-memory copy straight away; the job below only re-validates its stamp.
+        known_stamp = self._memory_stamps.get(base_key)
+        if known_stamp is not None:
+            pixmap = QPixmapCache.find(self._memory_key(base_key, known_stamp))
+            if pixmap is not None and not pixmap.isNull():
+                self._deliver(album_root, pixmap)
+            else:
+                self._memory_stamps.pop(base_key, None)
+                known_stamp = None
 
         # Store mapping
-        job_root_str = self._album_root_str(album_root)
-        base_key: tuple[str, str, int, int] = (job_root_str, unique_rel, size.width(), size.height())
         self._key_to_root.setdefault(base_key, deque()).append(album_root)
 
         media_type = get_media_type(image_path)
         is_image = media_type == MediaType.IMAGE
         is_video = media_type == MediaType.VIDEO
 
-        # Determine cache_rel based on library root if possible to match main loader behavior,
-        # but DashboardThumbnailLoader logic uses unique_rel as the key.
-        # We pass effective_library_root as library_root to ThumbnailJob.
-
+        # The job stats the source, reuses (or rewrites) the on-disk PNG cache under
+        # effective_library_root and creates the thumbs directory when writing.
+        # cache_rel is not needed because generate_cache_path hashes the absolute path.
         job = ThumbnailJob(
             self,  # type: ignore
             unique_rel,  # Pass absolute path string as rel to ensure uniqueness
             image_path,
             size,
-            None,  # Pass None as known_stamp to force regeneration if missing
+            known_stamp,  # None forces a cache lookup/regeneration
             album_root,
             effective_library_root,
             is_image=is_image,
             is_video=is_video,
             still_image_time=None,
             duration=None,
-            cache_rel=None, # Not used when hashing absolute path in new logic?
-            # Wait, ThumbnailJob still uses _cache_rel if provided?
-            # In new logic: rel_for_path = self._cache_rel if self._cache_rel is not None else self._rel
-            # Then: generate_cache_path(self._library_root, self._abs_path, ...)
-            # generate_cache_path IGNORES rel/cache_rel now! It uses abs_path.
-            # So cache_rel is irrelevant for path generation, but might be used for logging?
-            # The job passes it. Let's pass None or keep it consistent?
-            # The old code calculated real_rel.
-            # Let's pass None as it's not needed for the path generation anymore.
+            cache_rel=None,
         )
         self._pool.start(job)
 
+    def _take_root(self, base_key: tuple[str, str, int, int]) -> Path | None:
+        roots = self._key_to_root.get(base_key)
+        if not roots:
+            return None
+        album_root = roots.popleft()
+        if not roots:
+            self._key_to_root.pop(base_key, None)
+        return album_root
+
     def _handle_result(
         self, full_key: tuple[str, str, int, int, int], image: Optional[QImage], rel: str
     ) -> None:
         # Use the base key (without timestamp) by slicing off the stamp so sidecar or filesystem
         # timestamp changes do not prevent delivered thumbnails from matching pending requests.
         base_key = full_key[:-1]
-        roots = self._key_to_root.get(base_key)
-        if not roots:
+        album_root = self._take_root(base_key)
+        if album_root is None:
             return
-        album_root = roots.popleft()
-        if not roots:
-            self._key_to_root.pop(base_key, None)
 
-        if image is None:
+        if image is None or image.isNull():
             return
 
+        # QPixmap must be created on the GUI thread; the decode already happened in the job.
         pixmap = QPixmap.fromImage(image)
         if not pixmap.isNull():
+            stamp = full_key[-1]
+            QPixmapCache.insert(self._memory_key(base_key, stamp), pixmap)
+            self._memory_stamps[base_key] = stamp
+            self._deliver(album_root, pixmap)
+
+    def _deliver(self, album_root: Path, pixmap: QPixmap) -> None:
+        if self._on_ready is not None:
+            self._on_ready(album_root, pixmap)
+        else:
             self.thumbnailReady.emit(album_root, pixmap)
 
+    def _handle_validation_success(self, full_key: tuple[str, str, int, int, int]) -> None:
+        # The pixmap served from memory is still current; nothing else to deliver.
+        self._take_root(full_key[:-1])
+
     def _album_root_str(self, album_root: Path) -> str:
         cached = self._resolved_roots.get(album_root)
         if cached is not None:
@@ -455,7 +671,14 @@ class DashboardThumbnailLoader(QObject):
 
 
 class AlbumsDashboard(QWidget):
-    """Main view for browsing all user albums."""
+    """Main view for browsing all user albums.
+
+    Cards are created lazily: every album owns a slot in the flow layout, but
+    slots start as fixed-size spacers and are only swapped for an
+    :class:`AlbumCard` (and have their metadata loaded) once they come within
+    one viewport height of the visible area.  Startup therefore scales with
+    the viewport rather than with the size of the library.
+    """
 
     albumSelected = Signal(Path)
 
@@ -463,19 +686,33 @@ class AlbumsDashboard(QWidget):
         super().__init__(parent)
         self._library = library
         self._cards: dict[Path, AlbumCard] = {}
+        # Cache of album metadata keyed by album path. Each entry stores the
+        # directory ``st_mtime_ns`` of the album and its sub-albums observed
+        # when the worker was dispatched together with the resolved
+        # ``(count, cover_path)`` so unchanged albums skip the worker (and its
+        # database/disk IO) on subsequent refreshes. Counts come from the
+        # index, so entries touched by a finished scan are dropped as well.
+        self._meta_cache: dict[Path, tuple[tuple[int, ...], int, Path | None]] = {}
+        self._pending_stamps: dict[Path, tuple[int, ...]] = {}
+        # Album slots that have not been materialised into cards yet
+        self._placeholders: dict[Path, tuple[AlbumNode, QSpacerItem]] = {}
         # Track refresh generation to prevent race conditions
         # Python integers can grow arbitrarily large, so overflow is not a concern
         self._current_generation = 0
 
         # Setup loader
-        self._loader_signals = DashboardLoaderSignals()
-        self._loader_signals.albumReady.connect(self._on_album_data_ready)
+        self._loader_signals = DashboardLoaderSignals(self)
+        self._loader_signals.albumsReady.connect(
+            self._on_album_data_batch_ready, Qt.ConnectionType.DirectConnection
+        )
 
-        self._thumb_loader = DashboardThumbnailLoader(self, library_root=self._library.root())
-        self._thumb_loader.thumbnailReady.connect(self._on_thumbnail_ready)
+        self._thumb_loader = DashboardThumbnailLoader(
+            self, library_root=self._library.root(), on_ready=self._on_thumbnail_ready
+        )
 
         self._init_ui()
         self._library.treeUpdated.connect(self.refresh)
+        self._library.scanFinished.connect(self._on_scan_finished)
         self.refresh()
 
     def _init_ui(self) -> None:
@@ -499,10 +736,18 @@ class AlbumsDashboard(QWidget):
         self.scroll_area.setStyleSheet("background: transparent;")
 
         self.scroll_content = QWidget()
-        self.scroll_content.setStyleSheet("background: transparent;")
-        self.flow_layout = FlowLayout(self.scroll_content, margin=0, h_spacing=20, v_spacing=20)
+        self.scroll_content.setStyleSheet("* { background: transparent; }" + AlbumCard.STYLESHEET)
+        # Cards carry their own shadow margins, which already provide the 20px gutters.
+        self.flow_layout = FlowLayout(
+            self.scroll_content,
+            margin=0,
+            h_spacing=20 - 2 * CARD_MARGIN_X,
+            v_spacing=20 - CARD_MARGIN_TOP - CARD_MARGIN_BOTTOM,
+        )
 
         self.scroll_area.setWidget(self.scroll_content)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._materialize_visible)
+        self.scroll_area.viewport().installEventFilter(self)
         self.main_layout.addWidget(self.scroll_area)
 
         # Empty state placeholder
@@ -513,17 +758,48 @@ class AlbumsDashboard(QWidget):
         self.main_layout.addWidget(self.empty_label)
 
     def refresh(self) -> None:
+        """Synchronise the cards with the library's album list.
+
+        Cards are diffed against the current albums instead of being rebuilt:
+        widgets for albums that disappeared are deleted, new albums get a
+        fresh card, and existing cards are kept (with their cover) and only
+        re-queried when their directory changed since the last load.
+        """
+
+        # Suspend painting while cards are inserted/removed so the bulk update
+        # results in a single layout pass and repaint.
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            self._sync_cards()
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
+    def _sync_cards(self) -> None:
         # Increment generation to invalidate pending workers from previous refresh
         self._current_generation += 1
-        # Clear existing
+        self._pending_stamps.clear()
+        self._placeholders.clear()
+
+        albums = self._library.list_albums()
+
+        # Drop cache entries for albums that no longer exist in the tree.
+        listed = {album.path for album in albums}
+        for stale in [path for path in self._meta_cache if path not in listed]:
+            del self._meta_cache[stale]
+
+        # Detach every layout item so survivors can be re-added in library order.
+        # Spacer slots carry no widget and are simply recreated below.
+        items: dict[QWidget, QLayoutItem] = {}
         while self.flow_layout.count():
             item = self.flow_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        self._cards.clear()
+            widget = item.widget()
+            if widget is not None:
+                items[widget] = item
 
-        albums = self._library.list_albums()
+        for path in [path for path in self._cards if path not in listed]:
+            card = self._cards.pop(path)
+            items.pop(card, None)
+            card.deleteLater()
 
         if not albums:
             self.scroll_area.hide()
@@ -533,20 +809,121 @@ class AlbumsDashboard(QWidget):
         self.empty_label.hide()
         self.scroll_area.show()
 
-        pool = QThreadPool.globalInstance()
-        current_gen = self._current_generation
-        library_root = self._library.root()
-
+        dispatched = 0
         for album in albums:
+            card = self._cards.get(album.path)
+            if card is None:
+                spacer = QSpacerItem(
+                    AlbumCard.SIZE.width(),
+                    AlbumCard.SIZE.height(),
+                    QSizePolicy.Policy.Fixed,
+                    QSizePolicy.Policy.Fixed,
+                )
+                self.flow_layout.addItem(spacer)
+                self._placeholders[album.path] = (album, spacer)
+                continue
+
+            card.set_title(album.title)
+            item = items.pop(card, None)
+            if item is not None:
+                self.flow_layout.addItem(item)
+            else:
+                self.flow_layout.addWidget(card)
+            dispatched += self._load_album_data(album, is_new=False)
+
+        self.flow_layout.invalidate()
+
+        # Materialise the first screenful right away; the rest follows once the
+        # layout has assigned geometry to the spacer slots.
+        first_screen = [path for path in self._placeholders][: self._estimate_visible_slots()]
+        dispatched += self._materialize(first_screen)
+        self._loader_signals.expect(dispatched)
+        if self._placeholders:
+            QTimer.singleShot(0, self._materialize_visible)
+
+    def _estimate_visible_slots(self) -> int:
+        """Number of card slots that fit in the viewport (plus one extra row)."""
+
+        viewport = self.scroll_area.viewport().size()
+        slot_w = AlbumCard.SIZE.width() + self.flow_layout.horizontalSpacing()
+        slot_h = AlbumCard.SIZE.height() + self.flow_layout.verticalSpacing()
+        columns = max(1, (viewport.width() + self.flow_layout.horizontalSpacing()) // slot_w)
+        rows = viewport.height() // slot_h + 2
+        return columns * rows
+
+    def _materialize(self, paths: list[Path]) -> int:
+        """Replace the spacer slots for *paths* with cards; return workers started."""
+
+        dispatched = 0
+        for path in paths:
+            entry = self._placeholders.pop(path, None)
+            if entry is None:
+                continue
+            album, spacer = entry
+            index = self.flow_layout.indexOf(spacer)
             # Create card with "0" count first
             card = AlbumCard(album.path, album.title, 0, self.scroll_content)
             card.clicked.connect(self.albumSelected)
-            self.flow_layout.addWidget(card)
             self._cards[album.path] = card
+            if index >= 0:
+                self.flow_layout.replaceAt(index, card)
+            else:
+                self.flow_layout.addWidget(card)
+            card.show()
+            dispatched += self._load_album_data(album, is_new=True)
+        return dispatched
+
+    def _materialize_visible(self) -> None:
+        """Create cards for spacer slots within one viewport of the visible area."""
+
+        if not self._placeholders:
+            return
+        viewport = self.scroll_area.viewport()
+        top = self.scroll_area.verticalScrollBar().value()
+        height = viewport.height()
+        window = QRect(0, top - height, max(viewport.width(), 1), 3 * height)
+        paths = [
+            path
+            for path, (_album, spacer) in self._placeholders.items()
+            if spacer.geometry().isValid() and spacer.geometry().intersects(window)
+        ]
+        if paths:
+            self._loader_signals.expect(self._materialize(paths))
+
+    def _load_album_data(self, album: AlbumNode, *, is_new: bool) -> int:
+        """Populate a card from the metadata cache or dispatch a worker.
+
+        Returns ``1`` when a worker was started, ``0`` otherwise.
+        """
+
+        stamp = self._album_stamp(album)
+        cached = self._meta_cache.get(album.path)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            # Existing cards already show the cached values.
+            if is_new:
+                self._on_album_data_ready(
+                    album, cached[1], cached[2], album.path, self._current_generation
+                )
+            return 0
+        if stamp is not None:
+            self._pending_stamps[album.path] = stamp
+
+        # Fetch data with current generation, using library root for global DB
+        worker = AlbumDataWorker(
+            album, self._loader_signals, self._current_generation, library_root=self._library.root()
+        )
+        QThreadPool.globalInstance().start(worker)
+        return 1
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+        if event.type() in (QEvent.Type.Resize, QEvent.Type.Show) and self._placeholders:
+            # Geometry is only updated once the layout runs, so defer the check.
+            QTimer.singleShot(0, self._materialize_visible)
+        return super().eventFilter(watched, event)
 
-            # Fetch data with current generation, using library root for global DB
-            worker = AlbumDataWorker(album, self._loader_signals, current_gen, library_root=library_root)
-            pool.start(worker)
+    def _on_album_data_batch_ready(self, batch: list[AlbumResult]) -> None:
+        for node, count, cover_path, root, generation in batch:
+            self._on_album_data_ready(node, count, cover_path, root, generation)
 
     def _on_album_data_ready(
         self, node: AlbumNode, count: int, cover_path: Path | None, root: Path, generation: int
@@ -554,6 +931,9 @@ class AlbumsDashboard(QWidget):
         # Ignore results from outdated refresh operations
         if generation != self._current_generation:
             return
+        stamp = self._pending_stamps.pop(root, None)
+        if stamp is not None:
+            self._meta_cache[root] = (stamp, count, cover_path)
         card = self._cards.get(root)
         if not card:
             return
@@ -561,10 +941,46 @@ class AlbumsDashboard(QWidget):
         # Update count
         card.count_label.setText(str(count))
 
-        # Load cover
-        if cover_path:
+        # Load cover (or fall back to the placeholder if the album lost its cover)
+        if cover_path is None:
+            card.set_cover_image(QPixmap())
+        else:
             self._thumb_loader.request_with_absolute_key(root, cover_path, QSize(512, 512))
 
+    def _album_stamp(self, album: AlbumNode) -> tuple[int, ...] | None:
+        """Return the modification stamp used to validate cached metadata.
+
+        Adding, removing or atomically rewriting files (including the album
+        manifest) updates the directory mtime, so it doubles as a cheap change
+        marker. Counts include sub-albums, so their directories contribute to
+        the stamp too. ``None`` is returned when a directory cannot be
+        inspected, which forces the worker to run.
+        """
+
+        paths = [album.path, *(child.path for child in self._library.list_children(album))]
+        try:
+            return tuple(stat_mtime_ns(path.stat()) for path in paths)
+        except OSError:
+            return None
+
+    def _on_scan_finished(self, root: Path, _success: bool) -> None:
+        """Drop cached metadata for albums whose index rows a scan may have changed.
+
+        A scan updates the index without necessarily touching any directory,
+        so the affected albums (the scanned folder, the albums containing it
+        and those inside it) are re-queried.
+        """
+
+        def affected(path: Path) -> bool:
+            return path == root or path in root.parents or root in path.parents
+
+        stale = [path for path in (*self._meta_cache, *self._pending_stamps) if affected(path)]
+        if not stale:
+            return
+        for path in stale:
+            self._meta_cache.pop(path, None)
+        self.refresh()
+
     def _on_thumbnail_ready(self, album_root: Path, pixmap: QPixmap) -> None:
         card = self._cards.get(album_root)
         if card:
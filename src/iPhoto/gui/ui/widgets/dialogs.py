@@ -19,6 +19,24 @@ def select_directory(parent: QWidget, caption: str, start: Optional[Path] = None
     return Path(path)
 
 
+# Assembled message box stylesheets keyed by ``(bg_color, text_color)``.
+_STYLE_CACHE: dict[tuple[str, str], str] = {}
+
+
+def _theme_stylesheet(bg_color: str, text_color: str) -> str:
+    """Return the message box stylesheet for the given colours, building it once."""
+
+    key = (bg_color, text_color)
+    stylesheet = _STYLE_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = (
+            f"QMessageBox {{ background-color: {bg_color}; color: {text_color}; }}"
+            f"QLabel {{ color: {text_color}; }}"
+        )
+        _STYLE_CACHE[key] = stylesheet
+    return stylesheet
+
+
 def _apply_theme(box: QMessageBox, parent: Optional[QWidget]) -> None:
     """Apply the active theme colors to the message box."""
     # Prioritize parent palette if available, otherwise fallback to app palette
@@ -32,11 +50,7 @@ def _apply_theme(box: QMessageBox, parent: Optional[QWidget]) -> None:
 
     # Explicitly set the stylesheet to override any global application styles
     # that might be forcing a dark/light background inconsistently.
-    stylesheet = (
-        f"QMessageBox {{ background-color: {bg_color}; color: {text_color}; }}"
-        f"QLabel {{ color: {text_color}; }}"
-    )
-    box.setStyleSheet(stylesheet)
+    box.setStyleSheet(_theme_stylesheet(bg_color, text_color))
 
 
 def show_error(parent: QWidget, message: str, *, title: str = "iPhoto") -> None:
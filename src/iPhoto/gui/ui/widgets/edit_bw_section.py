@@ -9,7 +9,7 @@ from typing import Dict, Optional
 
 from PySide6.QtCore import QThreadPool, Qt, Signal, Slot
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QApplication, QFrame, QGraphicsOpacityEffect, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QApplication, QFrame, QVBoxLayout, QWidget
 
 from ....core.bw_resolver import BWParams, apply_bw_preview, params_from_master
 from ..models.edit_session import EditSession
@@ -164,11 +164,20 @@ class EditBWSection(QWidget):
         finally:
             self._updating_ui = False
 
-    def set_preview_image(self, image) -> None:
-        """Forward *image* to the master slider so it can refresh thumbnails."""
+    def set_preview_image(
+        self,
+        image,
+        *,
+        thumbnail_worker: ThumbnailGeneratorWorker | None = None,
+    ) -> None:
+        """Forward *image* to the master slider so it can refresh thumbnails.
+
+        When *thumbnail_worker* is given the master strip is queued on it
+        instead of starting a dedicated worker; the caller starts it.
+        """
 
         self.master_slider.setImage(image)
-        self._start_master_thumbnail_generation()
+        self._start_master_thumbnail_generation(thumbnail_worker)
 
     # ------------------------------------------------------------------
     def _reset_slider_values(self) -> None:
@@ -287,25 +296,44 @@ class EditBWSection(QWidget):
             self._session.set_value("BW_Enabled", True)
 
     # ------------------------------------------------------------------
-    def _start_master_thumbnail_generation(self) -> None:
+    def _start_master_thumbnail_generation(
+        self, shared_worker: ThumbnailGeneratorWorker | None = None
+    ) -> None:
+        # Previews for the previous image are stale now; stop them instead of letting
+        # ``update_thumbnail`` discard the results by generation id.
+        for previous in self._active_thumbnail_workers:
+            previous.cancel()
+        self._active_thumbnail_workers.clear()
+
         image = self.master_slider.base_image()
         if image is None:
             return
         values = self.master_slider.tick_values()
         if not values:
             return
-        worker = ThumbnailGeneratorWorker(
-            image,
-            values,
-            self._generate_master_preview,
-            target_height=self.master_slider.track_height(),
-            generation_id=self.master_slider.generation_id(),
-        )
-        worker.signals.thumbnail_ready.connect(self.master_slider.update_thumbnail)
-        worker.signals.error.connect(partial(self._on_thumbnail_error, worker))
-        worker.signals.finished.connect(partial(self._on_thumbnail_finished, worker))
+        if shared_worker is None:
+            worker = ThumbnailGeneratorWorker(
+                image,
+                values,
+                self._generate_master_preview,
+                target_height=self.master_slider.track_height(),
+                generation_id=self.master_slider.generation_id(),
+            )
+            signals = worker.signals
+        else:
+            worker = shared_worker
+            signals = worker.add_strip(
+                values,
+                self._generate_master_preview,
+                target_height=self.master_slider.track_height(),
+                generation_id=self.master_slider.generation_id(),
+            )
+        signals.thumbnail_ready.connect(self.master_slider.update_thumbnail)
+        signals.error.connect(partial(self._on_thumbnail_error, worker))
+        signals.finished.connect(partial(self._on_thumbnail_finished, worker))
         self._active_thumbnail_workers.append(worker)
-        self._thread_pool.start(worker)
+        if shared_worker is None:
+            self._thread_pool.start(worker)
 
     def _on_thumbnail_error(self, worker: ThumbnailGeneratorWorker, generation_id: int, message: str) -> None:
         del generation_id
@@ -346,15 +374,12 @@ class _SliderRow(QFrame):
         )
         layout.addWidget(self.slider)
 
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity_effect)
-
     def setEnabled(self, enabled: bool) -> None:  # type: ignore[override]
         """Keep the wrapper enabled so we can detect activation clicks."""
 
         super().setEnabled(True)
         self.slider.setEnabled(enabled)
-        self._opacity_effect.setOpacity(1.0 if enabled else 0.5)
+        self.slider.setDimmed(not enabled)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
         """Forward left clicks to the slider even while disabled."""
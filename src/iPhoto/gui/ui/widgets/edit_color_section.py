@@ -4,22 +4,21 @@ from __future__ import annotations
 
 import logging
 from functools import partial
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 
-from PySide6.QtCore import QThreadPool, Signal, Slot, Qt
+from PySide6.QtCore import QThreadPool, QTimer, Signal, Slot, Qt
 from PySide6.QtGui import QImage, QMouseEvent
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
     QVBoxLayout,
     QWidget,
-    QGraphicsOpacityEffect,
 )
 
 from ..palette import Edit_SIDEBAR_SUB_FONT
 from ....core.color_resolver import COLOR_KEYS, COLOR_RANGES, ColorResolver, ColorStats
 from ....core.color_resolver import compute_color_statistics
-from ....core.image_filters import apply_adjustments
+from ....core.filters.jit_executor import apply_color_previews_qimage
 from ..models.edit_session import EditSession
 from .collapsible_section import CollapsibleSection
 from .edit_strip import BWSlider
@@ -41,6 +40,10 @@ class EditColorSection(QWidget):
         self._session: Optional[EditSession] = None
         self._rows: Dict[str, _SliderRow] = {}
         self._color_stats: ColorStats = ColorStats()
+        # ``distribute_master`` is deterministic for a given master value and
+        # statistics object, and every drag tick asks for it again.
+        self._base_values_cache: tuple[float, ColorStats, dict[str, float]] | None = None
+        self._row_ranges: list[tuple[str, _SliderRow, float, float]] = []
         self._thread_pool = QThreadPool.globalInstance()
         self._active_thumbnail_workers: list[ThumbnailGeneratorWorker] = []
 
@@ -83,6 +86,7 @@ class EditColorSection(QWidget):
             row.interactionFinished.connect(self.interactionFinished)
             options_layout.addWidget(row)
             self._rows[key] = row
+            self._row_ranges.append((key, row, minimum, maximum))
 
         self.options_section = CollapsibleSection(
             "Options",
@@ -173,10 +177,10 @@ class EditColorSection(QWidget):
             return
 
         master_value = float(self._session.value("Color_Master"))
-        base_values = ColorResolver.distribute_master(master_value, self._color_stats)
+        base_values = self._base_values(master_value)
         base_value = float(base_values.get(key, 0.0))
 
-        delta_value = _clamp(new_ui_value - base_value, -1.0, 1.0)
+        delta_value = min(max(new_ui_value - base_value, -1.0), 1.0)
         self._session.set_value(key, delta_value)
 
     def _update_all_sub_sliders_ui(self) -> None:
@@ -186,20 +190,26 @@ class EditColorSection(QWidget):
             return
 
         master_value = float(self._session.value("Color_Master"))
-        base_values = ColorResolver.distribute_master(master_value, self._color_stats)
-
-        for key in COLOR_KEYS:
-            row = self._rows.get(key)
-            if row is None:
-                continue
+        base_values = self._base_values(master_value)
 
+        for key, row, minimum, maximum in self._row_ranges:
             base_value = float(base_values.get(key, 0.0))
             delta_value = float(self._session.value(key))
-            minimum, maximum = COLOR_RANGES[key]
-            final_value = _clamp(base_value + delta_value, minimum, maximum)
+            # The clamp is inlined because this runs for every key on each drag tick.
+            final_value = min(max(base_value + delta_value, minimum), maximum)
 
             row.update_from_value(final_value)
 
+    def _base_values(self, master_value: float) -> dict[str, float]:
+        """Return the master-derived Color values, reusing the last result when possible."""
+
+        cached = self._base_values_cache
+        if cached is not None and cached[0] == master_value and cached[1] is self._color_stats:
+            return cached[2]
+        base_values = ColorResolver.distribute_master(master_value, self._color_stats)
+        self._base_values_cache = (master_value, self._color_stats, base_values)
+        return base_values
+
     def _apply_enabled_state(self, enabled: bool) -> None:
         self.master_slider.setEnabled(enabled)
         for row in self._rows.values():
@@ -210,8 +220,13 @@ class EditColorSection(QWidget):
         image,
         *,
         color_stats: ColorStats | None = None,
+        thumbnail_worker: ThumbnailGeneratorWorker | None = None,
     ) -> None:
-        """Forward *image* to the master slider and refresh cached statistics."""
+        """Forward *image* to the master slider and refresh cached statistics.
+
+        When *thumbnail_worker* is given the master strip is queued on it
+        instead of starting a dedicated worker; the caller starts it.
+        """
 
         if color_stats is not None:
             self._color_stats = color_stats
@@ -222,12 +237,26 @@ class EditColorSection(QWidget):
             self._color_stats = stats
             if self._session is not None:
                 self._session.set_color_stats(stats)
+        # Bind the statistics of the current base image so the worker does not
+        # recompute them for every tick; rebinding here also invalidates them
+        # whenever the image changes.
+        self.master_slider.set_preview_generator(
+            partial(self._generate_master_preview, stats=self._color_stats)
+        )
         self.master_slider.setImage(image)
-        self._start_master_thumbnail_generation()
+        self._start_master_thumbnail_generation(thumbnail_worker)
 
     # ------------------------------------------------------------------
-    def _start_master_thumbnail_generation(self) -> None:
-        """Launch a background worker to populate the Color slider thumbnails."""
+    def _start_master_thumbnail_generation(
+        self, shared_worker: ThumbnailGeneratorWorker | None = None
+    ) -> None:
+        """Launch (or queue on *shared_worker*) the Color slider thumbnail task."""
+
+        # Previews for the previous image are stale now; stop them instead of letting
+        # ``update_thumbnail`` discard the results by generation id.
+        for previous in self._active_thumbnail_workers:
+            previous.cancel()
+        self._active_thumbnail_workers.clear()
 
         image = self.master_slider.base_image()
         if image is None:
@@ -237,20 +266,34 @@ class EditColorSection(QWidget):
         if not values:
             return
 
-        worker = ThumbnailGeneratorWorker(
-            image,
-            values,
-            self.master_slider.preview_generator(),
-            target_height=self.master_slider.track_height(),
-            generation_id=self.master_slider.generation_id(),
-        )
-
-        worker.signals.thumbnail_ready.connect(self.master_slider.update_thumbnail)
-        worker.signals.error.connect(partial(self._on_thumbnail_error, worker))
-        worker.signals.finished.connect(partial(self._on_thumbnail_finished, worker))
+        batch_generator = partial(self._generate_master_previews, stats=self._color_stats)
+        if shared_worker is None:
+            worker = ThumbnailGeneratorWorker(
+                image,
+                values,
+                self.master_slider.preview_generator(),
+                target_height=self.master_slider.track_height(),
+                generation_id=self.master_slider.generation_id(),
+                batch_generator=batch_generator,
+            )
+            signals = worker.signals
+        else:
+            worker = shared_worker
+            signals = worker.add_strip(
+                values,
+                self.master_slider.preview_generator(),
+                target_height=self.master_slider.track_height(),
+                generation_id=self.master_slider.generation_id(),
+                batch_generator=batch_generator,
+            )
+
+        signals.thumbnail_ready.connect(self.master_slider.update_thumbnail)
+        signals.error.connect(partial(self._on_thumbnail_error, worker))
+        signals.finished.connect(partial(self._on_thumbnail_finished, worker))
 
         self._active_thumbnail_workers.append(worker)
-        self._thread_pool.start(worker)
+        if shared_worker is None:
+            self._thread_pool.start(worker)
 
     @Slot(int, str)
     def _on_thumbnail_error(self, worker: ThumbnailGeneratorWorker, generation_id: int, message: str) -> None:
@@ -277,23 +320,45 @@ class EditColorSection(QWidget):
         if self._session is not None and not self._session.value("Color_Enabled"):
             self._session.set_value("Color_Enabled", True)
 
-    def _generate_master_preview(self, image: QImage, value: float) -> QImage:
-        """Return a preview frame illustrating the Color master slider effect."""
-
-        stats = compute_color_statistics(image)
-        resolved = ColorResolver.resolve_color_vector(value, None, stats=stats)
-        gain_r, gain_g, gain_b = stats.white_balance_gain
-        adjustments = {
-            "Light_Enabled": False,
-            "Color_Enabled": True,
-            "Saturation": resolved.get("Saturation", 0.0),
-            "Vibrance": resolved.get("Vibrance", 0.0),
-            "Cast": resolved.get("Cast", 0.0),
-            "Color_Gain_R": gain_r,
-            "Color_Gain_G": gain_g,
-            "Color_Gain_B": gain_b,
-        }
-        return apply_adjustments(image, adjustments, color_stats=stats)
+    def _generate_master_preview(
+        self,
+        image: QImage,
+        value: float,
+        *,
+        stats: ColorStats | None = None,
+    ) -> QImage:
+        """Return a preview frame illustrating the Color master slider effect.
+
+        *stats* should describe the base image the preview is derived from;
+        they are only computed from *image* when the caller does not supply them.
+        """
+
+        return self._generate_master_previews(image, [value], stats=stats)[0]
+
+    def _generate_master_previews(
+        self,
+        image: QImage,
+        values: Sequence[float],
+        *,
+        stats: ColorStats | None = None,
+    ) -> list[QImage]:
+        """Return one preview frame per master slider value in *values*."""
+
+        if stats is None:
+            stats = compute_color_statistics(image)
+        params = []
+        for value in values:
+            resolved = ColorResolver.resolve_color_vector(value, None, stats=stats)
+            params.append(
+                (
+                    resolved.get("Saturation", 0.0),
+                    resolved.get("Vibrance", 0.0),
+                    resolved.get("Cast", 0.0),
+                )
+            )
+        # Only Color adjustments are active here, so skip the generic pipeline's
+        # tone pass and run just the fused colour kernel for every tick.
+        return apply_color_previews_qimage(image, params, *stats.white_balance_gain)
 
 
 class _SliderRow(QFrame):
@@ -326,13 +391,24 @@ class _SliderRow(QFrame):
         self.slider = BWSlider(label, self, minimum=minimum, maximum=maximum, initial=0.0)
         layout.addWidget(self.slider)
         self.slider.valueChanged.connect(self._handle_slider_changed)
+        self.slider.valueCommitted.connect(self._flush_pending_value)
         self.slider.interactionStarted.connect(self.interactionStarted)
-        self.slider.interactionFinished.connect(self.interactionFinished)
-
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity_effect)
+        self.slider.interactionFinished.connect(self._finish_interaction)
+
+        # Drags emit ``valueChanged`` for every mouse move.  The slider repaints
+        # its own read-out immediately, so the session only needs the latest
+        # value once per frame, plus a final flush when the value is committed
+        # or the interaction ends.
+        self._pending_value: Optional[float] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._flush_pending_value)
 
     def setSession(self, session: Optional[EditSession]) -> None:
+        # A value queued for the previous session must not land in the new one.
+        self._emit_timer.stop()
+        self._pending_value = None
         self._session = session
 
     def setEnabled(self, enabled: bool) -> None:  # type: ignore[override]
@@ -340,7 +416,7 @@ class _SliderRow(QFrame):
 
         super().setEnabled(True)
         self.slider.setEnabled(enabled)
-        self._opacity_effect.setOpacity(1.0 if enabled else 0.5)
+        self.slider.setDimmed(not enabled)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
         """Handle clicks when the slider is disabled to re-enable it."""
@@ -374,15 +450,25 @@ class _SliderRow(QFrame):
 
     # ------------------------------------------------------------------
     def _handle_slider_changed(self, new_value: float) -> None:
-        """Relay the updated slider value while tagging it with the adjustment *key*."""
+        """Queue the updated slider value for relay on the next flush."""
 
-        self.uiValueChanged.emit(self._key, float(new_value))
+        self._pending_value = float(new_value)
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _flush_pending_value(self, *_: float) -> None:
+        """Relay the queued slider value while tagging it with the adjustment *key*."""
+
+        self._emit_timer.stop()
+        value = self._pending_value
+        if value is None:
+            return
+        self._pending_value = None
+        self.uiValueChanged.emit(self._key, value)
 
+    def _finish_interaction(self) -> None:
+        """Flush the final drag value before announcing the end of the interaction."""
 
-def _clamp(value: float, minimum: float, maximum: float) -> float:
-    if value < minimum:
-        return minimum
-    if value > maximum:
-        return maximum
-    return value
+        self._flush_pending_value()
+        self.interactionFinished.emit()
 
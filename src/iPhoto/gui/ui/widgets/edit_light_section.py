@@ -7,18 +7,17 @@ from functools import partial
 from typing import Dict, Optional
 
 
-from PySide6.QtCore import QThreadPool, Signal, Slot, Qt
+from PySide6.QtCore import QThreadPool, QTimer, Signal, Slot, Qt
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
     QVBoxLayout,
     QWidget,
-    QGraphicsOpacityEffect,
 )
 
 from ..palette import Edit_SIDEBAR_SUB_FONT
-from ....core.light_resolver import LIGHT_KEYS, _clamp, resolve_light_vector
+from ....core.light_resolver import LIGHT_KEYS, resolve_light_vector
 from ..models.edit_session import EditSession
 from .collapsible_section import CollapsibleSection, CollapsibleSubSection
 from .edit_strip import BWSlider
@@ -175,7 +174,7 @@ class EditLightSection(QWidget):
         base_value = float(base_values.get(key, 0.0))
 
         # The UI shows ``base + delta`` so we recover the delta component before persisting it.
-        delta_value = _clamp(new_ui_value - base_value)
+        delta_value = min(max(new_ui_value - base_value, -1.0), 1.0)
         self._session.set_value(key, delta_value)
 
     def _update_all_sub_sliders_ui(self) -> None:
@@ -195,7 +194,8 @@ class EditLightSection(QWidget):
             base_value = float(base_values.get(key, 0.0))
             delta_value = float(self._session.value(key))
             # Combine the resolved base with the stored delta to display the true applied value.
-            final_value = _clamp(base_value + delta_value)
+            # The clamp is inlined because this runs for every key on each drag tick.
+            final_value = min(max(base_value + delta_value, -1.0), 1.0)
 
             row.update_from_value(final_value)
 
@@ -204,11 +204,20 @@ class EditLightSection(QWidget):
         for row in self._rows.values():
             row.setEnabled(enabled)
 
-    def set_preview_image(self, image) -> None:
-        """Forward *image* to the master slider so it can refresh thumbnails."""
+    def set_preview_image(
+        self,
+        image,
+        *,
+        thumbnail_worker: ThumbnailGeneratorWorker | None = None,
+    ) -> None:
+        """Forward *image* to the master slider so it can refresh thumbnails.
+
+        When *thumbnail_worker* is given the master strip is queued on it
+        instead of starting a dedicated worker; the caller starts it.
+        """
 
         self.master_slider.setImage(image)
-        self._start_master_thumbnail_generation()
+        self._start_master_thumbnail_generation(thumbnail_worker)
 
     @Slot()
     def _handle_disabled_slider_click(self) -> None:
@@ -217,8 +226,16 @@ class EditLightSection(QWidget):
             self._session.set_value("Light_Enabled", True)
 
     # ------------------------------------------------------------------
-    def _start_master_thumbnail_generation(self) -> None:
-        """Launch a background task that fills the master slider thumbnails."""
+    def _start_master_thumbnail_generation(
+        self, shared_worker: ThumbnailGeneratorWorker | None = None
+    ) -> None:
+        """Launch (or queue on *shared_worker*) the task filling the master thumbnails."""
+
+        # Previews for the previous image are stale now; stop them instead of letting
+        # ``update_thumbnail`` discard the results by generation id.
+        for previous in self._active_thumbnail_workers:
+            previous.cancel()
+        self._active_thumbnail_workers.clear()
 
         image = self.master_slider.base_image()
         if image is None:
@@ -228,20 +245,31 @@ class EditLightSection(QWidget):
         if not values:
             return
 
-        worker = ThumbnailGeneratorWorker(
-            image,
-            values,
-            self.master_slider.preview_generator(),
-            target_height=self.master_slider.track_height(),
-            generation_id=self.master_slider.generation_id(),
-        )
-
-        worker.signals.thumbnail_ready.connect(self.master_slider.update_thumbnail)
-        worker.signals.error.connect(partial(self._on_thumbnail_error, worker))
-        worker.signals.finished.connect(partial(self._on_thumbnail_finished, worker))
+        if shared_worker is None:
+            worker = ThumbnailGeneratorWorker(
+                image,
+                values,
+                self.master_slider.preview_generator(),
+                target_height=self.master_slider.track_height(),
+                generation_id=self.master_slider.generation_id(),
+            )
+            signals = worker.signals
+        else:
+            worker = shared_worker
+            signals = worker.add_strip(
+                values,
+                self.master_slider.preview_generator(),
+                target_height=self.master_slider.track_height(),
+                generation_id=self.master_slider.generation_id(),
+            )
+
+        signals.thumbnail_ready.connect(self.master_slider.update_thumbnail)
+        signals.error.connect(partial(self._on_thumbnail_error, worker))
+        signals.finished.connect(partial(self._on_thumbnail_finished, worker))
 
         self._active_thumbnail_workers.append(worker)
-        self._thread_pool.start(worker)
+        if shared_worker is None:
+            self._thread_pool.start(worker)
 
     @Slot(int, str)
     def _on_thumbnail_error(self, worker: ThumbnailGeneratorWorker, generation_id: int, message: str) -> None:
@@ -285,20 +313,31 @@ class _SliderRow(QFrame):
         self.slider = BWSlider(label, self, minimum=-1.0, maximum=1.0, initial=0.0)
         layout.addWidget(self.slider)
         self.slider.valueChanged.connect(self._handle_slider_changed)
+        self.slider.valueCommitted.connect(self._flush_pending_value)
         self.slider.interactionStarted.connect(self.interactionStarted)
-        self.slider.interactionFinished.connect(self.interactionFinished)
-
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self._opacity_effect)
+        self.slider.interactionFinished.connect(self._finish_interaction)
+
+        # Drags emit ``valueChanged`` for every mouse move.  The slider repaints
+        # its own read-out immediately, so the session only needs the latest
+        # value once per frame, plus a final flush when the value is committed
+        # or the interaction ends.
+        self._pending_value: Optional[float] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._flush_pending_value)
 
     def setSession(self, session: Optional[EditSession]) -> None:
+        # A value queued for the previous session must not land in the new one.
+        self._emit_timer.stop()
+        self._pending_value = None
         self._session = session
 
     def setEnabled(self, enabled: bool) -> None:  # type: ignore[override]
         """Keep the row enabled to capture clicks, but disable the visual slider."""
         super().setEnabled(True)
         self.slider.setEnabled(enabled)
-        self._opacity_effect.setOpacity(1.0 if enabled else 0.5)
+        self.slider.setDimmed(not enabled)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
         """Handle clicks when the slider is disabled to re-enable it."""
@@ -331,6 +370,24 @@ class _SliderRow(QFrame):
 
     # ------------------------------------------------------------------
     def _handle_slider_changed(self, new_value: float) -> None:
-        """Relay the updated slider value while tagging it with the adjustment *key*."""
+        """Queue the updated slider value for relay on the next flush."""
+
+        self._pending_value = float(new_value)
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _flush_pending_value(self, *_: float) -> None:
+        """Relay the queued slider value while tagging it with the adjustment *key*."""
+
+        self._emit_timer.stop()
+        value = self._pending_value
+        if value is None:
+            return
+        self._pending_value = None
+        self.uiValueChanged.emit(self._key, value)
+
+    def _finish_interaction(self) -> None:
+        """Flush the final drag value before announcing the end of the interaction."""
 
-        self.uiValueChanged.emit(self._key, float(new_value))
\ No newline at end of file
+        self._flush_pending_value()
+        self.interactionFinished.emit()
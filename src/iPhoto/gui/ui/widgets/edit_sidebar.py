@@ -4,8 +4,8 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import Qt, Slot, Signal
-from PySide6.QtGui import QPalette, QColor
+from PySide6.QtCore import QThreadPool, Qt, Slot, Signal
+from PySide6.QtGui import QPalette, QColor, QImage
 from PySide6.QtWidgets import (
     QFrame,
     QLabel,
@@ -20,6 +20,7 @@ from ....core.light_resolver import LIGHT_KEYS
 from ....core.color_resolver import COLOR_KEYS, ColorStats
 from ....core.bw_resolver import BWParams
 from ..models.edit_session import EditSession
+from ..tasks.thumbnail_generator_worker import ThumbnailGeneratorWorker
 from .edit_light_section import EditLightSection
 from .edit_color_section import EditColorSection
 from .edit_bw_section import EditBWSection
@@ -296,12 +297,7 @@ class EditSidebar(QWidget):
             self._sync_color_toggle_state()
             self._sync_bw_toggle_state()
             if self._light_preview_image is not None:
-                self._light_section.set_preview_image(self._light_preview_image)
-                self._color_section.set_preview_image(
-                    self._light_preview_image,
-                    color_stats=self._color_stats,
-                )
-                self._bw_section.set_preview_image(self._light_preview_image)
+                self._forward_preview_image(self._light_preview_image, self._color_stats)
         else:
             self.light_toggle_button.setChecked(False)
             self._update_light_toggle_icon(False)
@@ -343,9 +339,19 @@ class EditSidebar(QWidget):
 
         self._light_preview_image = image
         self._color_stats = color_stats
-        self._light_section.set_preview_image(image)
-        self._color_section.set_preview_image(image, color_stats=color_stats)
-        self._bw_section.set_preview_image(image)
+        self._forward_preview_image(image, color_stats)
+
+    def _forward_preview_image(self, image, color_stats: ColorStats | None) -> None:
+        """Hand *image* to every section, rendering all master strips in one worker."""
+
+        worker = ThumbnailGeneratorWorker(image if image is not None else QImage())
+        self._light_section.set_preview_image(image, thumbnail_worker=worker)
+        self._color_section.set_preview_image(
+            image, color_stats=color_stats, thumbnail_worker=worker
+        )
+        self._bw_section.set_preview_image(image, thumbnail_worker=worker)
+        if worker.has_strips():
+            QThreadPool.globalInstance().start(worker)
 
     def preview_thumbnail_height(self) -> int:
         """Return the vertical pixel span used by the master thumbnail strips."""
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import QPointF, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen
+from PySide6.QtCore import QEvent, QPointF, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPainterPath, QPen, QPixmap
 from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
 
 
 class BWSlider(QWidget):
-    """Horizontal slider that renders a split-tone track and bold labels."""
+    """Horizontal slider that renders a split-tone track and bold labels.
+
+    The static parts of the track (rounded background, both tone fills and the
+    name label) are rendered once into a pair of cached pixmaps, so repaints
+    while dragging only blit the two halves and draw the indicator and value.
+    """
 
     valueChanged = Signal(float)
     """Emitted whenever the slider's value changes."""
@@ -39,10 +44,14 @@ class BWSlider(QWidget):
         self._maximum = float(maximum)
         if self._maximum <= self._minimum:
             self._maximum = self._minimum + 1.0
+        self._inv_span = 1.0 / (self._maximum - self._minimum)
         self._value = float(initial) if initial is not None else (self._minimum + self._maximum) / 2.0
         self._value = self._clamp(self._value)
         self._dragging = False
+        # True once the current drag has emitted a changed value.
+        self._drag_changed = False
         self._hover = False
+        self._dimmed = False
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
@@ -61,6 +70,14 @@ class BWSlider(QWidget):
         self.c_line = QColor(0, 122, 255)
         self.c_text = QColor(235, 235, 235)
 
+        # Full-width track renders in the left and right tones, rebuilt lazily
+        # whenever the geometry, label or font changes.
+        self._track_cache: Optional[tuple[QPixmap, QPixmap]] = None
+        self._cache_size = QSize()
+        # Geometry and font metrics reused by every paint and pointer move.
+        self._track_geometry: Optional[QRectF] = None
+        self._label_metrics: Optional[QFontMetrics] = None
+
     # ------------------------------------------------------------------
     # Public API
     def value(self) -> float:
@@ -68,21 +85,40 @@ class BWSlider(QWidget):
 
         return self._value
 
-    def setValue(self, value: float, emit: bool = True) -> None:
-        """Update the slider to *value* and optionally emit :attr:`valueChanged`."""
+    def setValue(self, value: float, emit: bool = True) -> bool:
+        """Update the slider to *value* and optionally emit :attr:`valueChanged`.
+
+        Returns ``True`` when the stored value actually changed.
+        """
 
         clamped = self._clamp(value)
         if abs(clamped - self._value) <= 1e-6:
-            return
+            return False
+        previous = self._value
         self._value = clamped
-        self.update()
+        self._update_changed_region(previous)
         if emit:
             self.valueChanged.emit(self._value)
+        return True
 
     def setName(self, name: str) -> None:
         """Change the label rendered on the left side of the track."""
 
         self._name = name
+        self._track_cache = None
+        self.update()
+
+    def setDimmed(self, dimmed: bool) -> None:
+        """Paint the slider at half opacity, e.g. while its adjustment is disabled.
+
+        The opacity is applied by the painter, which avoids the offscreen
+        compositing pass a ``QGraphicsOpacityEffect`` would add to every paint.
+        """
+
+        dimmed = bool(dimmed)
+        if dimmed == self._dimmed:
+            return
+        self._dimmed = dimmed
         self.update()
 
     def setRange(self, minimum: float, maximum: float) -> None:
@@ -92,10 +128,21 @@ class BWSlider(QWidget):
         self._maximum = float(maximum)
         if self._maximum <= self._minimum:
             self._maximum = self._minimum + 1.0
+        self._inv_span = 1.0 / (self._maximum - self._minimum)
         self.setValue(self._value, emit=False)
 
     # ------------------------------------------------------------------
     # Event handlers
+    def resizeEvent(self, event):  # type: ignore[override]
+        self._track_geometry = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):  # type: ignore[override]
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._track_cache = None
+            self._label_metrics = None
+        super().changeEvent(event)
+
     def enterEvent(self, _):  # type: ignore[override]
         self._hover = True
         self.update()
@@ -107,6 +154,7 @@ class BWSlider(QWidget):
     def mousePressEvent(self, event):  # type: ignore[override]
         if event.button() == Qt.MouseButton.LeftButton:
             self._dragging = True
+            self._drag_changed = False
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
             self.interactionStarted.emit()
             self._set_by_pos(event.position().x())
@@ -119,70 +167,81 @@ class BWSlider(QWidget):
         if event.button() == Qt.MouseButton.LeftButton and self._dragging:
             self._dragging = False
             self.unsetCursor()
-            self.valueCommitted.emit(self._value)
+            # A press without movement leaves nothing new to commit, but a drag
+            # that returns to its start still has to settle the values it sent.
+            if self._drag_changed:
+                self.valueCommitted.emit(self._value)
             self.interactionFinished.emit()
 
     def wheelEvent(self, event):  # type: ignore[override]
-        self.interactionStarted.emit()
         step = (self._maximum - self._minimum) * 0.01
         delta = event.angleDelta().y() / 120.0
-        self.setValue(self._value + delta * step)
-        self.valueCommitted.emit(self._value)
-        self.interactionFinished.emit()
+        self._step_value(delta * step)
 
     def keyPressEvent(self, event):  # type: ignore[override]
         step = (self._maximum - self._minimum) * 0.01
         if event.key() in (Qt.Key.Key_Left, Qt.Key.Key_A):
-            self.interactionStarted.emit()
-            self.setValue(self._value - step)
+            self._step_value(-step)
         elif event.key() in (Qt.Key.Key_Right, Qt.Key.Key_D):
-            self.interactionStarted.emit()
-            self.setValue(self._value + step)
+            self._step_value(step)
         else:
             super().keyPressEvent(event)
+
+    def _step_value(self, delta: float) -> None:
+        """Apply a discrete wheel/key step as one complete interaction.
+
+        Steps that are clamped away at either end of the range change nothing,
+        so they emit no signals; otherwise each one would record an undo state
+        and commit (and re-render) an unchanged value.
+        """
+
+        if abs(self._clamp(self._value + delta) - self._value) <= 1e-6:
             return
+        self.interactionStarted.emit()
+        self.setValue(self._value + delta)
         self.valueCommitted.emit(self._value)
         self.interactionFinished.emit()
 
     # ------------------------------------------------------------------
     # Rendering helpers
     def paintEvent(self, _):  # type: ignore[override]
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
-        width = self.width()
-        height = self.height()
-        track_height = self.track_height
-        track_rect = QRectF(self.h_padding, (height - track_height) / 2, width - 2 * self.h_padding, track_height)
-        x_line = track_rect.left() + self._normalised_value() * track_rect.width()
-
-        round_path = QPainterPath()
-        round_path.addRoundedRect(track_rect, self.radius, self.radius)
-
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(self.c_bg)
-        painter.drawPath(round_path)
-
-        painter.save()
-        painter.setClipPath(round_path)
-        painter.setClipRect(
-            QRectF(track_rect.left(), track_rect.top(), max(0.0, x_line - track_rect.left()), track_height),
-            Qt.IntersectClip,
-        )
-        painter.fillRect(track_rect, self.c_left)
-        painter.restore()
+        track_rect = self._track_rect()
+        track_height = track_rect.height()
+        x_line = self._value_to_x(self._value, track_rect)
+
+        if self._track_cache is None or self._cache_size != self.size() * self.devicePixelRatioF():
+            self._cache_size = self.size() * self.devicePixelRatioF()
+            self._track_cache = (
+                self._render_track(track_rect, self.c_left),
+                self._render_track(track_rect, self.c_right),
+            )
+        left_track, right_track = self._track_cache
+        dpr = left_track.devicePixelRatio()
 
-        painter.save()
-        painter.setClipPath(round_path)
-        painter.setClipRect(
-            QRectF(x_line, track_rect.top(), max(0.0, track_rect.right() - x_line), track_height),
-            Qt.IntersectClip,
+        painter = QPainter(self)
+        if self._dimmed:
+            painter.setOpacity(0.5)
+        split = QRectF(0.0, 0.0, x_line, self.height())
+        painter.drawPixmap(split, left_track, QRectF(0.0, 0.0, x_line * dpr, self.height() * dpr))
+        split = QRectF(x_line, 0.0, max(0.0, self.width() - x_line), self.height())
+        painter.drawPixmap(
+            split,
+            right_track,
+            QRectF(x_line * dpr, 0.0, split.width() * dpr, self.height() * dpr),
         )
-        painter.fillRect(track_rect, self.c_right)
-        painter.restore()
 
         painter.save()
-        painter.setClipPath(round_path)
+        if (
+            x_line - track_rect.left() < self.radius + self.line_width
+            or track_rect.right() - x_line < self.radius + self.line_width
+        ):
+            # Only the ends of the track are rounded, so the indicator needs
+            # clipping (and antialiasing for the curved edge) just when it
+            # overlaps a corner.  Elsewhere it is a plain vertical bar.
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            round_path = QPainterPath()
+            round_path.addRoundedRect(track_rect, self.radius, self.radius)
+            painter.setClipPath(round_path)
         pen = QPen(self.c_line)
         pen.setWidth(self.line_width)
         pen.setCapStyle(Qt.PenCapStyle.FlatCap)
@@ -190,38 +249,112 @@ class BWSlider(QWidget):
         painter.drawLine(QPointF(x_line, track_rect.top()), QPointF(x_line, track_rect.bottom()))
         painter.restore()
 
-        font = QFont(self.font())
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._label_font())
         painter.setPen(self.c_text)
-
-        left_rect = QRectF(track_rect.left() + 10, track_rect.top(), track_rect.width() / 2 - 12, track_height)
         right_rect = QRectF(track_rect.center().x(), track_rect.top(), track_rect.width() / 2 - 10, track_height)
-        painter.drawText(left_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, self._name)
         painter.drawText(right_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight, f"{self._value:.2f}")
 
         if self._hover and not self._dragging:
             self.setCursor(Qt.CursorShape.OpenHandCursor)
 
+    def _update_changed_region(self, previous: float) -> None:
+        """Schedule a repaint of just the pixels affected by a value change.
+
+        Moving the indicator only recolours the strip between its old and new
+        positions and rewrites the numeric read-out; the rest of the widget is
+        unchanged, so there is no need to repaint (and re-blit) all of it.
+        """
+
+        track_rect = self._track_rect()
+        old_x = self._value_to_x(previous, track_rect)
+        new_x = self._value_to_x(self._value, track_rect)
+        margin = self.line_width + 1
+        self.update(
+            QRectF(
+                min(old_x, new_x) - margin,
+                track_rect.top(),
+                abs(new_x - old_x) + 2 * margin,
+                track_rect.height(),
+            ).toAlignedRect()
+        )
+
+        metrics = self._label_font_metrics()
+        text_width = max(
+            metrics.horizontalAdvance(f"{previous:.2f}"),
+            metrics.horizontalAdvance(f"{self._value:.2f}"),
+        ) + 2 * margin
+        text_right = track_rect.right() - 10
+        self.update(
+            QRectF(text_right - text_width, track_rect.top(), text_width + margin, track_rect.height()).toAlignedRect()
+        )
+
+    def _value_to_x(self, value: float, track_rect: QRectF) -> float:
+        return track_rect.left() + (value - self._minimum) * self._inv_span * track_rect.width()
+
+    def _track_rect(self) -> QRectF:
+        if self._track_geometry is None:
+            track_height = self.track_height
+            self._track_geometry = QRectF(
+                self.h_padding,
+                (self.height() - track_height) / 2,
+                self.width() - 2 * self.h_padding,
+                track_height,
+            )
+        return self._track_geometry
+
+    def _label_font_metrics(self) -> QFontMetrics:
+        if self._label_metrics is None:
+            self._label_metrics = QFontMetrics(self._label_font())
+        return self._label_metrics
+
+    def _label_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setBold(True)
+        return font
+
+    def _render_track(self, track_rect: QRectF, fill: QColor) -> QPixmap:
+        """Return the whole track filled with *fill*, including the name label."""
+
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        round_path = QPainterPath()
+        round_path.addRoundedRect(track_rect, self.radius, self.radius)
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.c_bg)
+        painter.drawPath(round_path)
+
+        painter.save()
+        painter.setClipPath(round_path)
+        painter.fillRect(track_rect, fill)
+        painter.restore()
+
+        painter.setFont(self._label_font())
+        painter.setPen(self.c_text)
+        left_rect = QRectF(
+            track_rect.left() + 10, track_rect.top(), track_rect.width() / 2 - 12, track_rect.height()
+        )
+        painter.drawText(left_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, self._name)
+        painter.end()
+        return pixmap
+
     # ------------------------------------------------------------------
     # Internal helpers
-    def _normalised_value(self) -> float:
-        span = self._maximum - self._minimum
-        if span <= 0:
-            return 0.0
-        return (self._value - self._minimum) / span
-
     def _clamp(self, value: float) -> float:
         return max(self._minimum, min(self._maximum, float(value)))
 
     def _set_by_pos(self, x: float) -> None:
-        left = self.h_padding
-        right = self.width() - self.h_padding
-        if right <= left:
+        track_rect = self._track_rect()
+        if track_rect.width() <= 0:
             return
-        ratio = (x - left) / (right - left)
-        span = self._maximum - self._minimum
-        self.setValue(self._minimum + ratio * span)
+        ratio = (x - track_rect.left()) / track_rect.width()
+        if self.setValue(self._minimum + ratio * (self._maximum - self._minimum)):
+            self._drag_changed = True
 
 
 # Demo harness ----------------------------------------------------------
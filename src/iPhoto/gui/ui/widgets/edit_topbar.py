@@ -2,19 +2,32 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from math import floor
 from typing import Iterable, List, Sequence
 
 from PySide6.QtCore import (
+    QAbstractAnimation,
     QEasingCurve,
-    Property,
+    QEvent,
+    QLineF,
     QPointF,
     QRectF,
     Qt,
-    QPropertyAnimation,
+    QVariantAnimation,
     Signal,
 )
-from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QLinearGradient,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QStaticText,
+    QTransform,
+)
 from PySide6.QtCore import QSize
 from PySide6.QtWidgets import QApplication, QSizePolicy, QVBoxLayout, QWidget
 
@@ -35,6 +48,30 @@ def _align_rect_05(rect: QRectF) -> QRectF:
     return QRectF(x, y, width, height)
 
 
+@dataclass
+class _BarGeometry:
+    """Size-dependent paths and rects reused across repaints."""
+
+    key: tuple[int, int, int, float]
+    overdraw: float
+    outer_path: QPainterPath
+    bg_path: QPainterPath
+    segment_rects: list[QRectF]
+    separator_lines: list[QLineF]
+    # Plain-float copies of the segment extents and the already snapped band
+    # row, so per-frame band interpolation needs no QRectF round trips.
+    segment_lefts: list[float]
+    segment_widths: list[float]
+    band_top: float
+    band_height: int
+    # Hit-testing origin and per-segment step along x.
+    hit_left: float
+    hit_step: float
+    # Most recent (pos, band rect); setAnimPos and the following paint ask for
+    # the same positions, so one slot serves the whole frame.
+    last_band: tuple[float, QRectF] | None = None
+
+
 class SegmentedTopBar(QWidget):
     """Rounded segmented control styled to mirror the Photos.app toolbar."""
 
@@ -46,9 +83,12 @@ class SegmentedTopBar(QWidget):
         self._items: List[str] = provided_items
         self._index = 0
         self._anim_pos = float(self._index)
-        self._anim = QPropertyAnimation(self, b"animPos", self)
+        # Drive the highlight straight from valueChanged rather than through a
+        # Qt property so each tick skips the meta-property round trip.
+        self._anim = QVariantAnimation(self)
         self._anim.setDuration(160)
         self._anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._anim.valueChanged.connect(self._on_anim_value)
 
         # Visual parameters -------------------------------------------------
         self.h_pad = 10
@@ -65,6 +105,20 @@ class SegmentedTopBar(QWidget):
         self.frosty_a = QColor(255, 255, 255, 42)
         self.frosty_b = QColor(255, 255, 255, 18)
 
+        self._geom_cache: _BarGeometry | None = None
+        self._width_hint_cache: float | None = None
+        # Rendering of the settled control, keyed on (width, height, dpr, pos).
+        self._steady_pixmap: QPixmap | None = None
+        self._steady_key: tuple[int, int, float, float] | None = None
+        self._pen_active = QPen(self.text_active)
+        self._pen_inactive = QPen(self.text_inactive)
+        self._sep_pen = QPen(QColor(90, 90, 90), self.sep_width)
+        self._border_pen = QPen(self.border, 1)
+        self._band_gradient = QLinearGradient(0.0, 0.0, 0.0, 1.0)
+        self._band_gradient.setColorAt(0.0, self.frosty_b)
+        self._band_gradient.setColorAt(0.6, QColor(255, 255, 255, 0))
+        self._rebuild_fonts()
+
         self.setMinimumHeight(self.height_hint)
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -84,6 +138,10 @@ class SegmentedTopBar(QWidget):
         self._items = new_items
         self._index = max(0, min(self._index, len(self._items) - 1))
         self._anim_pos = float(self._index)
+        self._geom_cache = None
+        self._width_hint_cache = None
+        self._steady_pixmap = None
+        self._rebuild_static_labels()
         self.update()
         self.updateGeometry()
 
@@ -119,10 +177,24 @@ class SegmentedTopBar(QWidget):
     def setAnimPos(self, value: float) -> None:
         """Update the highlight animation progress and repaint the control."""
 
+        previous = self._anim_pos
         self._anim_pos = value
-        self.update()
-
-    animPos = Property(float, getAnimPos, setAnimPos)
+        geom = self._geometry()
+        if not geom.segment_rects:
+            self.update()
+            return
+        # Only the strip swept by the band changes, plus the two labels whose
+        # bold state flips when the rounded position crosses a midpoint.
+        dirty = self._band_rect_for_pos(geom, previous).united(self._band_rect_for_pos(geom, value))
+        old_active, new_active = round(previous), round(value)
+        if old_active != new_active:
+            for index in (old_active, new_active):
+                if 0 <= index < len(geom.segment_rects):
+                    dirty = dirty.united(geom.segment_rects[index])
+        self.update(dirty.toAlignedRect().adjusted(-2, -2, 2, 2))
+
+    def _on_anim_value(self, value: float) -> None:
+        self.setAnimPos(float(value))
 
     # ------------------------------------------------------------------
     # Input handling helpers
@@ -141,80 +213,190 @@ class SegmentedTopBar(QWidget):
         else:
             super().keyPressEvent(event)
 
+    def changeEvent(self, event):  # type: ignore[override]
+        if event.type() == QEvent.Type.FontChange:
+            self._rebuild_fonts()
+            self._width_hint_cache = None
+            self._steady_pixmap = None
+        super().changeEvent(event)
+
     # ------------------------------------------------------------------
     # Painting helpers
-    def paintEvent(self, _):  # type: ignore[override]
+    def _rebuild_fonts(self) -> None:
+        """Derive the regular and bold label fonts from the widget font."""
+
+        self._font_regular = QFont(self.font())
+        self._font_bold = QFont(self.font())
+        self._font_bold.setBold(True)
+        self._rebuild_static_labels()
+
+    def _rebuild_static_labels(self) -> None:
+        """Shape every label once per font so repaints only position glyphs."""
+
+        self._static_regular = [self._static_label(text, self._font_regular) for text in self._items]
+        self._static_bold = [self._static_label(text, self._font_bold) for text in self._items]
+
+    @staticmethod
+    def _static_label(text: str, font: QFont) -> QStaticText:
+        label = QStaticText(text)
+        label.setTextFormat(Qt.TextFormat.PlainText)
+        label.prepare(QTransform(), font)
+        return label
+
+    @staticmethod
+    def _draw_label(painter: QPainter, rect: QRectF, label: QStaticText) -> None:
+        size = label.size()
+        center = rect.center()
+        painter.drawStaticText(
+            QPointF(center.x() - size.width() / 2, center.y() - size.height() / 2), label
+        )
+
+    def paintEvent(self, event):  # type: ignore[override]
         painter = QPainter(self)
+        if self._anim.state() != QAbstractAnimation.State.Running:
+            # Repaints of the settled control (focus, exposure, the final
+            # animation tick) reuse one cached rendering.
+            painter.drawPixmap(0, 0, self._steady_rendering())
+            return
+        self._paint_contents(painter, QRectF(event.rect()))
+
+    def _steady_rendering(self) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio, self._anim_pos)
+        if self._steady_pixmap is None or self._steady_key != key:
+            pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self._paint_contents(painter, QRectF(self.rect()))
+            painter.end()
+            self._steady_pixmap = pixmap
+            self._steady_key = key
+        return self._steady_pixmap
+
+    def _paint_contents(self, painter: QPainter, dirty: QRectF) -> None:
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
 
-        width = self.width()
-        height = self.height()
-        overdraw = max(1.0, self.devicePixelRatioF() * 0.8)
-
-        outer = _align_rect_05(QRectF(1.0, 1.0, width - 2.0, height - 2.0))
-        outer_path = QPainterPath()
-        outer_path.addRoundedRect(outer, self.radius, self.radius)
+        geom = self._geometry()
+        outer_path = geom.outer_path
+        segment_rects = geom.segment_rects
 
-        bg_rect = outer.adjusted(-overdraw, -overdraw, overdraw, overdraw)
-        bg_path = QPainterPath()
-        bg_path.addRoundedRect(bg_rect, self.radius + overdraw, self.radius + overdraw)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(self.bg)
-        painter.drawPath(bg_path)
-
-        inner = _align_rect_05(outer.adjusted(self.h_pad, self.v_pad, -self.h_pad, -self.v_pad))
-        segment_rects, separators = self._segment_rects_and_boundaries(inner)
+        painter.drawPath(geom.bg_path)
 
         if segment_rects:
-            band_rect = self._lerp_rects(segment_rects, self._anim_pos)
-
-            leftmost = self._anim_pos < 0.001
-            rightmost = self._anim_pos > len(segment_rects) - 1.001
-            band_rect = QRectF(
-                band_rect.left() - (self.h_pad if leftmost else overdraw),
-                outer.top() - overdraw,
-                band_rect.width()
-                + (2 * overdraw if not (leftmost or rightmost) else self.h_pad + overdraw),
-                outer.height() + 2 * overdraw,
-            )
-            band_rect = _align_rect_05(band_rect)
-
+            band_rect = self._band_rect_for_pos(geom, self._anim_pos)
             band_path = QPainterPath()
             band_path.addRoundedRect(band_rect, self.radius, self.radius)
-            selection_path = outer_path.intersected(band_path)
 
+            # Clip to the rounded border rather than intersecting the paths;
+            # the border stroke drawn last hides the aliased clip edge.
+            painter.save()
+            painter.setClipPath(outer_path)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(self.frosty_a)
-            painter.drawPath(selection_path)
+            painter.drawPath(band_path)
 
-            gradient = QLinearGradient(band_rect.topLeft(), band_rect.bottomLeft())
-            gradient.setColorAt(0.0, self.frosty_b)
-            gradient.setColorAt(0.6, QColor(255, 255, 255, 0))
+            gradient = self._band_gradient
+            gradient.setStart(band_rect.topLeft())
+            gradient.setFinalStop(band_rect.bottomLeft())
             painter.setBrush(gradient)
-            painter.drawPath(selection_path)
-
-        painter.setPen(QPen(QColor(90, 90, 90), self.sep_width))
-        y1 = _snap05(inner.top() + self.sep_inset)
-        y2 = _snap05(inner.bottom() - self.sep_inset)
-        for x in separators:
-            x_aligned = _snap05(x)
-            painter.drawLine(QPointF(x_aligned, y1), QPointF(x_aligned, y2))
-
+            painter.drawPath(band_path)
+            painter.restore()
+
+        if geom.separator_lines:
+            painter.setPen(self._sep_pen)
+            painter.drawLines(geom.separator_lines)
+
+        # Labels never overlap, so draw all inactive ones under one font/pen
+        # state and the active one last instead of switching per segment.
+        active = round(self._anim_pos)
+        painter.setFont(self._font_regular)
+        painter.setPen(self._pen_inactive)
         for index, rect in enumerate(segment_rects):
-            font = QFont(self.font())
-            font.setBold(index == round(self._anim_pos))
-            painter.setFont(font)
-            painter.setPen(self.text_active if index == round(self._anim_pos) else self.text_inactive)
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self._items[index])
-
-        painter.setPen(QPen(self.border, 1))
+            if index != active and dirty.intersects(rect):
+                self._draw_label(painter, rect, self._static_regular[index])
+        if 0 <= active < len(segment_rects) and dirty.intersects(segment_rects[active]):
+            painter.setFont(self._font_bold)
+            painter.setPen(self._pen_active)
+            self._draw_label(painter, segment_rects[active], self._static_bold[active])
+
+        painter.setPen(self._border_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawPath(outer_path)
 
     # ------------------------------------------------------------------
     # Geometry helpers
+    def _geometry(self) -> _BarGeometry:
+        """Return the cached paint geometry, rebuilding it when the key changes."""
+
+        key = (self.width(), self.height(), len(self._items), self.devicePixelRatioF())
+        if self._geom_cache is None or self._geom_cache.key != key:
+            self._geom_cache = self._rebuild_geom_cache(key)
+        return self._geom_cache
+
+    def _rebuild_geom_cache(self, key: tuple[int, int, int, float]) -> _BarGeometry:
+        width, height, _, device_ratio = key
+        overdraw = max(1.0, device_ratio * 0.8)
+
+        outer = _align_rect_05(QRectF(1.0, 1.0, width - 2.0, height - 2.0))
+        outer_path = QPainterPath()
+        outer_path.addRoundedRect(outer, self.radius, self.radius)
+
+        bg_rect = outer.adjusted(-overdraw, -overdraw, overdraw, overdraw)
+        bg_path = QPainterPath()
+        bg_path.addRoundedRect(bg_rect, self.radius + overdraw, self.radius + overdraw)
+
+        inner = _align_rect_05(outer.adjusted(self.h_pad, self.v_pad, -self.h_pad, -self.v_pad))
+        segment_rects, separators = self._segment_rects_and_boundaries(inner)
+        y1 = _snap05(inner.top() + self.sep_inset)
+        y2 = _snap05(inner.bottom() - self.sep_inset)
+        return _BarGeometry(
+            key=key,
+            overdraw=overdraw,
+            outer_path=outer_path,
+            bg_path=bg_path,
+            segment_rects=segment_rects,
+            separator_lines=[QLineF(_snap05(x), y1, _snap05(x), y2) for x in separators],
+            segment_lefts=[rect.left() for rect in segment_rects],
+            segment_widths=[rect.width() for rect in segment_rects],
+            band_top=_snap05(outer.top() - overdraw),
+            band_height=round(outer.height() + 2 * overdraw),
+            hit_left=float(self.h_pad),
+            hit_step=(width - 2 * self.h_pad) / max(1, len(self._items)),
+        )
+
+    def _band_rect_for_pos(self, geom: _BarGeometry, pos: float) -> QRectF:
+        """Return the highlight band rectangle for animation position *pos*."""
+
+        last = geom.last_band
+        if last is not None and last[0] == pos:
+            return last[1]
+        lefts = geom.segment_lefts
+        widths = geom.segment_widths
+        count = len(lefts)
+        if count == 1 or pos <= 0:
+            left, width = lefts[0], widths[0]
+        elif pos >= count - 1:
+            left, width = lefts[-1], widths[-1]
+        else:
+            index = int(pos)
+            fraction = pos - index
+            left = lefts[index] + (lefts[index + 1] - lefts[index]) * fraction
+            width = widths[index] + (widths[index + 1] - widths[index]) * fraction
+
+        overdraw = geom.overdraw
+        leftmost = pos < 0.001
+        rightmost = pos > count - 1.001
+        left -= self.h_pad if leftmost else overdraw
+        width += 2 * overdraw if not (leftmost or rightmost) else self.h_pad + overdraw
+        band_rect = QRectF(_snap05(left), geom.band_top, round(width), geom.band_height)
+        geom.last_band = (pos, band_rect)
+        return band_rect
+
     def _segment_rects_and_boundaries(self, inner: QRectF) -> tuple[list[QRectF], list[float]]:
         count = len(self._items)
         if count <= 0:
@@ -235,31 +417,13 @@ class SegmentedTopBar(QWidget):
         return usable, boundaries
 
     def _index_from_x(self, x: float) -> int | None:
-        inner = QRectF(self.h_pad, self.v_pad, self.width() - 2 * self.h_pad, self.height() - 2 * self.v_pad)
         count = len(self._items)
         if count <= 0:
             return None
-        index = int((x - inner.left()) // (inner.width() / count))
+        geom = self._geometry()
+        index = int((x - geom.hit_left) // geom.hit_step)
         return index if 0 <= index < count else None
 
-    @staticmethod
-    def _lerp(a: float, b: float, t: float) -> float:
-        return a + (b - a) * t
-
-    def _lerp_rects(self, rects: Sequence[QRectF], pos: float) -> QRectF:
-        count = len(rects)
-        if count == 1 or pos <= 0:
-            return rects[0]
-        if pos >= count - 1:
-            return rects[-1]
-        index = int(pos)
-        fraction = pos - index
-        first = rects[index]
-        second = rects[index + 1]
-        x = self._lerp(first.left(), second.left(), fraction)
-        width = self._lerp(first.width(), second.width(), fraction)
-        return QRectF(x, first.top(), width, first.height())
-
     # ------------------------------------------------------------------
     # Sizing helpers
     def sizeHint(self) -> QSize:  # type: ignore[override]
@@ -278,6 +442,8 @@ class SegmentedTopBar(QWidget):
     def _segment_width_hint(self) -> float:
         """Estimate a comfortable width for an individual segment."""
 
+        if self._width_hint_cache is not None:
+            return self._width_hint_cache
         metrics = self.fontMetrics()
         if not self._items:
             text_width = metrics.horizontalAdvance("Item")
@@ -286,7 +452,8 @@ class SegmentedTopBar(QWidget):
         # Provide additional breathing room around the text to mimic the native Photos toolbar.
         # The constant accounts for the inner padding used during painting so the highlight band
         # never clips the glyphs even when translated to high-DPI surfaces.
-        return float(text_width + (self.sep_inset + self.h_pad))
+        self._width_hint_cache = float(text_width + (self.sep_inset + self.h_pad))
+        return self._width_hint_cache
 
 
 # ----------------------------------------------------------------------
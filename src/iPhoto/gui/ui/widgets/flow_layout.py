@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from PySide6.QtCore import QPoint, QRect, QSize, Qt
-from PySide6.QtWidgets import QLayout, QLayoutItem, QSizePolicy, QWidget
+from PySide6.QtWidgets import QLayout, QLayoutItem, QSizePolicy, QWidget, QWidgetItem
 
 
 class FlowLayout(QLayout):
@@ -54,6 +54,17 @@ class FlowLayout(QLayout):
             return self._items.pop(index)
         return None
 
+    def replaceAt(self, index: int, widget: QWidget) -> QLayoutItem | None:  # noqa: N802
+        """Swap the item at *index* for *widget*, returning the previous item."""
+
+        if not 0 <= index < len(self._items):
+            return None
+        self.addChildWidget(widget)
+        previous = self._items[index]
+        self._items[index] = QWidgetItem(widget)
+        self.invalidate()
+        return previous
+
     def expandingDirections(self) -> Qt.Orientation:  # noqa: N802
         return Qt.Orientation(0)
 
@@ -277,6 +277,7 @@ class CropInteractionController:
                 apply_edge_push_zoom=self._apply_edge_push_auto_zoom,
             )
             self._on_cursor_change(cursor_for_handle(handle))
+        self._current_strategy.on_begin()
 
         event.accept()
 
@@ -526,25 +527,25 @@ class CropInteractionController:
         top_margin = float(crop_rect["top"])
         bottom_margin = max(0.0, vh - float(crop_rect["bottom"]))
 
-        if handle in (CropHandle.LEFT, CropHandle.TOP_LEFT, CropHandle.BOTTOM_LEFT):
+        if handle & CropHandle.LEFT:
             if delta_device.x() < 0.0 and left_margin < threshold:
                 p = (threshold - left_margin) / threshold
                 pressure = max(pressure, p)
                 offset_x = max(offset_x, -float(delta_image.x()) * p)
 
-        if handle in (CropHandle.RIGHT, CropHandle.TOP_RIGHT, CropHandle.BOTTOM_RIGHT):
+        if handle & CropHandle.RIGHT:
             if delta_device.x() > 0.0 and right_margin < threshold:
                 p = (threshold - right_margin) / threshold
                 pressure = max(pressure, p)
                 offset_x = min(offset_x, -float(delta_image.x()) * p)
 
-        if handle in (CropHandle.TOP, CropHandle.TOP_LEFT, CropHandle.TOP_RIGHT):
+        if handle & CropHandle.TOP:
             if delta_device.y() < 0.0 and top_margin < threshold:
                 p = (threshold - top_margin) / threshold
                 pressure = max(pressure, p)
                 offset_y = max(offset_y, -float(delta_image.y()) * p)
 
-        if handle in (CropHandle.BOTTOM, CropHandle.BOTTOM_LEFT, CropHandle.BOTTOM_RIGHT):
+        if handle & CropHandle.BOTTOM:
             if delta_device.y() > 0.0 and bottom_margin < threshold:
                 p = (threshold - bottom_margin) / threshold
                 pressure = max(pressure, p)
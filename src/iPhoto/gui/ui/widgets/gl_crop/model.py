@@ -38,6 +38,8 @@ class CropSessionModel:
         """Initialize the crop session model."""
         self._crop_state = CropBoxState()
         self._perspective_quad: list[tuple[float, float]] = unit_quad()
+        # True while the quad is the full unit square (no perspective or straighten)
+        self._is_identity_quad = True
         self._baseline_crop_state: tuple[float, float, float, float] | None = None
 
         # Cached perspective parameters
@@ -47,6 +49,8 @@ class CropSessionModel:
         self._rotate_steps: int = 0
         self._flip_horizontal: bool = False
         self._aspect_ratio: float = 0.0
+        # Quantised arguments of the last update_perspective call
+        self._perspective_key: tuple[int, int, int, int, bool, int] | None = None
 
     def get_crop_state(self) -> CropBoxState:
         """Return the current crop state object."""
@@ -72,8 +76,14 @@ class CropSessionModel:
 
     def has_changed(self, snapshot: tuple[float, float, float, float]) -> bool:
         """Return True when the current crop differs from snapshot."""
-        current = self.create_snapshot()
-        return any(abs(a - b) > 1e-6 for a, b in zip(snapshot, current, strict=True))
+        cx, cy, width, height = snapshot
+        state = self._crop_state
+        return (
+            abs(state.cx - cx) > 1e-6
+            or abs(state.cy - cy) > 1e-6
+            or abs(state.width - width) > 1e-6
+            or abs(state.height - height) > 1e-6
+        )
 
     def create_baseline(self) -> None:
         """Cache the current crop state as baseline for perspective interactions."""
@@ -118,6 +128,20 @@ class CropSessionModel:
         bool:
             True if the perspective quad changed, False otherwise.
         """
+        # Repeated slider ticks usually carry identical values; bail out before
+        # any further coercion or comparison when the quantised inputs match.
+        key = (
+            round(vertical * 1e6),
+            round(horizontal * 1e6),
+            round(straighten * 1e6),
+            int(rotate_steps),
+            bool(flip_horizontal),
+            round(aspect_ratio * 1e6),
+        )
+        if key == self._perspective_key:
+            return False
+        self._perspective_key = key
+
         new_vertical = float(vertical)
         new_horizontal = float(horizontal)
         new_straighten = float(straighten)
@@ -153,6 +177,11 @@ class CropSessionModel:
             flip_horizontal=new_flip,
         )
         self._perspective_quad = compute_projected_quad(matrix)
+        # Rotation is not baked into the quad and a horizontal flip maps the
+        # unit square onto itself, so only these three parameters matter.
+        self._is_identity_quad = (
+            new_vertical == 0.0 and new_horizontal == 0.0 and new_straighten == 0.0
+        )
         return True
 
     def _current_normalised_rect(self) -> NormalisedRect:
@@ -166,6 +195,10 @@ class CropSessionModel:
         Quad is in logical space (after perspective/straighten, before rotation).
         Crop is also in logical space. Direct comparison works.
         """
+        if self._is_identity_quad:
+            # Same 1e-6 edge tolerance as point_in_convex_polygon.
+            left, top, right, bottom = self._crop_state.bounds_normalised()
+            return left >= -1e-6 and top >= -1e-6 and right <= 1.0 + 1e-6 and bottom <= 1.0 + 1e-6
         quad = self._perspective_quad or unit_quad()
         return rect_inside_quad(self._current_normalised_rect(), quad)
 
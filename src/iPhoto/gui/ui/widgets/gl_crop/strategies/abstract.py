@@ -12,6 +12,9 @@ from PySide6.QtCore import QPointF
 class InteractionStrategy(ABC):
     """Base class for crop interaction strategies (pan, resize, etc.)."""
 
+    def on_begin(self) -> None:
+        """Handle start of interaction (mouse press), before any drag."""
+
     @abstractmethod
     def on_drag(self, delta_view: QPointF) -> None:
         """Handle drag movement in viewport coordinates.
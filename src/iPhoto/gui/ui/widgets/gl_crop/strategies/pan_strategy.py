@@ -43,11 +43,21 @@ class PanStrategy(InteractionStrategy):
         self._texture_size_provider = texture_size_provider
         self._get_effective_scale = get_effective_scale
         self._get_dpr = get_dpr
+        # Texture size and device pixel ratio stay fixed for one gesture.
+        self._texture_size: tuple[int, int] | None = None
+        self._dpr = 1.0
         self._on_crop_changed = on_crop_changed
 
+    def on_begin(self) -> None:
+        """Capture the texture size and device pixel ratio for this pan."""
+        self._texture_size = self._texture_size_provider()
+        self._dpr = self._get_dpr()
+
     def on_drag(self, delta_view: QPointF) -> None:
         """Handle pan drag movement."""
-        tex_w, tex_h = self._texture_size_provider()
+        if self._texture_size is None:
+            self.on_begin()
+        tex_w, tex_h = self._texture_size
         if tex_w <= 0 or tex_h <= 0:
             return
 
@@ -55,10 +65,11 @@ class PanStrategy(InteractionStrategy):
         if view_scale <= 1e-6:
             return
 
-        dpr = self._get_dpr()
-        delta_device_x = float(delta_view.x()) * dpr
-        delta_device_y = float(delta_view.y()) * dpr
-        delta_image = QPointF(delta_device_x / view_scale, delta_device_y / view_scale)
+        image_per_view = self._dpr / view_scale
+        delta_image = QPointF(
+            float(delta_view.x()) * image_per_view,
+            float(delta_view.y()) * image_per_view,
+        )
 
         snapshot = self._model.create_snapshot()
         crop_state = self._model.get_crop_state()
@@ -12,6 +12,13 @@ from ..model import CropSessionModel
 from ..utils import CropHandle
 from .abstract import InteractionStrategy
 
+# Edge bits of CropHandle; corner handles carry the bits of both edges.
+_EDGE_LEFT = int(CropHandle.LEFT)
+_EDGE_RIGHT = int(CropHandle.RIGHT)
+_EDGE_TOP = int(CropHandle.TOP)
+_EDGE_BOTTOM = int(CropHandle.BOTTOM)
+_EDGE_MASK = _EDGE_LEFT | _EDGE_RIGHT | _EDGE_TOP | _EDGE_BOTTOM
+
 
 class ResizeStrategy(InteractionStrategy):
     """Strategy for resizing crop box via edge/corner dragging."""
@@ -47,16 +54,36 @@ class ResizeStrategy(InteractionStrategy):
             Callback to apply edge-push auto-zoom.
         """
         self._handle = handle
+        self._edges = int(handle) & _EDGE_MASK
         self._model = model
         self._texture_size_provider = texture_size_provider
         self._get_effective_scale = get_effective_scale
         self._get_dpr = get_dpr
+        # Texture size and device pixel ratio stay fixed for one gesture.
+        self._texture_size: tuple[int, int] | None = None
+        self._dpr = 1.0
+        self._inv_tex_w = 0.0
+        self._inv_tex_h = 0.0
         self._on_crop_changed = on_crop_changed
         self._apply_edge_push_zoom = apply_edge_push_zoom
 
+    def on_begin(self) -> None:
+        """Capture the texture size and device pixel ratio for this resize."""
+        self._texture_size = self._texture_size_provider()
+        self._dpr = self._get_dpr()
+        tex_w, tex_h = self._texture_size
+        if tex_w > 0 and tex_h > 0:
+            self._inv_tex_w = 1.0 / tex_w
+            self._inv_tex_h = 1.0 / tex_h
+
     def on_drag(self, delta_view: QPointF) -> None:
         """Handle resize drag movement."""
-        tex_w, tex_h = self._texture_size_provider()
+        if delta_view.isNull():
+            # Trackpad jitter can repeat the previous position exactly.
+            return
+        if self._texture_size is None:
+            self.on_begin()
+        tex_w, tex_h = self._texture_size
         if tex_w <= 0 or tex_h <= 0:
             return
 
@@ -64,82 +91,85 @@ class ResizeStrategy(InteractionStrategy):
         if view_scale <= 1e-6:
             return
 
-        snapshot = self._model.create_snapshot()
-        dpr = self._get_dpr()
-        delta_world = QPointF(
-            float(delta_view.x()) * dpr / view_scale,
-            -float(delta_view.y()) * dpr / view_scale,
-        )
+        # The view scale can change mid-drag (edge-push zoom), so only the
+        # texture inverses are cached; this factor is rebuilt per event.
+        image_per_view = self._dpr / view_scale
+        delta_x = float(delta_view.x()) * image_per_view
+        delta_y = -float(delta_view.y()) * image_per_view
 
         # Crop box definition must be constrained by the original
         # texture bounds (scale=1, offset=0), not by the view transform state
         half_width_orig = tex_w * 0.5
         half_height_orig = tex_h * 0.5
-        img_bounds_world = {
-            "left": -half_width_orig,
-            "right": half_width_orig,
-            "bottom": -half_height_orig,
-            "top": half_height_orig,
-        }
-
-        # Convert the current crop rectangle into world coordinates
+
+        # Convert the current crop rectangle into world coordinates. Plain
+        # locals keep this per-mouse-move path free of temporary dicts.
         crop_state = self._model.get_crop_state()
-        crop_rect_px = crop_state.to_pixel_rect(tex_w, tex_h)
-        crop_world = {
-            "left": crop_rect_px["left"] - half_width_orig,
-            "right": crop_rect_px["right"] - half_width_orig,
-            "top": half_height_orig - crop_rect_px["top"],
-            "bottom": half_height_orig - crop_rect_px["bottom"],
-        }
+        previous = (crop_state.cx, crop_state.cy, crop_state.width, crop_state.height)
+        left_n, top_n, right_n, bottom_n = crop_state.bounds_normalised()
+        left = left_n * tex_w - half_width_orig
+        right = right_n * tex_w - half_width_orig
+        top = half_height_orig - top_n * tex_h
+        bottom = half_height_orig - bottom_n * tex_h
 
         # Minimum crop dimensions
         min_width_px = max(1.0, crop_state.min_width * tex_w)
         min_height_px = max(1.0, crop_state.min_height * tex_h)
 
         # Apply delta to appropriate edges
-        # We rely on ensure_valid_or_revert() at the end and shader boundary detection
+        # We rely on the quad check at the end and shader boundary detection
         # to prevent black borders. Intermediate validation was causing mismatches.
-        texture_handle = self._handle
-        delta_x, delta_y = delta_world.x(), delta_world.y()
-
-        if texture_handle in (CropHandle.LEFT, CropHandle.TOP_LEFT, CropHandle.BOTTOM_LEFT):
-            new_left = crop_world["left"] + delta_x
-            new_left = min(new_left, crop_world["right"] - min_width_px)
-            crop_world["left"] = new_left
-
-        if texture_handle in (CropHandle.RIGHT, CropHandle.TOP_RIGHT, CropHandle.BOTTOM_RIGHT):
-            new_right = crop_world["right"] + delta_x
-            new_right = max(new_right, crop_world["left"] + min_width_px)
-            crop_world["right"] = new_right
-
-        if texture_handle in (CropHandle.BOTTOM, CropHandle.BOTTOM_LEFT, CropHandle.BOTTOM_RIGHT):
-            new_bottom = crop_world["bottom"] + delta_y
-            new_bottom = min(new_bottom, crop_world["top"] - min_height_px)
-            crop_world["bottom"] = new_bottom
-
-        if texture_handle in (CropHandle.TOP, CropHandle.TOP_LEFT, CropHandle.TOP_RIGHT):
-            new_top = crop_world["top"] + delta_y
-            new_top = max(new_top, crop_world["bottom"] + min_height_px)
-            crop_world["top"] = new_top
+        edges = self._edges
+        if edges & _EDGE_LEFT:
+            left = min(left + delta_x, right - min_width_px)
+        if edges & _EDGE_RIGHT:
+            right = max(right + delta_x, left + min_width_px)
+        if edges & _EDGE_BOTTOM:
+            bottom = min(bottom + delta_y, top - min_height_px)
+        if edges & _EDGE_TOP:
+            top = max(top + delta_y, bottom + min_height_px)
 
         # Convert back to normalised coordinates
-        new_px_left = crop_world["left"] + half_width_orig
-        new_px_right = crop_world["right"] + half_width_orig
-        new_px_top = half_height_orig - crop_world["top"]
-        new_px_bottom = half_height_orig - crop_world["bottom"]
+        new_px_left = left + half_width_orig
+        new_px_right = right + half_width_orig
+        new_px_top = half_height_orig - top
+        new_px_bottom = half_height_orig - bottom
 
         new_width = new_px_right - new_px_left
         new_height = new_px_bottom - new_px_top
-        crop_state.cx = (new_px_left + new_px_right) * 0.5 / tex_w
-        crop_state.cy = (new_px_top + new_px_bottom) * 0.5 / tex_h
-        crop_state.width = new_width / tex_w
-        crop_state.height = new_height / tex_h
-        crop_state.clamp()
-
-        if not self._model.ensure_valid_or_revert(snapshot, allow_shrink=False):
+        inv_tex_w = self._inv_tex_w
+        inv_tex_h = self._inv_tex_h
+        crop_state.cx = (new_px_left + new_px_right) * 0.5 * inv_tex_w
+        crop_state.cy = (new_px_top + new_px_bottom) * 0.5 * inv_tex_h
+        crop_state.width = new_width * inv_tex_w
+        crop_state.height = new_height * inv_tex_h
+        # The edge updates above already keep the minimum size, so clamping
+        # only has work to do once an edge is pushed past the texture.
+        if (
+            new_px_left < 0.0
+            or new_px_top < 0.0
+            or new_px_right > tex_w
+            or new_px_bottom > tex_h
+        ):
+            crop_state.clamp()
+
+        # Resizes never auto-shrink, so an invalid candidate just restores the
+        # pre-drag values kept above instead of a model snapshot.
+        if not self._model.is_crop_inside_quad():
+            self._model.restore_snapshot(previous)
             return
         self._on_crop_changed()
-        self._apply_edge_push_zoom(delta_view)
+        # Edge-push zoom only builds pressure while a dragged edge moves
+        # outward, so skip the viewport maths for inward or sideways moves.
+        view_dx = delta_view.x()
+        view_dy = delta_view.y()
+        if (
+            (edges & _EDGE_LEFT and view_dx < 0.0)
+            or (edges & _EDGE_RIGHT and view_dx > 0.0)
+            or (edges & _EDGE_TOP and view_dy < 0.0)
+            or (edges & _EDGE_BOTTOM and view_dy > 0.0)
+        ):
+            self._apply_edge_push_zoom(delta_view)
 
     def on_end(self) -> None:
         """Handle end of resize interaction."""
@@ -14,18 +14,23 @@ from PySide6.QtCore import QPointF, Qt
 
 
 class CropHandle(enum.IntEnum):
-    """Enumeration of crop box interaction handles."""
+    """Enumeration of crop box interaction handles.
+
+    Edge handles occupy one bit each and corners combine the bits of their two
+    edges, so ``handle & CropHandle.LEFT`` tests whether a handle moves the left
+    edge.  ``INSIDE`` uses a separate bit and therefore matches no edge.
+    """
 
     NONE = 0
     LEFT = 1
     RIGHT = 2
-    BOTTOM = 3
     TOP = 4
-    TOP_LEFT = 5
-    TOP_RIGHT = 6
-    BOTTOM_RIGHT = 7
-    BOTTOM_LEFT = 8
-    INSIDE = -1
+    BOTTOM = 8
+    TOP_LEFT = TOP | LEFT
+    TOP_RIGHT = TOP | RIGHT
+    BOTTOM_LEFT = BOTTOM | LEFT
+    BOTTOM_RIGHT = BOTTOM | RIGHT
+    INSIDE = 16
 
 
 def cursor_for_handle(handle: CropHandle) -> Qt.CursorShape:
@@ -164,7 +169,7 @@ class CropBoxState:
 
         # Update edges incrementally to avoid order-dependency issues
         # Each edge update keeps the opposite edge fixed and recalculates center and size
-        if handle in (CropHandle.LEFT, CropHandle.TOP_LEFT, CropHandle.BOTTOM_LEFT):
+        if handle & CropHandle.LEFT:
             new_left = left + dx
             new_left = min(new_left, right - min_w)
             new_left = max(new_left, 0.0)
@@ -173,7 +178,7 @@ class CropBoxState:
             self.cx = new_left + self.width * 0.5
             left = new_left  # Update left for potential subsequent edge updates
 
-        if handle in (CropHandle.RIGHT, CropHandle.TOP_RIGHT, CropHandle.BOTTOM_RIGHT):
+        if handle & CropHandle.RIGHT:
             new_right = right + dx
             new_right = max(new_right, left + min_w)
             new_right = min(new_right, 1.0)
@@ -182,7 +187,7 @@ class CropBoxState:
             self.cx = left + self.width * 0.5
             # right = new_right  # Removed unused assignment
 
-        if handle in (CropHandle.BOTTOM, CropHandle.BOTTOM_LEFT, CropHandle.BOTTOM_RIGHT):
+        if handle & CropHandle.BOTTOM:
             new_bottom = bottom + dy
             new_bottom = max(new_bottom, top + min_h)
             new_bottom = min(new_bottom, 1.0)
@@ -191,7 +196,7 @@ class CropBoxState:
             self.cy = top + self.height * 0.5
             bottom = new_bottom  # Update bottom for potential subsequent edge updates
 
-        if handle in (CropHandle.TOP, CropHandle.TOP_LEFT, CropHandle.TOP_RIGHT):
+        if handle & CropHandle.TOP:
             new_top = top + dy
             new_top = min(new_top, bottom - min_h)
             new_top = max(new_top, 0.0)
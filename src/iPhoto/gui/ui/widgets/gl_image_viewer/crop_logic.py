@@ -7,6 +7,8 @@ manages the auto-lock behavior for crop view framing.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PySide6.QtCore import QRectF
 
 
@@ -29,6 +31,68 @@ def has_valid_crop(crop_w: float, crop_h: float) -> bool:
     return (crop_w < 1.0 - epsilon or crop_h < 1.0 - epsilon) and crop_w > 0.0 and crop_h > 0.0
 
 
+@lru_cache(maxsize=4)
+def _crop_rect_bounds(
+    crop_cx: float,
+    crop_cy: float,
+    crop_w: float,
+    crop_h: float,
+    tex_w: int,
+    tex_h: int,
+) -> tuple[float, float, float, float] | None:
+    """Return ``(left, top, width, height)`` for :func:`compute_crop_rect_pixels`.
+
+    Memoised because the locked crop view re-frames on every adjustment update,
+    usually with an unchanged crop and texture size.
+    """
+    if tex_w <= 0 or tex_h <= 0:
+        return None
+
+    # has_valid_crop() inlined to save a call.
+    if crop_w <= 0.0 or crop_h <= 0.0 or (crop_w >= 1.0 - 1e-3 and crop_h >= 1.0 - 1e-3):
+        return None
+
+    # Conditional expressions instead of nested min()/max() builtin calls.
+    tex_w_f = float(tex_w)
+    tex_h_f = float(tex_h)
+    width_px = crop_w * tex_w_f
+    width_px = 1.0 if width_px < 1.0 else (tex_w_f if width_px > tex_w_f else width_px)
+    height_px = crop_h * tex_h_f
+    height_px = 1.0 if height_px < 1.0 else (tex_h_f if height_px > tex_h_f else height_px)
+
+    center_x = crop_cx * tex_w_f
+    center_x = 0.0 if center_x < 0.0 else (tex_w_f if center_x > tex_w_f else center_x)
+    center_y = crop_cy * tex_h_f
+    center_y = 0.0 if center_y < 0.0 else (tex_h_f if center_y > tex_h_f else center_y)
+
+    half_w = width_px * 0.5
+    half_h = height_px * 0.5
+
+    left = center_x - half_w
+    if left < 0.0:
+        left = 0.0
+    top = center_y - half_h
+    if top < 0.0:
+        top = 0.0
+    right = center_x + half_w
+    if right > tex_w_f:
+        right = tex_w_f
+    bottom = center_y + half_h
+    if bottom > tex_h_f:
+        bottom = tex_h_f
+
+    rect_width = right - left
+    if rect_width < 1.0:
+        rect_width = 1.0
+    rect_height = bottom - top
+    if rect_height < 1.0:
+        rect_height = 1.0
+    epsilon = 1e-6
+    if rect_width >= tex_w_f - epsilon and rect_height >= tex_h_f - epsilon:
+        return None
+    return (left, top, rect_width, rect_height)
+
+
 def compute_crop_rect_pixels(
     crop_cx: float,
     crop_cy: float,
@@ -36,6 +100,7 @@ def compute_crop_rect_pixels(
     crop_h: float,
     tex_w: int,
     tex_h: int,
+    out: QRectF | None = None,
 ) -> QRectF | None:
     """Return the crop rectangle expressed in texture pixels.
     
@@ -56,37 +121,20 @@ def compute_crop_rect_pixels(
         Texture width in pixels
     tex_h:
         Texture height in pixels
+    out:
+        Optional rectangle that receives the result in place.  Callers that
+        recompute the crop frequently can pass a reusable instance to avoid
+        allocating a fresh :class:`QRectF` on every call.
         
     Returns
     -------
     QRectF | None
         Rectangle in pixel coordinates, or None if crop is invalid or covers entire image
     """
-    if tex_w <= 0 or tex_h <= 0:
-        return None
-    
-    if not has_valid_crop(crop_w, crop_h):
-        return None
-
-    tex_w_f = float(tex_w)
-    tex_h_f = float(tex_h)
-    width_px = max(1.0, min(tex_w_f, crop_w * tex_w_f))
-    height_px = max(1.0, min(tex_h_f, crop_h * tex_h_f))
-
-    center_x = max(0.0, min(tex_w_f, crop_cx * tex_w_f))
-    center_y = max(0.0, min(tex_h_f, crop_cy * tex_h_f))
-
-    half_w = width_px * 0.5
-    half_h = height_px * 0.5
-
-    left = max(0.0, center_x - half_w)
-    top = max(0.0, center_y - half_h)
-    right = min(tex_w_f, center_x + half_w)
-    bottom = min(tex_h_f, center_y + half_h)
-
-    rect_width = max(1.0, right - left)
-    rect_height = max(1.0, bottom - top)
-    epsilon = 1e-6
-    if rect_width >= tex_w_f - epsilon and rect_height >= tex_h_f - epsilon:
+    bounds = _crop_rect_bounds(crop_cx, crop_cy, crop_w, crop_h, tex_w, tex_h)
+    if bounds is None:
         return None
-    return QRectF(left, top, rect_width, rect_height)
+    if out is None:
+        return QRectF(*bounds)
+    out.setRect(*bounds)
+    return out
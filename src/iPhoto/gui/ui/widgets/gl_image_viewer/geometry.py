@@ -82,6 +82,19 @@ def get_rotate_steps(values: Mapping[str, float]) -> int:
     return int(float(values.get("Crop_Rotate90", 0.0))) % 4
 
 
+# ``(swap_axes, flip_x, flip_y)`` mapping a logical crop back to texture space
+# for each quarter-turn step:
+#   0: (x, y)        1: (y', 1 - x')  (inverse of 90° CW)
+#   2: (1-x', 1-y')  3: (1 - y', x')  (inverse of 90° CCW)
+# Width and height swap together with the centre axes.
+_QUARTER_TURNS: tuple[tuple[bool, bool, bool], ...] = (
+    (False, False, False),
+    (True, False, True),
+    (False, True, True),
+    (True, True, False),
+)
+
+
 def texture_crop_to_logical(
     crop: tuple[float, float, float, float], rotate_steps: int
 ) -> tuple[float, float, float, float]:
@@ -108,29 +121,15 @@ def texture_crop_to_logical(
     tcx, tcy, tw, th = crop
     if rotate_steps == 0:
         return (tcx, tcy, tw, th)
-    if rotate_steps == 1:
-        # Step 1: 90° CW (270° CCW) - texture TOP becomes visual RIGHT
-        # Transformation: (x', y') = (1-y, x)
-        return (
-            clamp_unit(1.0 - tcy),
-            clamp_unit(tcx),
-            clamp_unit(th),
-            clamp_unit(tw),
-        )
-    if rotate_steps == 2:
-        return (
-            clamp_unit(1.0 - tcx),
-            clamp_unit(1.0 - tcy),
-            clamp_unit(tw),
-            clamp_unit(th),
-        )
-    # Step 3: 90° CCW (270° CW) - texture TOP becomes visual LEFT  
-    # Transformation: (x', y') = (y, 1-x)
+    # Texture -> logical by ``n`` quarter turns is logical -> texture by ``4 - n``.
+    swap, flip_x, flip_y = _QUARTER_TURNS[-rotate_steps % 4]
+    if swap:
+        tcx, tcy, tw, th = tcy, tcx, th, tw
     return (
-        clamp_unit(tcy),
-        clamp_unit(1.0 - tcx),
-        clamp_unit(th),
-        clamp_unit(tw),
+        max(0.0, min(1.0, float(1.0 - tcx if flip_x else tcx))),
+        max(0.0, min(1.0, float(1.0 - tcy if flip_y else tcy))),
+        max(0.0, min(1.0, float(tw))),
+        max(0.0, min(1.0, float(th))),
     )
 
 
@@ -158,36 +157,15 @@ def logical_crop_to_texture(
         Crop coordinates in texture space
     """
     lcx, lcy, lw, lh = crop
-    if rotate_steps == 0:
-        return (
-            clamp_unit(lcx),
-            clamp_unit(lcy),
-            clamp_unit(lw),
-            clamp_unit(lh),
-        )
-    if rotate_steps == 1:
-        # Step 1 inverse: (x, y) = (y', 1-x') 
-        # (reverse of the forward 90° CW transformation)
-        return (
-            clamp_unit(lcy),
-            clamp_unit(1.0 - lcx),
-            clamp_unit(lh),
-            clamp_unit(lw),
-        )
-    if rotate_steps == 2:
-        return (
-            clamp_unit(1.0 - lcx),
-            clamp_unit(1.0 - lcy),
-            clamp_unit(lw),
-            clamp_unit(lh),
-        )
-    # Step 3 inverse: (x, y) = (1-y', x')
-    # (reverse of the forward 90° CCW transformation)
+    swap, flip_x, flip_y = _QUARTER_TURNS[rotate_steps % 4]
+    if swap:
+        lcx, lcy, lw, lh = lcy, lcx, lh, lw
+    # clamp_unit() inlined: this runs on every crop drag event.
     return (
-        clamp_unit(1.0 - lcy),
-        clamp_unit(lcx),
-        clamp_unit(lh),
-        clamp_unit(lw),
+        max(0.0, min(1.0, float(1.0 - lcx if flip_x else lcx))),
+        max(0.0, min(1.0, float(1.0 - lcy if flip_y else lcy))),
+        max(0.0, min(1.0, float(lw))),
+        max(0.0, min(1.0, float(lh))),
     )
 
 
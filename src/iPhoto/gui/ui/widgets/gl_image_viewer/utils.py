@@ -7,9 +7,20 @@ miscellaneous utilities.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PySide6.QtGui import QColor
 
 
+@lru_cache(maxsize=64)
+def _colour_from_string(value: str) -> QColor:
+    """Parse *value* once; palette strings recur on every theme refresh."""
+    colour = QColor(value)
+    if not colour.isValid():
+        colour = QColor("#000000")
+    return colour
+
+
 def normalise_colour(value: QColor | str) -> QColor:
     """Return a valid ``QColor`` derived from *value* (defaulting to black).
     
@@ -21,8 +32,12 @@ def normalise_colour(value: QColor | str) -> QColor:
     Returns
     -------
     QColor
-        Valid QColor object (defaults to black if input is invalid)
+        Valid QColor object (defaults to black if input is invalid).  String
+        inputs return a shared cached instance, so treat the result as
+        read-only and copy it before mutating.
     """
+    if isinstance(value, str):
+        return _colour_from_string(value)
     colour = QColor(value)
     if not colour.isValid():
         colour = QColor("#000000")
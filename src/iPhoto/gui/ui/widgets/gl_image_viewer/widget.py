@@ -131,6 +131,8 @@ class GLImageViewer(QOpenGLWidget):
             on_interaction_finished=self.cropInteractionFinished.emit,
         )
         self._auto_crop_view_locked: bool = False
+        # Reused by _compute_crop_rect_pixels; callers consume the rect immediately.
+        self._crop_rect_cache = QRectF()
         self._update_crop_perspective_state()
         
         # Input event handler
@@ -802,7 +804,9 @@ class GLImageViewer(QOpenGLWidget):
         # crop coordinates anchored to the unrotated texture, matching the "data stays still,
         # view moves" policy from the demo reference.
         crop_cx, crop_cy, crop_w, crop_h = geometry.logical_crop_from_texture(self._adjustments)
-        return crop_logic.compute_crop_rect_pixels(crop_cx, crop_cy, crop_w, crop_h, tex_w, tex_h)
+        return crop_logic.compute_crop_rect_pixels(
+            crop_cx, crop_cy, crop_w, crop_h, tex_w, tex_h, out=self._crop_rect_cache
+        )
 
     def _handle_crop_interaction_changed(
         self, cx: float, cy: float, width: float, height: float
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple, cast
-
-from PySide6.QtCore import QEvent, QPoint, QSize, Qt, Signal, QTimer
-from PySide6.QtGui import QMouseEvent, QPixmap, QWheelEvent
+import math
+from collections import OrderedDict
+from enum import IntEnum
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QEvent, QPoint, QRectF, QSize, Qt, Signal, QTimer
+from PySide6.QtGui import (
+    QColor,
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPaintEvent,
+    QPixmap,
+    QWheelEvent,
+)
 from PySide6.QtWidgets import (
     QFrame,
     QLabel,
@@ -16,9 +28,122 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ....utils.image_loader import load_qimage
 from ..palette import viewer_surface_color
 
 
+class _WheelAction(IntEnum):
+    """How the viewer interprets wheel gestures."""
+
+    NAVIGATE = 0
+    ZOOM = 1
+
+
+class _ViewerLabel(QLabel):
+    """Label that can paint its source pixmap scaled at draw time.
+
+    When the image is shown at or above its native resolution the label keeps
+    the full scaled size so the scroll area reports the right range, but
+    instead of holding a rendition that large it draws ``_source`` through the
+    painter.  The paint clip limits
+    the resampling to the region that is actually exposed.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._source: Optional[QPixmap] = None
+        self._pixmap_key: Optional[int] = None
+
+    def setPixmap(self, pixmap: QPixmap) -> None:  # type: ignore[override]
+        # Re-assigning the same pixmap would still invalidate the scroll area
+        # layout and schedule a repaint, so skip it.
+        key = pixmap.cacheKey()
+        if key == self._pixmap_key:
+            return
+        self._pixmap_key = key
+        super().setPixmap(pixmap)
+
+    def clear(self) -> None:  # type: ignore[override]
+        self._pixmap_key = None
+        super().clear()
+
+    def set_source(self, source: Optional[QPixmap]) -> None:
+        if source is self._source:
+            return
+        self._source = source
+        self.update()
+
+    def has_source(self) -> bool:
+        return self._source is not None
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # type: ignore[override]
+        if self._source is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        painter.drawPixmap(QRectF(self.rect()), self._source, QRectF(self._source.rect()))
+
+
+class _LoadingOverlay(QWidget):
+    """Translucent "Loading…" veil painted directly with ``QPainter``.
+
+    Drawing the fill and text by hand avoids routing the overlay through the
+    stylesheet engine, which a styled ``QLabel`` re-evaluates on every resize.
+    """
+
+    _BACKGROUND = QColor(0, 0, 0, 128)
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        font = self.font()
+        font.setPixelSize(18)
+        self.setFont(font)
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        rect = self.rect()
+        painter.fillRect(rect, self._BACKGROUND)
+        painter.setPen(Qt.GlobalColor.white)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "Loading…")
+
+
+class _ImageScrollArea(QScrollArea):
+    """Scroll area that hands viewport input straight to its ``ImageViewer``.
+
+    ``QAbstractScrollArea`` already routes the viewport's wheel and mouse
+    events to these virtuals, so overriding them avoids a Python event filter
+    that would also see every paint, enter and leave event.
+    """
+
+    def __init__(self, viewer: "ImageViewer") -> None:
+        super().__init__(viewer)
+        self._viewer = viewer
+
+    def wheelEvent(self, event: QWheelEvent) -> None:  # type: ignore[override]
+        if not self._viewer._on_viewport_wheel(event):
+            super().wheelEvent(event)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
+        if self._viewer._on_viewport_press(event):
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
+        if self._viewer._on_viewport_move(event):
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
+        if self._viewer._on_viewport_release(event):
+            event.accept()
+            return
+        super().mouseReleaseEvent(event)
+
+
 class ImageViewer(QWidget):
     """Simple viewer that centers, zooms, and scrolls a ``QPixmap``."""
 
@@ -40,7 +165,7 @@ class ImageViewer(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._pixmap: Optional[QPixmap] = None
-        self._label = QLabel(self)
+        self._label = _ViewerLabel(self)
         self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # Use a ``Fixed`` size policy along both axes so the scroll area honours
         # whichever explicit dimensions we assign to the label.  Allowing Qt to
@@ -56,7 +181,7 @@ class ImageViewer(QWidget):
         # the widget's rectangle.
         self._label.setScaledContents(False)
 
-        self._scroll_area = QScrollArea(self)
+        self._scroll_area = _ImageScrollArea(self)
         self._scroll_area.setWidgetResizable(False)
         self._scroll_area.setFrameShape(QFrame.Shape.NoFrame)
         self._scroll_area.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -70,6 +195,9 @@ class ImageViewer(QWidget):
         surface_color = viewer_surface_color(self)
         self._default_surface_color = surface_color
         self._surface_override: str | None = None
+        # Last colour pushed into the stylesheets; re-applying the same sheet
+        # still makes Qt re-polish the whole scroll area subtree.
+        self._applied_surface_color: str | None = surface_color
         self._scroll_area.setStyleSheet(
             f"background-color: {surface_color}; border: none;"
         )
@@ -77,22 +205,12 @@ class ImageViewer(QWidget):
             f"background-color: {surface_color}; border: none;"
         )
         self._scroll_area.setWidget(self._label)
-        self._scroll_area.viewport().installEventFilter(self)
 
         # ``_loading_overlay`` presents a translucent message while expensive
         # background work (such as decoding or tone-mapping a large image) is
-        # in flight.  Painting it as a child widget keeps the implementation
-        # simple and avoids introducing additional layout containers around the
-        # scroll area while still covering the entire viewer surface.
-        self._loading_overlay = QLabel("Loading…", self)
-        self._loading_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._loading_overlay.setAttribute(
-            Qt.WidgetAttribute.WA_TransparentForMouseEvents,
-            True,
-        )
-        self._loading_overlay.setStyleSheet(
-            "background-color: rgba(0, 0, 0, 128); color: white; font-size: 18px;"
-        )
+        # in flight.  It has to be a sibling above the scroll area: anything
+        # painted on the viewport itself would end up underneath the label.
+        self._loading_overlay = _LoadingOverlay(self)
         self._loading_overlay.hide()
 
         layout = QVBoxLayout(self)
@@ -110,11 +228,38 @@ class ImageViewer(QWidget):
         self._button_step = 0.1
         self._wheel_step = 0.1
         self._base_size: Optional[QSize] = None
+        # ``(viewport_size, cacheKey, base_scale, fit_width, fit_height)`` from the
+        # last render; zoom-only renders reuse the fit-to-window baseline.
+        self._baseline_cache: Optional[Tuple[QSize, int, float, int, int]] = None
+        # Smooth fit-to-window rendition; zoom levels below fit are scaled from
+        # it rather than from the (possibly much larger) source pixmap.
+        self._display_master: Optional[QPixmap] = None
+        # File shown via ``set_image_path`` and the size it was decoded for;
+        # ``None`` bound means the frame was decoded at full resolution.
+        self._image_path: Optional[Path] = None
+        self._decode_bound: Optional[QSize] = None
         self._is_panning = False
         self._pan_start_pos = QPoint()
         # ``_wheel_action`` allows the controller to toggle between zooming and delegating the
         # gesture to a parent widget that might interpret the wheel as navigation.
-        self._wheel_action = "navigate"
+        self._wheel_action = _WheelAction.NAVIGATE
+        # Recently scaled renditions keyed by ``(cacheKey, width, height)`` so
+        # repeated renders at the same zoom and viewport skip the smooth resample.
+        self._scaled_cache: OrderedDict[tuple[int, int, int], QPixmap] = OrderedDict()
+        self._scaled_cache_limit = 4
+        # Zoom steps and resizes first show a cheap nearest-neighbour rendition;
+        # the smooth resample runs once the gesture has been idle for a moment.
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(80)
+        self._smooth_timer.timeout.connect(self._render_pixmap_smooth)
+        self._smooth_target: Optional[Tuple[int, int]] = None
+        # Interactive window resizes deliver many resize events per frame;
+        # a zero-interval single shot collapses them into one render.
+        self._resize_render_timer = QTimer(self)
+        self._resize_render_timer.setSingleShot(True)
+        self._resize_render_timer.setInterval(0)
+        self._resize_render_timer.timeout.connect(self._render_after_resize)
 
     # ------------------------------------------------------------------
     # Public API
@@ -124,6 +269,9 @@ class ImageViewer(QWidget):
 
         self._surface_override = colour
         target = colour if colour is not None else self._default_surface_color
+        if target == self._applied_surface_color:
+            return
+        self._applied_surface_color = target
         stylesheet = f"background-color: {target}; border: none;"
         self._scroll_area.setStyleSheet(stylesheet)
         self._scroll_area.viewport().setStyleSheet(stylesheet)
@@ -139,8 +287,16 @@ class ImageViewer(QWidget):
 
         self._loading_overlay.hide()
         self._pixmap = pixmap
+        self._image_path = None
+        self._decode_bound = None
+        self._scaled_cache.clear()
+        self._baseline_cache = None
+        self._display_master = None
+        self._smooth_timer.stop()
+        self._resize_render_timer.stop()
         if self._pixmap is None or self._pixmap.isNull():
             self._label.clear()
+            self._label.set_source(None)
             # Collapse the label to a zero-sized footprint so the scroll area
             # does not retain stale minimum dimensions from the previous image.
             self._label.setFixedSize(0, 0)
@@ -161,6 +317,7 @@ class ImageViewer(QWidget):
         # from lingering on screen while we wait for the viewport to settle on its
         # final geometry.
         self._label.clear()
+        self._label.set_source(None)
 
         # Request a fresh layout pass so Qt recalculates the scroll area's viewport
         # using the intrinsic size of the new pixmap.
@@ -173,24 +330,55 @@ class ImageViewer(QWidget):
         QTimer.singleShot(0, self._render_pixmap)
         self.zoomChanged.emit(self._zoom_factor)
 
+    def set_image_path(self, path: Path | str) -> bool:
+        """Decode *path* at display resolution and show it.
+
+        Unlike :meth:`set_pixmap`, which receives an already decoded frame, this
+        lets ``QImageReader`` downscale during decode (libjpeg's scaled IDCT for
+        JPEG) to the largest size the viewer can show: the viewport at maximum
+        zoom.  Before the viewer is laid out the frame is decoded in full, and a
+        later resize past the decoded size decodes the file again.  Returns
+        ``False`` and clears the viewer when decoding fails.
+        """
+
+        path = Path(path)
+        target = self._decode_target()
+        image = load_qimage(path, target)
+        if image is None or image.isNull():
+            self.set_pixmap(None)
+            return False
+        self.set_pixmap(QPixmap.fromImage(image))
+        self._image_path = path
+        self._decode_bound = self._bound_for(image, target)
+        return True
+
     def pixmap(self) -> Optional[QPixmap]:
-        """Return a defensive copy of the currently rendered pixmap.
+        """Return the currently rendered pixmap.
 
         The edit controller reuses the preview image when leaving the edit view
-        so the detail view can display the final adjustments immediately.  A
-        copy keeps that hand-off safe even if the caller clears the viewer while
-        the pixmap is still referenced elsewhere.
+        so the detail view can display the final adjustments immediately.  The
+        viewer never paints into its pixmap and ``QPixmap`` is implicitly
+        shared, so the hand-off stays valid after the viewer is cleared; callers
+        that want to draw into the result should ``copy()`` it first.
         """
 
         if self._pixmap is None or self._pixmap.isNull():
             return None
-        return QPixmap(self._pixmap)
+        return self._pixmap
 
     def clear(self) -> None:
         """Remove any currently displayed image."""
 
         self._pixmap = None
+        self._image_path = None
+        self._decode_bound = None
+        self._scaled_cache.clear()
+        self._baseline_cache = None
+        self._display_master = None
+        self._smooth_timer.stop()
+        self._resize_render_timer.stop()
         self._label.clear()
+        self._label.set_source(None)
         # Reset the label to an empty frame to avoid inherited geometry forcing
         # subsequent renders to occupy an incorrect aspect ratio.
         self._label.setFixedSize(0, 0)
@@ -204,6 +392,7 @@ class ImageViewer(QWidget):
 
         if loading:
             self._loading_overlay.setGeometry(self.rect())
+            self._loading_overlay.raise_()
             self._loading_overlay.show()
             return
         self._loading_overlay.hide()
@@ -220,14 +409,9 @@ class ImageViewer(QWidget):
             predictable even if settings files are edited manually.
         """
 
-        self._wheel_action = "zoom" if action == "zoom" else "navigate"
-
-    def resizeEvent(self, event: QEvent) -> None:  # type: ignore[override]
-        """Ensure the loading overlay always covers the full viewer area."""
-
-        super().resizeEvent(event)
-        if self._loading_overlay.isVisible():
-            self._loading_overlay.setGeometry(self.rect())
+        self._wheel_action = (
+            _WheelAction.ZOOM if action == "zoom" else _WheelAction.NAVIGATE
+        )
 
     def set_live_replay_enabled(self, enabled: bool) -> None:
         """Allow emitting replay requests when the still frame is shown."""
@@ -253,7 +437,7 @@ class ImageViewer(QWidget):
 
         self._zoom_factor = clamped
         if self._pixmap is not None and not self._pixmap.isNull():
-            self._render_pixmap(anchor_point=anchor, anchor_ratios=anchor_ratios)
+            self._render_pixmap(anchor_point=anchor, anchor_ratios=anchor_ratios, fast=True)
         self.zoomChanged.emit(self._zoom_factor)
 
     def reset_zoom(self) -> None:
@@ -300,100 +484,93 @@ class ImageViewer(QWidget):
     # ------------------------------------------------------------------
     # QWidget overrides
     # ------------------------------------------------------------------
-    def resizeEvent(self, event) -> None:  # type: ignore[override]
+    def resizeEvent(self, event: QEvent) -> None:  # type: ignore[override]
+        """Keep the loading overlay covering the viewer and re-fit the image."""
+
         super().resizeEvent(event)
+        if self._loading_overlay.isVisible():
+            self._loading_overlay.setGeometry(self.rect())
         if self._pixmap is not None:
             # During the initial layout pass Qt may deliver resize events while the
             # widget is still negotiating its final viewport size. In that window we
             # simply want to fit the image to whatever size is currently available
-            # instead of computing anchor points that assume a stable geometry. By
-            # delegating directly to ``_render_pixmap`` we ensure the image is
-            # re-rendered with the latest dimensions, preventing the first paint from
-            # using stale, undersized measurements.
-            self._render_pixmap()
+            # instead of computing anchor points that assume a stable geometry. The
+            # deferred render reads the viewport size once the burst of resize events
+            # has been processed, so it still uses the latest dimensions.
+            self._resize_render_timer.start()
 
     def mousePressEvent(self, event: QMouseEvent) -> None:  # pragma: no cover - GUI behaviour
-        # The event filter coordinates click-versus-drag behaviour on the scroll area's
-        # viewport. Calling the base implementation keeps Qt's standard focus handling
+        # ``_ImageScrollArea`` coordinates click-versus-drag behaviour on the scroll
+        # area's viewport. Calling the base implementation keeps Qt's standard focus handling
         # intact.
         super().mousePressEvent(event)
 
-    def eventFilter(self, obj, event):  # type: ignore[override]
-        if obj is self._scroll_area.viewport():
-            if event.type() == QEvent.Type.Wheel:
-                wheel_event = cast(QWheelEvent, event)
-                if self._wheel_action != "zoom":
-                    # Interpret wheel deltas as navigation requests. The same threshold logic as
-                    # the filmstrip is reused so trackpad users who generate pixel deltas still
-                    # receive responsive behaviour.
-                    delta = wheel_event.angleDelta()
-                    step = delta.y() or delta.x()
-                    if step == 0:
-                        pixel_delta = wheel_event.pixelDelta()
-                        step = pixel_delta.y() or pixel_delta.x()
-                    if step == 0:
-                        return False
-                    if step < 0:
-                        self.nextItemRequested.emit()
-                    else:
-                        self.prevItemRequested.emit()
-                    wheel_event.accept()
-                    return True
-                if self._pixmap is None or self._pixmap.isNull():
-                    return False
-                if self._handle_wheel_event(wheel_event):
-                    return True
-
-            if event.type() == QEvent.Type.MouseButtonPress:
-                mouse_event = cast(QMouseEvent, event)
-                if mouse_event.button() == Qt.MouseButton.LeftButton:
-                    self._pan_start_pos = mouse_event.pos()
-                    if self._is_scrollable():
-                        # Signal to the user that dragging is available when the
-                        # image exceeds the viewport by switching to an open hand
-                        # cursor, but delay activating panning until movement occurs.
-                        self.setCursor(Qt.CursorShape.OpenHandCursor)
-                        return True
-            elif event.type() == QEvent.Type.MouseMove:
-                mouse_event = cast(QMouseEvent, event)
-                if (
-                    mouse_event.buttons() & Qt.MouseButton.LeftButton
-                    and not self._pan_start_pos.isNull()
-                ):
-                    delta = mouse_event.pos() - self._pan_start_pos
-                    if self._is_panning or (self._is_scrollable() and delta.manhattanLength() > 3):
-                        if not self._is_panning:
-                            # The threshold above ensures we only transition into the
-                            # active panning state after a deliberate drag. This avoids
-                            # interference with quick clicks that should replay media.
-                            self._is_panning = True
-                            self.setCursor(Qt.CursorShape.ClosedHandCursor)
-
-                        self._scroll_area.horizontalScrollBar().setValue(
-                            self._scroll_area.horizontalScrollBar().value() - delta.x()
-                        )
-                        self._scroll_area.verticalScrollBar().setValue(
-                            self._scroll_area.verticalScrollBar().value() - delta.y()
-                        )
-                        self._pan_start_pos = mouse_event.pos()
-                        return True
-            elif event.type() == QEvent.Type.MouseButtonRelease:
-                mouse_event = cast(QMouseEvent, event)
-                if (
-                    mouse_event.button() == Qt.MouseButton.LeftButton
-                    and not self._pan_start_pos.isNull()
-                ):
-                    was_panning = self._is_panning
-                    self._is_panning = False
-                    self._pan_start_pos = QPoint()
-                    self.unsetCursor()
-
-                    if not was_panning and self._live_replay_enabled:
-                        # A press followed by a release without movement should still
-                        # behave like a click, so we trigger the Live Photo replay now.
-                        self.replayRequested.emit()
-                    return True
-        return super().eventFilter(obj, event)
+    def _on_viewport_wheel(self, event: QWheelEvent) -> bool:
+        if self._wheel_action is not _WheelAction.ZOOM:
+            # Interpret wheel deltas as navigation requests. The same threshold logic as
+            # the filmstrip is reused so trackpad users who generate pixel deltas still
+            # receive responsive behaviour.
+            step = self._wheel_delta(event)
+            if step == 0:
+                return False
+            if step < 0:
+                self.nextItemRequested.emit()
+            else:
+                self.prevItemRequested.emit()
+            event.accept()
+            return True
+        if self._pixmap is None or self._pixmap.isNull():
+            return False
+        return self._handle_wheel_event(event)
+
+    def _on_viewport_press(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        self._pan_start_pos = event.pos()
+        if not self._is_scrollable():
+            return False
+        # Signal to the user that dragging is available when the image exceeds the
+        # viewport by switching to an open hand cursor, but delay activating panning
+        # until movement occurs.
+        self.setCursor(Qt.CursorShape.OpenHandCursor)
+        return True
+
+    def _on_viewport_move(self, event: QMouseEvent) -> bool:
+        if not (event.buttons() & Qt.MouseButton.LeftButton) or self._pan_start_pos.isNull():
+            return False
+        delta = event.pos() - self._pan_start_pos
+        if not (self._is_panning or (self._is_scrollable() and delta.manhattanLength() > 3)):
+            return False
+        if not self._is_panning:
+            # The threshold above ensures we only transition into the active panning
+            # state after a deliberate drag. This avoids interference with quick
+            # clicks that should replay media.
+            self._is_panning = True
+            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+
+        h_bar = self._scroll_area.horizontalScrollBar()
+        v_bar = self._scroll_area.verticalScrollBar()
+        h_bar.setValue(h_bar.value() - delta.x())
+        v_bar.setValue(v_bar.value() - delta.y())
+        self._pan_start_pos = event.pos()
+        return True
+
+    def _on_viewport_release(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.MouseButton.LeftButton or self._pan_start_pos.isNull():
+            return False
+        was_panning = self._is_panning
+        self._is_panning = False
+        self._pan_start_pos = QPoint()
+        self.unsetCursor()
+
+        if was_panning and self._smooth_timer.isActive():
+            self._smooth_timer.stop()
+            self._render_pixmap_smooth()
+        if not was_panning and self._live_replay_enabled:
+            # A press followed by a release without movement should still behave
+            # like a click, so we trigger the Live Photo replay now.
+            self.replayRequested.emit()
+        return True
 
     def viewport_widget(self) -> QWidget:
         """Expose the scroll area's viewport for higher-level event filters."""
@@ -410,11 +587,18 @@ class ImageViewer(QWidget):
         *,
         anchor_point: Optional[QPoint] = None,
         anchor_ratios: Optional[Tuple[float, float]] = None,
+        fast: bool = False,
     ) -> None:
+        # Smoothing is imperceptible while the content is being dragged, and
+        # ``_on_viewport_release`` swaps in the filtered rendition afterwards.
+        fast = fast or self._is_panning
         if self._pixmap is None or self._pixmap.isNull():
             self._label.clear()
+            self._label.set_source(None)
             self._label.setFixedSize(0, 0)
             self._base_size = None
+            self._baseline_cache = None
+            self._display_master = None
             return
 
         viewport_size = self._scroll_area.viewport().size()
@@ -424,42 +608,194 @@ class ImageViewer(QWidget):
         pix_size = self._pixmap.size()
         if pix_size.isEmpty():
             self._label.clear()
+            self._label.set_source(None)
             self._label.setFixedSize(0, 0)
             self._base_size = None
+            self._baseline_cache = None
+            self._display_master = None
             return
 
-        width_ratio = viewport_size.width() / max(1, pix_size.width())
-        height_ratio = viewport_size.height() / max(1, pix_size.height())
-        base_scale = min(width_ratio, height_ratio)
-        if base_scale <= 0:
-            base_scale = 1.0
-
-        fit_width = max(1, int(round(pix_size.width() * base_scale)))
-        fit_height = max(1, int(round(pix_size.height() * base_scale)))
-        self._base_size = QSize(fit_width, fit_height)
+        pixmap_key = self._pixmap.cacheKey()
+        baseline = self._baseline_cache
+        if (
+            baseline is not None
+            and baseline[1] == pixmap_key
+            and baseline[0] == viewport_size
+        ):
+            base_scale = baseline[2]
+        else:
+            width_ratio = viewport_size.width() / max(1, pix_size.width())
+            height_ratio = viewport_size.height() / max(1, pix_size.height())
+            base_scale = min(width_ratio, height_ratio)
+            if base_scale <= 0:
+                base_scale = 1.0
+
+            fit_width = max(1, int(round(pix_size.width() * base_scale)))
+            fit_height = max(1, int(round(pix_size.height() * base_scale)))
+            self._baseline_cache = (
+                viewport_size, pixmap_key, base_scale, fit_width, fit_height
+            )
+            self._base_size = QSize(fit_width, fit_height)
+            self._display_master = None
 
         scale = base_scale * self._zoom_factor
         target_width = max(1, int(round(pix_size.width() * scale)))
         target_height = max(1, int(round(pix_size.height() * scale)))
 
-        scaled = self._pixmap.scaled(
-            QSize(target_width, target_height),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+        h_bar = self._scroll_area.horizontalScrollBar()
+        v_bar = self._scroll_area.verticalScrollBar()
+
+        if scale >= 1.0:
+            # At or beyond 1:1 a full rendition would only duplicate (or blow
+            # up) the source, so the label scales it while painting and only
+            # provides the scroll range here.  Below 1:1 the painter's bilinear
+            # filter would alias, so minified levels keep the smooth renditions.
+            self._smooth_timer.stop()
+            self._label.clear()
+            size = pix_size.scaled(
+                QSize(target_width, target_height), Qt.AspectRatioMode.KeepAspectRatio
+            )
+            if self._label.minimumSize() != size or self._label.maximumSize() != size:
+                self._label.setFixedSize(size)
+            self._label.set_source(self._pixmap)
+            if anchor_point is not None and anchor_ratios is not None:
+                self._restore_anchor(anchor_point, anchor_ratios, h_bar, v_bar)
+            else:
+                self._center_viewport(h_bar, v_bar)
+            return
+
+        self._label.set_source(None)
+        scaled = self._scaled_cache.get((pixmap_key, target_width, target_height))
+        if scaled is None and fast:
+            # Nearest-neighbour scaling keeps wheel zooming and window resizes
+            # responsive; ``_render_pixmap_smooth`` swaps in the filtered copy.
+            scaled = self._pixmap.scaled(
+                QSize(target_width, target_height),
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
+            self._smooth_target = (target_width, target_height)
+            self._smooth_timer.start()
+        else:
+            self._smooth_timer.stop()
+            scaled = self._scaled_pixmap(target_width, target_height)
         self._label.setPixmap(scaled)
         # Match the label's geometry exactly to the scaled pixmap so Qt does
         # not perform any additional scaling when laying the widget out inside
         # the scroll area.
-        self._label.setFixedSize(scaled.size())
+        size = scaled.size()
+        if self._label.minimumSize() != size or self._label.maximumSize() != size:
+            self._label.setFixedSize(size)
 
-        h_bar = self._scroll_area.horizontalScrollBar()
-        v_bar = self._scroll_area.verticalScrollBar()
         if anchor_point is not None and anchor_ratios is not None:
             self._restore_anchor(anchor_point, anchor_ratios, h_bar, v_bar)
         else:
             self._center_viewport(h_bar, v_bar)
 
+    def _render_after_resize(self) -> None:
+        if self._pixmap is None:
+            return
+        bound = self._decode_bound
+        if bound is not None:
+            target = self._decode_target()
+            if target is not None and (
+                target.width() > bound.width() or target.height() > bound.height()
+            ):
+                self._redecode_image_path(target)
+        self._render_pixmap(fast=True)
+
+    def _decode_target(self) -> Optional[QSize]:
+        """Return the largest pixel size the viewer can show, or ``None`` before layout."""
+
+        if not self.isVisible():
+            return None
+        viewport_size = self._scroll_area.viewport().size()
+        if not viewport_size.isValid() or viewport_size.isEmpty():
+            return None
+        # Scale in device pixels so HiDPI screens still get a sharp image.
+        factor = self._max_zoom * self.devicePixelRatioF()
+        return QSize(
+            math.ceil(viewport_size.width() * factor),
+            math.ceil(viewport_size.height() * factor),
+        )
+
+    @staticmethod
+    def _bound_for(image: QImage, target: Optional[QSize]) -> Optional[QSize]:
+        """Return *target* if decoding was capped by it, ``None`` if it was not."""
+
+        if target is None:
+            return None
+        if image.width() < target.width() and image.height() < target.height():
+            # The file fits inside the target, so it was decoded in full.
+            return None
+        return target
+
+    def _redecode_image_path(self, target: QSize) -> None:
+        """Decode the current file again for a larger *target*, keeping the zoom."""
+
+        assert self._image_path is not None
+        image = load_qimage(self._image_path, target)
+        if image is None or image.isNull():
+            return
+        # Zoom is relative to the fit-to-window baseline, so swapping in a
+        # sharper frame keeps the view where it was.
+        self._pixmap = QPixmap.fromImage(image)
+        self._decode_bound = self._bound_for(image, target)
+        self._scaled_cache.clear()
+        self._baseline_cache = None
+        self._display_master = None
+
+    def _render_pixmap_smooth(self) -> None:
+        """Replace the fast rendition on the label with a smooth-scaled one."""
+
+        if self._pixmap is None or self._pixmap.isNull():
+            return
+        if self._is_panning:
+            # Resampling mid-drag would stall the pan; try again once it settles.
+            self._smooth_timer.start()
+            return
+        if self._smooth_target is None:
+            return
+        # The label already has the target geometry, so only its contents change
+        # and the scroll position is left untouched.
+        self._label.setPixmap(self._scaled_pixmap(*self._smooth_target))
+        self._smooth_target = None
+
+    def _scaled_pixmap(self, target_width: int, target_height: int) -> QPixmap:
+        """Return the smooth-scaled pixmap for the target size, reusing recent results."""
+
+        assert self._pixmap is not None
+        key = (self._pixmap.cacheKey(), target_width, target_height)
+        cached = self._scaled_cache.get(key)
+        if cached is not None:
+            self._scaled_cache.move_to_end(key)
+            return cached
+        source = self._pixmap
+        base = self._base_size
+        if (
+            base is not None
+            and target_width <= base.width()
+            and target_height <= base.height()
+            and (target_width, target_height) != (base.width(), base.height())
+        ):
+            source = self._fit_master(base)
+        scaled = source.scaled(
+            QSize(target_width, target_height),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        self._scaled_cache[key] = scaled
+        if len(self._scaled_cache) > self._scaled_cache_limit:
+            self._scaled_cache.popitem(last=False)
+        return scaled
+
+    def _fit_master(self, base: QSize) -> QPixmap:
+        """Return the smooth fit-to-window rendition for the current baseline."""
+
+        if self._display_master is None:
+            self._display_master = self._scaled_pixmap(base.width(), base.height())
+        return self._display_master
+
     def _capture_anchor_ratios(self, anchor: QPoint) -> Tuple[float, float]:
         h_bar = self._scroll_area.horizontalScrollBar()
         v_bar = self._scroll_area.verticalScrollBar()
@@ -508,6 +844,17 @@ class ImageViewer(QWidget):
         event.accept()
         return True
 
+    @staticmethod
+    def _wheel_delta(event: QWheelEvent) -> int:
+        """Return the dominant wheel delta, falling back to pixel deltas."""
+
+        angle = event.angleDelta()
+        step = angle.y() or angle.x()
+        if step:
+            return step
+        pixel = event.pixelDelta()
+        return pixel.y() or pixel.x()
+
     def _step_zoom(self, delta: float) -> None:
         anchor = self.viewport_center()
         self.set_zoom(self._zoom_factor + delta, anchor=anchor)
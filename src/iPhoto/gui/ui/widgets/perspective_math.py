@@ -8,6 +8,17 @@ from typing import Sequence
 
 import numpy as np
 
+# Unit-texture corners (0,0), (1,0), (1,1), (0,1) mapped to [-1, 1] clip space
+# as homogeneous column vectors, ready for a single matrix product.
+_CLIP_CORNERS = np.array(
+    [
+        [-1.0, 1.0, 1.0, -1.0],
+        [-1.0, -1.0, 1.0, 1.0],
+        [1.0, 1.0, 1.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+
 
 @dataclass(frozen=True)
 class NormalisedRect:
@@ -149,19 +160,14 @@ def compute_projected_quad(matrix: np.ndarray) -> list[tuple[float, float]]:
     except np.linalg.LinAlgError:
         forward = np.identity(3, dtype=np.float32)
 
-    def _project_point(uv: tuple[float, float]) -> tuple[float, float]:
-        x, y = uv
-        centered = np.array([(x * 2.0) - 1.0, (y * 2.0) - 1.0, 1.0], dtype=np.float32)
-        warped = forward @ centered
-        denom = float(warped[2])
+    # Project all four corners with one product instead of four matvecs.
+    wx, wy, wz = (forward.astype(np.float32, copy=False) @ _CLIP_CORNERS).tolist()
+    quad: list[tuple[float, float]] = []
+    for x, y, denom in zip(wx, wy, wz):
         if abs(denom) < 1e-6:
             denom = 1e-6 if denom >= 0.0 else -1e-6
-        nx = float(warped[0]) / denom
-        ny = float(warped[1]) / denom
-        return ((nx + 1.0) * 0.5, (ny + 1.0) * 0.5)
-
-    corners = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
-    return [_project_point(corner) for corner in corners]
+        quad.append(((x / denom + 1.0) * 0.5, (y / denom + 1.0) * 0.5))
+    return quad
 
 
 def quad_centroid(quad: Sequence[tuple[float, float]]) -> tuple[float, float]:
@@ -30,8 +30,18 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-def load_qimage(source: Path, target: QSize | None = None) -> Optional[QImage]:
-    """Return a :class:`QImage` for *source* with optional scaling."""
+def load_qimage(
+    source: Path,
+    target: QSize | None = None,
+    aspect_mode: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio,
+) -> Optional[QImage]:
+    """Return a :class:`QImage` for *source* with optional scaling.
+
+    *aspect_mode* selects how *target* is interpreted: ``KeepAspectRatio``
+    fits the image inside it, while ``KeepAspectRatioByExpanding`` decodes the
+    smallest image that still covers it, which suits callers that centre-crop
+    the result (e.g. square thumbnails) and would otherwise have to upscale.
+    """
 
     # ``QImageReader`` is most efficient when it can stream directly from the
     # filename because many formats (JPEG, HEIC, etc.) expose fast-paths for
@@ -59,10 +69,7 @@ def load_qimage(source: Path, target: QSize | None = None) -> Optional[QImage]:
             # pre-compute a size that preserves the source aspect ratio so the
             # decoder performs a proportional downscale rather than stretching to
             # fill the viewport bounds supplied by the caller.
-            scaled_target = original_size.scaled(
-                target,
-                Qt.AspectRatioMode.KeepAspectRatio,
-            )
+            scaled_target = original_size.scaled(target, aspect_mode)
             # Only request scaling when the destination is genuinely smaller; this
             # avoids unnecessary interpolation for thumbnails that are already
             # below the desired output resolution.
@@ -80,7 +87,7 @@ def load_qimage(source: Path, target: QSize | None = None) -> Optional[QImage]:
     image = reader.read()
     if not image.isNull():
         return image
-    return _load_with_pillow(source, target)
+    return _load_with_pillow(source, target, aspect_mode)
 
 
 def load_qpixmap(source: Path, target: QSize | None = None) -> Optional[QPixmap]:
@@ -131,7 +138,11 @@ def qimage_from_pil(image: "Image.Image") -> Optional[QImage]:
         return None
 
 
-def _load_with_pillow(source: Path, target: QSize | None = None) -> Optional[QImage]:
+def _load_with_pillow(
+    source: Path,
+    target: QSize | None = None,
+    aspect_mode: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio,
+) -> Optional[QImage]:
     if _Image is None or _ImageOps is None or _ImageQt is None:
         return None
     try:
@@ -140,7 +151,8 @@ def _load_with_pillow(source: Path, target: QSize | None = None) -> Optional[QIm
             if target is not None and target.isValid() and not target.isEmpty():
                 resample = getattr(_Image, "Resampling", _Image)
                 resample_filter = getattr(resample, "LANCZOS", _Image.BICUBIC)
-                img.thumbnail((target.width(), target.height()), resample_filter)
+                bounds = QSize(*img.size).scaled(target, aspect_mode)
+                img.thumbnail((bounds.width(), bounds.height()), resample_filter)
             qt_image = _ImageQt(img.convert("RGBA"))  # type: ignore[attr-defined]
     except Exception:
         _LOGGER.exception("Pillow failed to load image from %s", source)
@@ -0,0 +1,63 @@
+"""Tests for the buffer handling in :func:`apply_adjustments`."""
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from src.iPhoto.core.image_filters import apply_adjustments
+
+
+def _solid(color: str, fmt: QImage.Format = QImage.Format.Format_ARGB32) -> QImage:
+    image = QImage(24, 16, fmt)
+    image.fill(QColor(color))
+    return image
+
+
+def test_neutral_adjustments_share_the_source_buffer() -> None:
+    image = _solid("#884422")
+    result = apply_adjustments(image, {})
+
+    assert result.cacheKey() == image.cacheKey()
+
+    # Writing to the result detaches it instead of touching the source.
+    result.fill(QColor("#000000"))
+    assert image.pixelColor(0, 0).name() == "#884422"
+
+
+def test_tone_adjustments_leave_shared_source_untouched() -> None:
+    image = _solid("#884422")
+    alias = QImage(image)
+    result = apply_adjustments(image, {"Exposure": 0.4, "Saturation": 0.3})
+
+    assert result.pixelColor(0, 0) != image.pixelColor(0, 0)
+    assert image.pixelColor(0, 0).name() == "#884422"
+    assert alias.cacheKey() == image.cacheKey()
+
+
+def test_converted_source_matches_argb32_source() -> None:
+    adjustments = {"Exposure": -0.3, "Contrast": 0.2, "Vibrance": 0.4}
+    argb = apply_adjustments(_solid("#3366aa"), adjustments)
+    rgb32 = apply_adjustments(_solid("#3366aa", QImage.Format.Format_RGB32), adjustments)
+
+    def pixels(image: QImage) -> np.ndarray:
+        data = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.bytesPerLine() * image.height())
+        return data.reshape(image.height(), image.bytesPerLine())[:, : image.width() * 4]
+
+    assert np.array_equal(pixels(argb), pixels(rgb32))
+
+
+def test_identity_tone_curve_returns_private_copy() -> None:
+    from src.iPhoto.core.filters.pillow_executor import _PILLOW_SUPPORT, apply_adjustments_with_lut
+
+    if _PILLOW_SUPPORT is None:
+        pytest.skip("Pillow is not available")
+    image = _solid("#3366aa")
+    result = apply_adjustments_with_lut(image, list(range(256)))
+
+    assert result is not None
+    assert result.format() == QImage.Format.Format_ARGB32
+    assert result == image
+    assert result.cacheKey() != image.cacheKey()
+
+    result.fill(QColor("#000000"))
+    assert image.pixelColor(0, 0).name() == "#3366aa"
@@ -0,0 +1,121 @@
+"""Tests for the fused Color preview kernel."""
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QImage
+
+from src.iPhoto.core.filters.numpy_executor import apply_color_preview, apply_color_previews
+from src.iPhoto.core.image_filters import apply_adjustments
+
+
+def _random_image(width: int, height: int) -> QImage:
+    rng = np.random.default_rng(7)
+    pixels = rng.integers(0, 256, size=(height, width, 4), dtype=np.uint8)
+    pixels[..., 3] = 255
+    image = QImage(pixels.data, width, height, width * 4, QImage.Format.Format_ARGB32)
+    return image.copy()
+
+
+def _as_array(image: QImage) -> np.ndarray:
+    image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    data = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.bytesPerLine() * image.height())
+    return data.reshape(image.height(), image.bytesPerLine())[:, : image.width() * 4].copy()
+
+
+@pytest.mark.parametrize(
+    "saturation, vibrance, cast",
+    [(0.6, 0.3, 0.0), (-0.8, -0.4, 0.5), (0.2, 0.9, 1.0)],
+)
+def test_color_preview_matches_full_pipeline(saturation: float, vibrance: float, cast: float) -> None:
+    image = _random_image(37, 23)
+    gains = (1.1, 0.95, 0.9)
+    adjustments = {
+        "Saturation": saturation,
+        "Vibrance": vibrance,
+        "Cast": cast,
+        "Color_Gain_R": gains[0],
+        "Color_Gain_G": gains[1],
+        "Color_Gain_B": gains[2],
+    }
+
+    expected = _as_array(apply_adjustments(image, adjustments))
+    actual = _as_array(apply_color_preview(image, saturation, vibrance, cast, *gains))
+
+    assert np.abs(expected.astype(np.int16) - actual.astype(np.int16)).max() <= 1
+
+
+def test_color_preview_leaves_source_untouched() -> None:
+    image = _random_image(8, 8)
+    before = _as_array(image)
+
+    apply_color_preview(image, 1.0, 1.0, 1.0, 1.2, 1.0, 0.8)
+
+    assert np.array_equal(_as_array(image), before)
+
+
+def test_color_previews_batch_matches_individual_frames() -> None:
+    image = _random_image(19, 11)
+    params = [(-0.5, -0.2, 0.3), (0.0, 0.0, 0.0), (0.7, 0.4, 0.6)]
+    gains = (1.05, 1.0, 0.92)
+
+    batch = apply_color_previews(image, params, *gains)
+
+    assert len(batch) == len(params)
+    for frame, (saturation, vibrance, cast) in zip(batch, params):
+        single = apply_color_preview(image, saturation, vibrance, cast, *gains)
+        assert np.array_equal(_as_array(frame), _as_array(single))
+
+
+def test_compiled_color_previews_match_numpy_batch() -> None:
+    from src.iPhoto.core.filters.jit_executor import apply_color_previews_qimage
+
+    image = _random_image(29, 17)
+    before = _as_array(image)
+    params = [(-0.6, 0.2, 0.0), (0.0, 0.0, 0.0), (0.5, -0.3, 0.8)]
+    gains = (1.1, 0.97, 0.9)
+
+    compiled = apply_color_previews_qimage(image, params, *gains)
+    reference = apply_color_previews(image, params, *gains)
+
+    assert len(compiled) == len(params)
+    for frame, expected in zip(compiled, reference):
+        diff = _as_array(frame).astype(np.int16) - _as_array(expected).astype(np.int16)
+        assert np.abs(diff).max() <= 1
+    assert np.array_equal(_as_array(image), before)
+
+
+def test_neutral_color_preview_shares_source_buffer() -> None:
+    from src.iPhoto.core.filters.jit_executor import apply_color_previews_qimage
+
+    image = _random_image(13, 9)
+    params = [(0.4, 0.2, 0.1), (0.0, 0.0, 0.0)]
+
+    for previews in (
+        apply_color_previews(image, params, 1.2, 1.0, 0.8),
+        apply_color_previews_qimage(image, params, 1.2, 1.0, 0.8),
+    ):
+        assert previews[0].cacheKey() != image.cacheKey()
+        assert previews[1].cacheKey() == image.cacheKey()
+
+
+def test_numpy_color_fallback_matches_compiled_kernel() -> None:
+    pytest.importorskip("numba")
+    from src.iPhoto.core.filters.jit_kernels import _apply_color_adjustments_inplace
+    from src.iPhoto.core.filters.numpy_executor import apply_color_adjustments_inplace_buffer
+
+    width, height = 31, 7
+    bytes_per_line = width * 4 + 8
+    rng = np.random.default_rng(11)
+    source = rng.integers(0, 256, size=bytes_per_line * height, dtype=np.uint8)
+    args = (width, height, bytes_per_line, 0.45, -0.25, 0.6, 1.1, 0.97, 0.88)
+
+    expected = source.copy()
+    _apply_color_adjustments_inplace(expected, *args)
+    actual = source.copy()
+    apply_color_adjustments_inplace_buffer(actual, *args)
+
+    assert np.abs(expected.astype(np.int16) - actual.astype(np.int16)).max() <= 1
+    # Row padding and alpha bytes are never touched.
+    rows = actual.reshape(height, bytes_per_line)
+    assert np.array_equal(rows[:, width * 4 :], source.reshape(height, bytes_per_line)[:, width * 4 :])
+    assert np.array_equal(rows[:, 3 : width * 4 : 4], source.reshape(height, bytes_per_line)[:, 3 : width * 4 : 4])
@@ -0,0 +1,35 @@
+"""Tests for the 8-bit lookup tables behind ``compute_color_statistics``."""
+
+import numpy as np
+import pytest
+from PySide6.QtGui import QColor, QImage
+
+from src.iPhoto.core import color_resolver
+from src.iPhoto.core.color_resolver import compute_color_statistics
+
+
+def test_srgb_lut_matches_formula() -> None:
+    levels = np.arange(256, dtype=np.float32) / np.float32(255.0)
+    expected = color_resolver._srgb_to_linear(levels)
+
+    assert np.array_equal(color_resolver._SRGB_TO_LINEAR_LUT, expected)
+
+
+@pytest.mark.parametrize("maximum, minimum", [(0, 0), (255, 0), (200, 50), (17, 16)])
+def test_saturation_lut_matches_formula(maximum: int, minimum: int) -> None:
+    max_c = np.float32(maximum) / np.float32(255.0)
+    min_c = np.float32(minimum) / np.float32(255.0)
+    expected = 0.0 if max_c <= 0.0 else (max_c - min_c) / (max_c + 1e-8)
+
+    assert color_resolver._SATURATION_LUT[maximum, minimum] == pytest.approx(expected, rel=1e-6)
+
+
+def test_neutral_grey_has_no_saturation_or_cast() -> None:
+    image = QImage(16, 16, QImage.Format.Format_RGBA8888)
+    image.fill(QColor(128, 128, 128))
+
+    stats = compute_color_statistics(image)
+
+    assert stats.saturation_mean == pytest.approx(0.0)
+    assert stats.cast_magnitude == pytest.approx(0.0)
+    assert stats.white_balance_gain == pytest.approx((1.0, 1.0, 1.0))
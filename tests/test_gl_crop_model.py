@@ -84,6 +84,16 @@ def test_update_perspective_with_change(model):
     assert changed
 
 
+def test_update_perspective_ignores_sub_tolerance_jitter(model):
+    """Test that slider noise below 1e-6 does not rebuild the quad."""
+    model.update_perspective(0.1, 0.0, 0.0, 0, False, 1.0)
+    quad = model.get_perspective_quad()
+
+    assert not model.update_perspective(0.1 + 1e-9, 0.0, 0.0, 0, False, 1.0)
+    assert model.get_perspective_quad() is quad
+    assert model.update_perspective(0.1, 0.0, 0.0, 1, False, 1.0)
+
+
 def test_is_crop_inside_quad_initially(model):
     """Test that crop starts inside the unit quad."""
     # Default crop (full image) should be inside unit quad
@@ -91,6 +101,26 @@ def test_is_crop_inside_quad_initially(model):
     assert model.is_crop_inside_quad()
 
 
+def test_is_crop_inside_quad_identity_fast_path(model):
+    """Test that the unit-quad shortcut agrees with the polygon test."""
+    model.update_perspective(0.0, 0.0, 0.0, 1, True, 1.5)
+    crop_state = model.get_crop_state()
+    crop_state.width = 0.5
+    crop_state.height = 0.5
+    crop_state.cx = 0.25
+    assert model.is_crop_inside_quad()
+    crop_state.cx = 0.2
+    assert not model.is_crop_inside_quad()
+
+    model.update_perspective(0.3, 0.0, 0.0, 1, True, 1.5)
+    assert not model._is_identity_quad
+    crop_state.width = 1.0
+    crop_state.height = 1.0
+    crop_state.cx = 0.5
+    crop_state.cy = 0.5
+    assert not model.is_crop_inside_quad()
+
+
 def test_ensure_crop_center_inside_quad_when_already_inside(model):
     """Test that ensure_crop_center_inside_quad does nothing when already inside."""
     model.update_perspective(0.0, 0.0, 0.0, 0, False, 1.0)
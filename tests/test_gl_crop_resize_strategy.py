@@ -0,0 +1,102 @@
+"""Tests for the gl_crop ResizeStrategy module."""
+
+import pytest
+from PySide6.QtCore import QPointF
+
+from src.iPhoto.gui.ui.widgets.gl_crop.model import CropSessionModel
+from src.iPhoto.gui.ui.widgets.gl_crop.strategies.resize_strategy import ResizeStrategy
+from src.iPhoto.gui.ui.widgets.gl_crop.utils import CropHandle
+
+
+def _drag(handle: CropHandle, delta: QPointF) -> tuple[float, float, float, float]:
+    model = CropSessionModel()
+    model.update_perspective(0.0, 0.0, 0.0, 0, False, 1.0)
+    crop_state = model.get_crop_state()
+    crop_state.width = 0.5
+    crop_state.height = 0.5
+    strategy = ResizeStrategy(
+        handle=handle,
+        model=model,
+        texture_size_provider=lambda: (100, 100),
+        get_effective_scale=lambda: 1.0,
+        get_dpr=lambda: 1.0,
+        on_crop_changed=lambda: None,
+        apply_edge_push_zoom=lambda _delta: None,
+    )
+    strategy.on_drag(delta)
+    return crop_state.bounds_normalised()
+
+
+def test_corner_handle_moves_both_edges():
+    """Test that a corner handle moves exactly its two adjacent edges."""
+    left, top, right, bottom = _drag(CropHandle.TOP_LEFT, QPointF(10.0, 10.0))
+    assert (left, top) == (pytest.approx(0.35), pytest.approx(0.35))
+    assert (right, bottom) == (pytest.approx(0.75), pytest.approx(0.75))
+
+
+def test_edge_handle_moves_single_edge():
+    """Test that an edge handle leaves the other three edges in place."""
+    left, top, right, bottom = _drag(CropHandle.BOTTOM, QPointF(10.0, -10.0))
+    assert (left, top, right) == (pytest.approx(0.25), pytest.approx(0.25), pytest.approx(0.75))
+    assert bottom == pytest.approx(0.65)
+
+
+def test_zero_delta_skips_update():
+    """Test that a repeated mouse position does not report a crop change."""
+    changes: list[None] = []
+    strategy = ResizeStrategy(
+        handle=CropHandle.RIGHT,
+        model=CropSessionModel(),
+        texture_size_provider=lambda: (100, 100),
+        get_effective_scale=lambda: 1.0,
+        get_dpr=lambda: 1.0,
+        on_crop_changed=lambda: changes.append(None),
+        apply_edge_push_zoom=lambda _delta: None,
+    )
+    strategy.on_drag(QPointF(0.0, 0.0))
+    assert changes == []
+
+
+def test_drag_outside_quad_restores_previous_crop():
+    """Test that a resize leaving the straightened quad is rolled back."""
+    model = CropSessionModel()
+    model.update_perspective(0.0, 0.0, 10.0, 0, False, 1.0)
+    crop_state = model.get_crop_state()
+    crop_state.width = 0.5
+    crop_state.height = 0.5
+    changes: list[None] = []
+    strategy = ResizeStrategy(
+        handle=CropHandle.RIGHT,
+        model=model,
+        texture_size_provider=lambda: (100, 100),
+        get_effective_scale=lambda: 1.0,
+        get_dpr=lambda: 1.0,
+        on_crop_changed=lambda: changes.append(None),
+        apply_edge_push_zoom=lambda _delta: None,
+    )
+    strategy.on_drag(QPointF(40.0, 0.0))
+    assert crop_state.bounds_normalised() == (0.25, 0.25, 0.75, 0.75)
+    assert changes == []
+
+
+def test_edge_push_zoom_only_for_outward_moves():
+    """Test that edge-push zoom is consulted only when an edge moves outward."""
+    pushes: list[QPointF] = []
+    model = CropSessionModel()
+    model.update_perspective(0.0, 0.0, 0.0, 0, False, 1.0)
+    crop_state = model.get_crop_state()
+    crop_state.width = 0.5
+    crop_state.height = 0.5
+    strategy = ResizeStrategy(
+        handle=CropHandle.TOP_LEFT,
+        model=model,
+        texture_size_provider=lambda: (100, 100),
+        get_effective_scale=lambda: 1.0,
+        get_dpr=lambda: 1.0,
+        on_crop_changed=lambda: None,
+        apply_edge_push_zoom=pushes.append,
+    )
+    strategy.on_drag(QPointF(2.0, 2.0))
+    assert pushes == []
+    strategy.on_drag(QPointF(2.0, -2.0))
+    assert pushes == [QPointF(2.0, -2.0)]
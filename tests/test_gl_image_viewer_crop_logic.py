@@ -10,6 +10,7 @@ This allows testing with only the minimal PySide6 imports required.
 
 
 import pytest
+from PySide6.QtCore import QRectF
 
 # Import crop_logic using package structure. If Qt dependencies are problematic, mock them in test setup.
 from src.iPhoto.gui.ui.widgets.gl_image_viewer import crop_logic
@@ -120,3 +121,20 @@ class TestComputeCropRectPixels:
         assert result is not None
         assert result.width() >= 1.0
         assert result.height() >= 1.0
+
+    def test_writes_into_provided_rect(self):
+        """Passing ``out`` should fill and return the same rectangle instance."""
+        out = QRectF()
+        result = compute_crop_rect_pixels(0.5, 0.5, 0.5, 0.5, 100, 100, out=out)
+        assert result is out
+        assert (out.x(), out.y(), out.width(), out.height()) == (25.0, 25.0, 50.0, 50.0)
+        assert compute_crop_rect_pixels(0.5, 0.5, 1.0, 1.0, 100, 100, out=out) is None
+
+    def test_repeated_inputs_reuse_cached_bounds(self):
+        """Identical inputs should be served from the bounds cache."""
+        first = compute_crop_rect_pixels(0.4, 0.6, 0.3, 0.2, 640, 480)
+        hits = crop_logic._crop_rect_bounds.cache_info().hits
+        second = compute_crop_rect_pixels(0.4, 0.6, 0.3, 0.2, 640, 480)
+        assert crop_logic._crop_rect_bounds.cache_info().hits == hits + 1
+        assert second == first
+        assert second is not first
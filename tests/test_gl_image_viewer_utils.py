@@ -0,0 +1,19 @@
+"""Tests for the gl_image_viewer utils module."""
+
+from PySide6.QtGui import QColor
+
+from src.iPhoto.gui.ui.widgets.gl_image_viewer.utils import normalise_colour
+
+
+def test_normalise_colour_reuses_parsed_strings():
+    """Repeated palette strings should resolve to the same cached colour."""
+    first = normalise_colour("#1e1e1e")
+    assert first.name() == "#1e1e1e"
+    assert normalise_colour("#1e1e1e") is first
+
+
+def test_normalise_colour_defaults_to_black():
+    """Invalid inputs fall back to black for both strings and colours."""
+    assert normalise_colour("not-a-colour").name() == "#000000"
+    assert normalise_colour(QColor()).name() == "#000000"
+    assert normalise_colour(QColor("#336699")).name() == "#336699"
@@ -108,3 +108,21 @@ def test_straighten_orthogonality_inverse():
 
     # This SHOULD fail orthogonality
     assert abs(dot_prod) > 0.1, "Mismatching aspect ratios should produce non-orthogonal transform"
+
+
+def test_projected_quad_matches_per_corner_projection():
+    """The batched corner projection agrees with projecting each corner separately."""
+    assert pm.compute_projected_quad(np.identity(3, dtype=np.float32)) == [
+        (0.0, 0.0),
+        (1.0, 0.0),
+        (1.0, 1.0),
+        (0.0, 1.0),
+    ]
+
+    matrix = build_perspective_matrix(0.3, -0.2, image_aspect_ratio=1.5, straighten_degrees=7.0)
+    forward = np.linalg.inv(matrix)
+    quad = pm.compute_projected_quad(matrix)
+    for (u, v), (qx, qy) in zip([(0, 0), (1, 0), (1, 1), (0, 1)], quad):
+        warped = forward @ np.array([u * 2.0 - 1.0, v * 2.0 - 1.0, 1.0], dtype=np.float32)
+        assert qx == pytest.approx((warped[0] / warped[2] + 1.0) * 0.5, abs=1e-6)
+        assert qy == pytest.approx((warped[1] / warped[2] + 1.0) * 0.5, abs=1e-6)
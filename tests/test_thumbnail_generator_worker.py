@@ -0,0 +1,104 @@
+import os
+
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 is required for thumbnail worker tests", exc_type=ImportError)
+pytest.importorskip("PySide6.QtTest", reason="Qt test utilities unavailable", exc_type=ImportError)
+
+from PySide6.QtGui import QImage, QColor
+from PySide6.QtTest import QSignalSpy
+from PySide6.QtWidgets import QApplication
+
+from src.iPhoto.gui.ui.tasks.thumbnail_generator_worker import ThumbnailGeneratorWorker
+
+
+@pytest.fixture(scope="module")
+def qapp() -> QApplication:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def _solid_image(width: int = 320, height: int = 240) -> QImage:
+    image = QImage(width, height, QImage.Format.Format_ARGB32)
+    image.fill(QColor("#336699"))
+    return image
+
+
+def test_shared_worker_reports_each_strip_separately(qapp: QApplication) -> None:
+    worker = ThumbnailGeneratorWorker(_solid_image())
+    assert not worker.has_strips()
+
+    heights: list[int] = []
+
+    def generator(image: QImage, value: float) -> QImage:
+        heights.append(image.height())
+        return image
+
+    first = worker.add_strip([0.0, 0.5], generator, target_height=32, generation_id=1)
+    second = worker.add_strip(
+        [-1.0, 0.0, 1.0],
+        generator,
+        target_height=32,
+        generation_id=2,
+        batch_generator=lambda image, values: [image for _ in values],
+    )
+    assert worker.has_strips()
+
+    first_ready = QSignalSpy(first.thumbnail_ready)
+    first_finished = QSignalSpy(first.finished)
+    second_ready = QSignalSpy(second.thumbnail_ready)
+    second_finished = QSignalSpy(second.finished)
+
+    worker.run()
+
+    assert first_ready.count() == 2
+    assert second_ready.count() == 3
+    assert first_finished.count() == 1 and first_finished.at(0)[0] == 1
+    assert second_finished.count() == 1 and second_finished.at(0)[0] == 2
+    assert heights == [32, 32]
+
+
+def test_failing_strip_does_not_abort_the_others(qapp: QApplication) -> None:
+    worker = ThumbnailGeneratorWorker(_solid_image())
+
+    def broken(image: QImage, value: float) -> QImage:
+        raise RuntimeError("boom")
+
+    failing = worker.add_strip([0.0], broken, target_height=16, generation_id=3)
+    healthy = worker.add_strip([0.0], lambda image, value: image, target_height=16, generation_id=4)
+
+    error_spy = QSignalSpy(failing.error)
+    healthy_ready = QSignalSpy(healthy.thumbnail_ready)
+
+    worker.run()
+
+    assert error_spy.count() == 1
+    assert healthy_ready.count() == 1
+
+
+def test_cancelled_worker_stops_between_ticks(qapp: QApplication) -> None:
+    calls: list[float] = []
+    worker = ThumbnailGeneratorWorker(_solid_image())
+
+    def generator(image: QImage, value: float) -> QImage:
+        calls.append(value)
+        worker.cancel()
+        return image
+
+    signals = worker.add_strip([0.0, 0.5, 1.0], generator, target_height=16, generation_id=5)
+    later = worker.add_strip([0.0], generator, target_height=16, generation_id=6)
+    ready_spy = QSignalSpy(signals.thumbnail_ready)
+    finished_spy = QSignalSpy(signals.finished)
+    later_finished = QSignalSpy(later.finished)
+
+    worker.run()
+
+    assert worker.is_cancelled()
+    assert calls == [0.0]
+    assert ready_spy.count() == 0
+    # Cleanup signals still fire so owners can release their references.
+    assert finished_spy.count() == 1
+    assert later_finished.count() == 1
@@ -75,6 +75,20 @@ def test_generate_cache_path_hash_consistency(tmp_path: Path) -> None:
     assert len(hash_part) == 40  # blake2b with digest_size=20 produces 40 hex chars
 
 
+def test_generate_cache_path_digest_matches_resolved_path(tmp_path: Path) -> None:
+    """The memoised digest stays compatible with previously written cache files."""
+    import hashlib
+
+    abs_path = tmp_path / "album" / "IMG_0002.JPG"
+    expected = hashlib.blake2b(
+        str(abs_path.resolve()).encode("utf-8"), digest_size=20
+    ).hexdigest()
+
+    for _ in range(2):
+        result = generate_cache_path(tmp_path, abs_path, QSize(512, 512), 1)
+        assert result.name.split("_")[0] == expected
+
+
 def test_generate_cache_path_different_sizes(tmp_path: Path) -> None:
     """Test that different sizes produce different cache paths."""
     album_root = tmp_path / "album"
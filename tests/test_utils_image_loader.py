@@ -119,3 +119,32 @@ def test_generate_micro_thumbnail_handles_io_errors(tmp_path):
     invalid_file.write_text("not an image")
     blob = image_loader.generate_micro_thumbnail(invalid_file)
     assert blob is None
+
+
+def test_load_qimage_decodes_to_fill_size(tmp_path):
+    """Expanding mode decodes the smallest image covering the target."""
+    from PySide6.QtCore import QSize, Qt
+
+    image_path = tmp_path / "wide.jpg"
+    Image.new("RGB", (400, 200), color="red").save(image_path, format="JPEG")
+
+    fitted = image_loader.load_qimage(image_path, QSize(100, 100))
+    assert (fitted.width(), fitted.height()) == (100, 50)
+
+    filled = image_loader.load_qimage(
+        image_path, QSize(100, 100), Qt.AspectRatioMode.KeepAspectRatioByExpanding
+    )
+    assert (filled.width(), filled.height()) == (200, 100)
+
+
+def test_load_with_pillow_honours_aspect_mode(tmp_path):
+    """The Pillow fallback applies the same aspect handling as QImageReader."""
+    from PySide6.QtCore import QSize, Qt
+
+    image_path = tmp_path / "wide.png"
+    Image.new("RGB", (400, 200), color="red").save(image_path, format="PNG")
+
+    filled = image_loader._load_with_pillow(
+        image_path, QSize(100, 100), Qt.AspectRatioMode.KeepAspectRatioByExpanding
+    )
+    assert (filled.width(), filled.height()) == (200, 100)
@@ -31,6 +31,7 @@ def qapp():
 def mock_library():
     lib = MagicMock()
     lib.list_albums.return_value = []
+    lib.list_children.return_value = []
     # Mock treeUpdated signal
     lib.treeUpdated = MagicMock()
     lib.treeUpdated.connect = MagicMock()
@@ -119,3 +120,317 @@ def test_albums_dashboard_relays_signal(qtbot, mock_library):
             card.clicked.emit(album.path)
 
         assert blocker.args == [album.path]
+
+def test_albums_dashboard_reuses_cached_metadata(qtbot, mock_library, tmp_path):
+    """Unchanged albums are served from the metadata cache on refresh."""
+    album_dir = tmp_path / "album"
+    album_dir.mkdir()
+    album = MagicMock()
+    album.title = "Cached"
+    album.path = album_dir
+    mock_library.list_albums.return_value = [album]
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance") as mock_pool:
+        dashboard = AlbumsDashboard(mock_library)
+        qtbot.addWidget(dashboard)
+        assert mock_pool.return_value.start.call_count == 1
+
+        # Simulate the worker reporting back for the current generation.
+        dashboard._on_album_data_ready(
+            album, 7, None, album_dir, dashboard._current_generation
+        )
+
+        dashboard.refresh()
+        assert mock_pool.return_value.start.call_count == 1
+        assert dashboard._cards[album_dir].count_label.text() == "7"
+
+        # Touching the directory invalidates the cached entry.
+        (album_dir / "new.jpg").write_bytes(b"")
+        os.utime(album_dir, ns=(0, 1))
+        dashboard.refresh()
+        assert mock_pool.return_value.start.call_count == 2
+
+def test_albums_dashboard_refetches_after_subalbum_change(qtbot, mock_library, tmp_path):
+    """Changes inside a sub-album invalidate the parent's cached count."""
+    album_dir = tmp_path / "album"
+    sub_dir = album_dir / "sub"
+    sub_dir.mkdir(parents=True)
+    album = MagicMock()
+    album.title = "Parent"
+    album.path = album_dir
+    sub = MagicMock()
+    sub.path = sub_dir
+    mock_library.list_albums.return_value = [album]
+    mock_library.list_children.side_effect = lambda node: [sub] if node is album else []
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance") as mock_pool:
+        dashboard = AlbumsDashboard(mock_library)
+        qtbot.addWidget(dashboard)
+        dashboard._on_album_data_ready(
+            album, 3, None, album_dir, dashboard._current_generation
+        )
+        dashboard.refresh()
+        assert mock_pool.return_value.start.call_count == 1
+
+        parent_mtime = album_dir.stat().st_mtime_ns
+        (sub_dir / "new.jpg").write_bytes(b"")
+        os.utime(sub_dir, ns=(0, 1))
+        assert album_dir.stat().st_mtime_ns == parent_mtime
+        dashboard.refresh()
+        assert mock_pool.return_value.start.call_count == 2
+
+def test_albums_dashboard_refetches_after_index_update(qtbot, mock_library, tmp_path):
+    """A finished scan drops cached counts even when no directory changed."""
+    library_root = tmp_path / "library"
+    album_dir = library_root / "album"
+    other_dir = library_root / "other"
+    album_dir.mkdir(parents=True)
+    other_dir.mkdir()
+    album = MagicMock()
+    album.title = "Scanned"
+    album.path = album_dir
+    other = MagicMock()
+    other.title = "Other"
+    other.path = other_dir
+    mock_library.list_albums.return_value = [album, other]
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance") as mock_pool:
+        dashboard = AlbumsDashboard(mock_library)
+        qtbot.addWidget(dashboard)
+        on_scan_finished = mock_library.scanFinished.connect.call_args.args[0]
+        for node in (album, other):
+            dashboard._on_album_data_ready(
+                node, 5, None, node.path, dashboard._current_generation
+            )
+        assert mock_pool.return_value.start.call_count == 2
+
+        # A scan of a folder inside the album re-queries only that album.
+        on_scan_finished(album_dir / "nested", True)
+        assert mock_pool.return_value.start.call_count == 3
+        dashboard._on_album_data_ready(
+            album, 6, None, album_dir, dashboard._current_generation
+        )
+        assert dashboard._cards[album_dir].count_label.text() == "6"
+
+        # A library-wide scan re-queries every album.
+        on_scan_finished(library_root, True)
+        assert mock_pool.return_value.start.call_count == 5
+
+def test_thumbnail_loader_serves_memory_cache(qapp, tmp_path):
+    """Covers delivered once are shown from QPixmapCache and only re-validated."""
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+
+    from src.iPhoto.gui.ui.widgets.albums_dashboard import DashboardThumbnailLoader
+
+    image_path = tmp_path / "cover.jpg"
+    size = QSize(512, 512)
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance") as mock_pool:
+        loader = DashboardThumbnailLoader(library_root=tmp_path)
+        received: list[Path] = []
+        loader.thumbnailReady.connect(lambda root, _pixmap: received.append(root))
+
+        # The request only dispatches a job; no filesystem access on this thread.
+        loader.request_with_absolute_key(tmp_path, image_path, size)
+        assert mock_pool.return_value.start.call_count == 1
+        first_job = mock_pool.return_value.start.call_args[0][0]
+        assert first_job._known_stamp is None
+        assert received == []
+
+        image = QImage(8, 8, QImage.Format.Format_ARGB32)
+        image.fill(0)
+        key = (loader._album_root_str(tmp_path), str(image_path), 512, 512, 123)
+        loader._handle_result(key, image, str(image_path))
+        assert received == [tmp_path]
+
+        # Second request is served from memory and validated against the known stamp.
+        loader.request_with_absolute_key(tmp_path, image_path, size)
+        assert received == [tmp_path, tmp_path]
+        second_job = mock_pool.return_value.start.call_args[0][0]
+        assert second_job._known_stamp == 123
+
+        loader._validation_success.emit(key)
+        assert loader._key_to_root == {}
+        assert received == [tmp_path, tmp_path]
+
+
+def test_thumbnail_loader_ignores_failed_jobs(qapp, tmp_path):
+    """A job reporting ``None`` releases its pending entry without emitting."""
+    from PySide6.QtCore import QSize
+
+    from src.iPhoto.gui.ui.widgets.albums_dashboard import DashboardThumbnailLoader
+
+    image_path = tmp_path / "missing.jpg"
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance"):
+        loader = DashboardThumbnailLoader(library_root=tmp_path)
+        received: list[Path] = []
+        loader.thumbnailReady.connect(lambda root, _pixmap: received.append(root))
+
+        loader.request_with_absolute_key(tmp_path, image_path, QSize(512, 512))
+        key = (loader._album_root_str(tmp_path), str(image_path), 512, 512, 0)
+        loader._delivered.emit(key, None, str(image_path))
+
+        assert received == []
+        assert loader._key_to_root == {}
+
+
+def test_rounded_image_view_scales_cover_once(qapp):
+    """The cover is rescaled once per pixmap rather than on every paint."""
+    from PySide6.QtGui import QPixmap
+
+    from src.iPhoto.gui.ui.widgets.albums_dashboard import RoundedImageView
+
+    view = RoundedImageView()
+
+    exact = QPixmap(80, 80)
+    view.setPixmap(exact)
+    assert view._scaled_pixmap().cacheKey() == exact.cacheKey()
+
+    large = QPixmap(512, 384)
+    view.setPixmap(large)
+    scaled = view._scaled_pixmap()
+    assert scaled.height() == 80
+    assert scaled.width() >= 80
+    assert view._scaled_pixmap() is scaled
+
+
+def test_album_cards_share_prerendered_shadow(qapp):
+    """Cards paint a shared shadow pixmap instead of owning a graphics effect."""
+    first = AlbumCard(Path("/tmp/a"), "A", 1)
+    second = AlbumCard(Path("/tmp/b"), "B", 2)
+
+    assert first.graphicsEffect() is None
+    assert second.graphicsEffect() is None
+    assert first._shadow_pixmap() is second._shadow_pixmap()
+    assert first._shadow_pixmap().size() == first.size()
+
+
+def test_album_cards_share_placeholder_pixmap(qapp):
+    """The placeholder icon is rasterised once and shared by every card."""
+    first = AlbumCard(Path("/tmp/a"), "A", 1)
+    second = AlbumCard(Path("/tmp/b"), "B", 2)
+
+    assert first.image_view._placeholder is second.image_view._placeholder
+    assert not first.image_view._placeholder.isNull()
+
+
+def test_loader_signals_batch_worker_results(qapp):
+    """Results posted by workers are delivered in a single batched emission."""
+    from src.iPhoto.gui.ui.widgets.albums_dashboard import DashboardLoaderSignals
+
+    signals = DashboardLoaderSignals()
+    batches: list[list] = []
+    signals.albumsReady.connect(batches.append)
+
+    signals.expect(3)
+    assert signals._timer.isActive()
+    for index in range(3):
+        signals.post((None, index, None, Path(f"/tmp/{index}"), 1))
+
+    signals.flush()
+
+    assert len(batches) == 1
+    assert [item[1] for item in batches[0]] == [0, 1, 2]
+    assert not signals._timer.isActive()
+
+
+def test_albums_dashboard_refresh_diffs_cards(qtbot, mock_library):
+    """Refresh keeps existing cards, drops removed albums and appends new ones."""
+    first = MagicMock()
+    first.title = "First"
+    first.path = Path("/path/to/first")
+    second = MagicMock()
+    second.title = "Second"
+    second.path = Path("/path/to/second")
+    mock_library.list_albums.return_value = [first, second]
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance"):
+        dashboard = AlbumsDashboard(mock_library)
+        qtbot.addWidget(dashboard)
+        kept = dashboard._cards[second.path]
+
+        third = MagicMock()
+        third.title = "Third"
+        third.path = Path("/path/to/third")
+        mock_library.list_albums.return_value = [third, second]
+        dashboard.refresh()
+
+        assert list(dashboard._cards) == [second.path, third.path]
+        assert dashboard._cards[second.path] is kept
+        layout_order = [
+            dashboard.flow_layout.itemAt(index).widget().path
+            for index in range(dashboard.flow_layout.count())
+        ]
+        assert layout_order == [third.path, second.path]
+
+
+def test_album_card_elides_long_titles(qapp):
+    """Long titles are elided by pixel width and keep the full text as tooltip."""
+    title = "A very long album title that cannot possibly fit on the card"
+    card = AlbumCard(Path("/tmp/long"), title, 1)
+
+    assert card.title == title
+    assert card.title_label.text() != title
+    assert card.title_label.text().endswith("…")
+    assert card.title_label.toolTip() == title
+
+    card.set_title("Short")
+    assert card.title_label.text() == "Short"
+    assert card.title_label.toolTip() == ""
+
+
+def test_thumbnail_loader_invokes_callback_directly(qapp, tmp_path):
+    """With ``on_ready`` the cover bypasses the ``thumbnailReady`` signal."""
+    from PySide6.QtCore import QSize
+    from PySide6.QtGui import QImage
+
+    from src.iPhoto.gui.ui.widgets.albums_dashboard import DashboardThumbnailLoader
+
+    image_path = tmp_path / "cover.jpg"
+    delivered: list[Path] = []
+    emitted: list[Path] = []
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance"):
+        loader = DashboardThumbnailLoader(
+            library_root=tmp_path, on_ready=lambda root, _pixmap: delivered.append(root)
+        )
+        loader.thumbnailReady.connect(lambda root, _pixmap: emitted.append(root))
+
+        loader.request_with_absolute_key(tmp_path, image_path, QSize(64, 64))
+        image = QImage(4, 4, QImage.Format.Format_ARGB32)
+        image.fill(0)
+        key = (loader._album_root_str(tmp_path), str(image_path), 64, 64, 1)
+        loader._delivered.emit(key, image, str(image_path))
+
+    assert delivered == [tmp_path]
+    assert emitted == []
+
+
+def test_albums_dashboard_creates_cards_lazily(qtbot, mock_library):
+    """Only slots near the viewport are materialised into cards."""
+    albums = []
+    for index in range(120):
+        album = MagicMock()
+        album.title = f"Album {index}"
+        album.path = Path(f"/path/to/album{index}")
+        albums.append(album)
+    mock_library.list_albums.return_value = albums
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance"):
+        dashboard = AlbumsDashboard(mock_library)
+        qtbot.addWidget(dashboard)
+        dashboard.resize(900, 600)
+        dashboard.show()
+        qtbot.waitExposed(dashboard)
+        QApplication.processEvents()
+
+        assert 0 < len(dashboard._cards) < len(albums)
+        assert len(dashboard._cards) + len(dashboard._placeholders) == len(albums)
+
+        scroll_bar = dashboard.scroll_area.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+        QApplication.processEvents()
+
+        assert albums[-1].path in dashboard._cards
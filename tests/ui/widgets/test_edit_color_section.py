@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QThreadPool
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+
+from src.iPhoto.gui.ui.widgets import edit_color_section
+from src.iPhoto.gui.ui.widgets.edit_color_section import EditColorSection
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def _solid_image() -> QImage:
+    image = QImage(120, 80, QImage.Format.Format_ARGB32)
+    image.fill(QColor(120, 80, 200))
+    return image
+
+
+def test_color_stats_computed_once_per_base_image(qapp):
+    section = EditColorSection()
+    original = edit_color_section.compute_color_statistics
+
+    with patch.object(
+        edit_color_section, "compute_color_statistics", side_effect=original
+    ) as compute:
+        section.set_preview_image(_solid_image())
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
+
+    assert compute.call_count == 1
+    assert all(thumb is not None for thumb in section.master_slider._thumbnails)
+
+
+def test_master_distribution_reused_until_master_or_stats_change(qapp):
+    from src.iPhoto.core.color_resolver import ColorStats
+    from src.iPhoto.gui.ui.models.edit_session import EditSession
+
+    section = EditColorSection()
+    session = EditSession()
+    section.bind_session(session)
+    original = edit_color_section.ColorResolver.distribute_master
+
+    with patch.object(
+        edit_color_section.ColorResolver, "distribute_master", side_effect=original
+    ) as distribute:
+        session.set_value("Color_Master", 0.4)
+        session.set_value("Saturation", 0.1)
+        session.set_value("Vibrance", -0.1)
+        assert distribute.call_count == 1
+
+        session.set_value("Color_Master", 0.5)
+        assert distribute.call_count == 2
+
+        section._color_stats = ColorStats(saturation_mean=0.6)
+        session.set_value("Cast", 0.2)
+        assert distribute.call_count == 3
+
+    expected = original(0.5, section._color_stats)["Saturation"] + 0.1
+    assert section._rows["Saturation"].slider.value() == pytest.approx(expected, abs=1e-3)
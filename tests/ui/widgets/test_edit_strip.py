@@ -0,0 +1,159 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.iPhoto.gui.ui.widgets.edit_strip import BWSlider
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def test_bw_slider_reuses_cached_track_between_values(qapp):
+    slider = BWSlider("Intensity", minimum=-1.0, maximum=1.0, initial=0.0)
+    slider.resize(300, 40)
+    slider.grab()
+    cache = slider._track_cache
+    assert cache is not None
+
+    slider.setValue(0.5, emit=False)
+    slider.grab()
+    assert slider._track_cache is cache
+
+    slider.setName("Tone")
+    assert slider._track_cache is None
+    slider.grab()
+    assert slider._track_cache is not None
+
+    cache = slider._track_cache
+    slider.resize(320, 40)
+    slider.grab()
+    assert slider._track_cache is not cache
+    assert slider._track_cache[0].width() == 320
+
+
+def test_bw_slider_repaints_only_changed_region(qapp, monkeypatch):
+    slider = BWSlider("Intensity", minimum=-1.0, maximum=1.0, initial=0.0)
+    slider.resize(300, 40)
+    regions = []
+    monkeypatch.setattr(slider, "update", lambda *args: regions.append(args))
+
+    slider.setValue(0.1, emit=False)
+
+    assert regions
+    assert all(args and args[0].width() < slider.width() / 2 for args in regions)
+
+
+def test_bw_slider_dims_without_graphics_effect(qapp):
+    from src.iPhoto.gui.ui.widgets.edit_color_section import _SliderRow
+
+    row = _SliderRow("Saturation", "Saturation", -1.0, 1.0)
+    row.resize(300, 40)
+    bright = row.slider.grab().toImage()
+
+    row.setEnabled(False)
+    dimmed = row.slider.grab().toImage()
+
+    assert row.graphicsEffect() is None
+    assert not row.slider.isEnabled()
+    # Halfway along the track, past the label; the dimmed track blends with the background.
+    track_pixel = (150, 20)
+    assert dimmed.pixelColor(*track_pixel) != bright.pixelColor(*track_pixel)
+
+    row.setEnabled(True)
+    assert row.slider.grab().toImage() == bright
+
+
+def test_slider_row_coalesces_drag_updates(qapp):
+    from PySide6.QtTest import QSignalSpy, QTest
+
+    from src.iPhoto.gui.ui.widgets.edit_light_section import _SliderRow
+
+    row = _SliderRow("Exposure", "Exposure")
+    spy = QSignalSpy(row.uiValueChanged)
+
+    for value in (0.1, 0.2, 0.3):
+        row.slider.setValue(value)
+    assert spy.count() == 0
+
+    QTest.qWait(40)
+    assert spy.count() == 1
+    assert spy.at(0)[1] == pytest.approx(0.3)
+
+    row.slider.setValue(0.4)
+    row.slider.valueCommitted.emit(0.4)
+    assert spy.count() == 2
+    assert spy.at(1)[1] == pytest.approx(0.4)
+
+    QTest.qWait(40)
+    assert spy.count() == 2
+
+
+def test_bw_slider_clamped_step_emits_nothing(qapp):
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QKeyEvent
+    from PySide6.QtTest import QSignalSpy
+
+    slider = BWSlider("Intensity", minimum=-1.0, maximum=1.0, initial=1.0)
+    started = QSignalSpy(slider.interactionStarted)
+    committed = QSignalSpy(slider.valueCommitted)
+
+    right = QKeyEvent(QKeyEvent.Type.KeyPress, Qt.Key.Key_Right, Qt.KeyboardModifier.NoModifier)
+    slider.keyPressEvent(right)
+    assert started.count() == 0
+    assert committed.count() == 0
+
+    left = QKeyEvent(QKeyEvent.Type.KeyPress, Qt.Key.Key_Left, Qt.KeyboardModifier.NoModifier)
+    slider.keyPressEvent(left)
+    assert started.count() == 1
+    assert committed.count() == 1
+    assert slider.value() == pytest.approx(0.98)
+
+
+def test_slider_row_flushes_before_interaction_finishes(qapp):
+    from PySide6.QtTest import QSignalSpy, QTest
+
+    from src.iPhoto.gui.ui.widgets.edit_light_section import _SliderRow
+
+    row = _SliderRow("Exposure", "Exposure")
+    events = []
+    row.uiValueChanged.connect(lambda _key, value: events.append(("value", value)))
+    row.interactionFinished.connect(lambda: events.append(("finished", None)))
+
+    row.slider.setValue(0.3)
+    row.slider.interactionFinished.emit()
+    assert events[0][0] == "value" and events[0][1] == pytest.approx(0.3)
+    assert events[1] == ("finished", None)
+
+    spy = QSignalSpy(row.uiValueChanged)
+    row.slider.setValue(0.5)
+    row.setSession(None)
+    QTest.qWait(40)
+    assert spy.count() == 0
+
+
+def test_bw_slider_commits_drag_that_returns_to_start(qapp):
+    from PySide6.QtCore import QPoint, Qt
+    from PySide6.QtTest import QSignalSpy, QTest
+
+    slider = BWSlider("Intensity", minimum=-1.0, maximum=1.0, initial=0.0)
+    slider.resize(300, 35)
+    committed = QSignalSpy(slider.valueCommitted)
+
+    start = QPoint(150, 17)
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=start)
+    start_value = slider.value()
+    QTest.mouseMove(slider, QPoint(250, 17))
+    assert slider.value() != pytest.approx(start_value)
+    QTest.mouseMove(slider, start)
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=start)
+    assert committed.count() == 1
+    assert committed.at(0)[0] == pytest.approx(start_value)
+
+    # A click on the current position changes nothing and commits nothing.
+    QTest.mousePress(slider, Qt.MouseButton.LeftButton, pos=start)
+    QTest.mouseRelease(slider, Qt.MouseButton.LeftButton, pos=start)
+    assert committed.count() == 1
@@ -0,0 +1,138 @@
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from src.iPhoto.gui.ui.widgets.edit_topbar import SegmentedTopBar
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def test_topbar_reuses_geometry_while_animating(qapp):
+    bar = SegmentedTopBar(["Adjust", "Filters", "Crop"])
+    bar.resize(320, 36)
+    bar.grab()
+    geom = bar._geom_cache
+    assert geom is not None
+
+    bar.setAnimPos(0.5)
+    bar.grab()
+    assert bar._geom_cache is geom
+
+    bar.setAnimPos(1.0)
+    bar.grab()
+    bar.grab()
+    assert bar._geom_cache is geom
+
+    bar.resize(400, 36)
+    bar.grab()
+    assert bar._geom_cache is not geom
+
+    resized = bar._geom_cache
+    bar.setItems(["Basic", "Color", "Details", "Optics"])
+    assert bar._geom_cache is None
+    bar.grab()
+    assert len(bar._geom_cache.segment_rects) == 4
+    assert bar._geom_cache is not resized
+
+
+def test_topbar_rebuilds_fonts_on_font_change(qapp):
+    bar = SegmentedTopBar()
+    assert bar._font_bold.bold()
+    assert not bar._font_regular.bold()
+
+    font = bar.font()
+    font.setPointSize(font.pointSize() + 5)
+    bar.setFont(font)
+    assert bar._font_regular.pointSize() == font.pointSize()
+    assert bar._font_bold.pointSize() == font.pointSize()
+    assert bar._font_bold.bold()
+
+    bar.setItems(["Basic", "Color"])
+    assert [label.text() for label in bar._static_bold] == ["Basic", "Color"]
+    assert [label.text() for label in bar._static_regular] == ["Basic", "Color"]
+
+
+def test_topbar_partial_repaints_match_full_render(qapp):
+    bar = SegmentedTopBar(["Adjust", "Filters", "Crop"])
+    bar.resize(320, 36)
+    bar.show()
+    qapp.processEvents()
+
+    for step in range(0, 41):
+        bar.setAnimPos(step / 20)
+        qapp.processEvents()
+        full = bar.grab().toImage()
+        shown = bar.screen().grabWindow(bar.winId()).toImage().convertToFormat(full.format())
+        assert shown == full, f"stale pixels at animPos={step / 20}"
+    bar.close()
+
+
+def test_topbar_width_hint_tracks_items_and_font(qapp):
+    bar = SegmentedTopBar(["A", "B"])
+    narrow = bar.sizeHint().width()
+    assert bar.sizeHint().width() == narrow
+
+    bar.setItems(["Adjustments", "B"])
+    wide = bar.sizeHint().width()
+    assert wide > narrow
+
+    font = bar.font()
+    font.setPointSize(font.pointSize() * 2)
+    bar.setFont(font)
+    assert bar.sizeHint().width() > wide
+
+
+def test_topbar_animation_reaches_target(qapp):
+    from PySide6.QtTest import QTest
+
+    bar = SegmentedTopBar(["Adjust", "Filters", "Crop"])
+    bar.setCurrentIndex(2)
+    assert bar.getAnimPos() < 2.0
+    QTest.qWait(300)
+    assert bar.getAnimPos() == 2.0
+
+
+def test_topbar_reuses_steady_rendering(qapp):
+    bar = SegmentedTopBar(["Adjust", "Filters", "Crop"])
+    bar.resize(320, 36)
+    first = bar.grab().toImage()
+    cached = bar._steady_pixmap.cacheKey()
+    assert bar.grab().toImage() == first
+    assert bar._steady_pixmap.cacheKey() == cached
+
+    bar.setCurrentIndex(1, animate=False)
+    assert bar.grab().toImage() != first
+    assert bar._steady_pixmap.cacheKey() != cached
+
+    bar.setItems(["Basic", "Color"])
+    assert bar._steady_pixmap is None
+
+
+def test_topbar_index_from_x(qapp):
+    bar = SegmentedTopBar(["Adjust", "Filters", "Crop"])
+    bar.resize(320, 36)
+    step = (320 - 2 * bar.h_pad) / 3
+    assert bar._index_from_x(bar.h_pad - 1) is None
+    assert bar._index_from_x(bar.h_pad + 1) == 0
+    assert bar._index_from_x(bar.h_pad + step + 1) == 1
+    assert bar._index_from_x(320 - bar.h_pad - 1) == 2
+    assert bar._index_from_x(320 - bar.h_pad + 1) is None
+
+
+def test_topbar_draws_segment_separators(qapp):
+    bar = SegmentedTopBar(["Adjust", "Filters", "Crop"])
+    bar.resize(320, 36)
+    image = bar.grab().toImage()
+    lines = bar._geom_cache.separator_lines
+    assert len(lines) == 2
+    # The highlight sits on the first segment, so the last separator is drawn
+    # over the plain background.
+    line = lines[-1]
+    x = int(line.x1())
+    y = int((line.y1() + line.y2()) / 2)
+    assert image.pixelColor(x, y) != image.pixelColor(x + 4, y)
@@ -0,0 +1,354 @@
+import pytest
+from PySide6.QtCore import QEvent, QPoint, QPointF, QSize, Qt
+from PySide6.QtGui import QColor, QImage, QMouseEvent, QPixmap, QWheelEvent
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QLabel
+
+from src.iPhoto.gui.ui.widgets.image_viewer import ImageViewer, _WheelAction
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def _viewer_with_pixmap(qapp) -> ImageViewer:
+    viewer = ImageViewer()
+    viewer.resize(400, 300)
+    viewer.show()
+    qapp.processEvents()
+    pixmap = QPixmap(QSize(1600, 1200))
+    pixmap.fill(QColor("#336699"))
+    viewer.set_pixmap(pixmap)
+    qapp.processEvents()
+    return viewer
+
+
+def test_render_reuses_scaled_pixmap(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    first = viewer._label.pixmap().cacheKey()
+    viewer._render_pixmap()
+    assert viewer._label.pixmap().cacheKey() == first
+
+    viewer.set_zoom(2.0)
+    assert viewer._label.pixmap().cacheKey() != first
+    viewer.set_zoom(1.0)
+    assert viewer._label.pixmap().cacheKey() == first
+    viewer.close()
+
+
+def test_scaled_cache_is_bounded_and_cleared(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    for factor in (0.3, 0.4, 0.5, 0.6, 0.7, 0.8):
+        viewer.set_zoom(factor)
+        viewer._render_pixmap_smooth()
+    assert len(viewer._scaled_cache) == viewer._scaled_cache_limit
+
+    viewer.clear()
+    assert not viewer._scaled_cache
+    viewer.close()
+
+
+def test_zoom_shows_fast_rendition_then_smooth(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    viewer.set_zoom(0.5)
+    fast_key = viewer._label.pixmap().cacheKey()
+    assert viewer._smooth_timer.isActive()
+    assert len(viewer._scaled_cache) == 1
+
+    viewer._smooth_timer.stop()
+    viewer._render_pixmap_smooth()
+    smooth = viewer._label.pixmap()
+    assert smooth.cacheKey() != fast_key
+    assert smooth.size() == viewer._label.size()
+    assert len(viewer._scaled_cache) == 2
+    viewer.close()
+
+
+def test_zoomed_in_paints_source_without_scaled_copy(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    cached = len(viewer._scaled_cache)
+    # 1600x1200 fits a 400x300 viewport at 0.25, so zoom 4 reaches 1:1.
+    viewer.set_zoom(4.0)
+    viewport = viewer._scroll_area.viewport().size()
+    label = viewer._label
+    assert label.has_source()
+    assert label.pixmap().isNull()
+    assert label.width() > viewport.width() and label.height() > viewport.height()
+    assert len(viewer._scaled_cache) == cached
+    assert not viewer._smooth_timer.isActive()
+
+    h_bar = viewer._scroll_area.horizontalScrollBar()
+    h_bar.setValue(h_bar.value() + 25)
+    centre = viewer._scroll_area.viewport().rect().center()
+    assert viewer.grab().toImage().pixelColor(centre) == QColor("#336699")
+
+    viewer.set_zoom(1.0)
+    assert not label.has_source()
+    assert not label.pixmap().isNull()
+    viewer.close()
+
+
+def test_zoom_reuses_fit_baseline(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    baseline = viewer._baseline_cache
+    assert baseline is not None
+    base_size = viewer._base_size
+    viewer.set_zoom(0.5)
+    assert viewer._baseline_cache is baseline
+    assert viewer._base_size is base_size
+
+    pixmap = QPixmap(QSize(800, 800))
+    pixmap.fill(QColor("#993366"))
+    viewer.set_pixmap(pixmap)
+    assert viewer._baseline_cache is None
+    qapp.processEvents()
+    assert viewer._baseline_cache is not None
+    assert viewer._baseline_cache[1] == pixmap.cacheKey()
+    viewer.close()
+
+
+def test_resize_bursts_render_once(qapp, monkeypatch):
+    viewer = _viewer_with_pixmap(qapp)
+    calls = []
+    original = viewer._render_pixmap
+    monkeypatch.setattr(
+        viewer, "_render_pixmap", lambda **kwargs: (calls.append(kwargs), original(**kwargs))
+    )
+    for width in (420, 460, 500):
+        viewer.resize(width, 360)
+    assert calls == []
+
+    qapp.processEvents()
+    assert len(calls) == 1
+    viewport = viewer._scroll_area.viewport().size()
+    assert viewer._label.height() == viewport.height() or viewer._label.width() == viewport.width()
+    viewer.close()
+
+
+def test_loading_overlay_follows_resize(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    viewer.set_loading(True)
+    viewer.resize(520, 380)
+    assert viewer._loading_overlay.geometry() == viewer.rect()
+    viewer.close()
+
+
+def test_rerender_skips_reassigning_same_pixmap(qapp, monkeypatch):
+    viewer = _viewer_with_pixmap(qapp)
+    assigned = []
+    original = QLabel.setPixmap
+    monkeypatch.setattr(
+        QLabel, "setPixmap", lambda label, pixmap: (assigned.append(pixmap), original(label, pixmap))
+    )
+    viewer._render_pixmap()
+    assert assigned == []
+
+    viewer.set_zoom(0.5)
+    assert len(assigned) == 1
+    viewer.close()
+
+
+def test_surface_override_skips_unchanged_colour(qapp, monkeypatch):
+    viewer = ImageViewer()
+    calls = []
+    original = ImageViewer.setStyleSheet
+    monkeypatch.setattr(
+        ImageViewer,
+        "setStyleSheet",
+        lambda self, sheet: (calls.append(sheet), original(self, sheet)),
+    )
+    viewer.set_immersive_background(False)
+    assert calls == []
+    viewer.set_immersive_background(True)
+    viewer.set_immersive_background(True)
+    assert calls == ["background-color: #000000;"]
+    viewer.set_immersive_background(False)
+    assert len(calls) == 2
+    viewer.close()
+
+
+def test_wheel_navigation_uses_pixel_delta_fallback(qapp):
+    viewer = ImageViewer()
+    viewer.resize(400, 300)
+    received = []
+    viewer.nextItemRequested.connect(lambda: received.append("next"))
+    viewer.prevItemRequested.connect(lambda: received.append("prev"))
+
+    def wheel(angle: QPoint, pixel: QPoint) -> QWheelEvent:
+        return QWheelEvent(
+            QPointF(10, 10),
+            QPointF(10, 10),
+            pixel,
+            angle,
+            Qt.MouseButton.NoButton,
+            Qt.KeyboardModifier.NoModifier,
+            Qt.ScrollPhase.NoScrollPhase,
+            False,
+        )
+
+    viewport = viewer.viewport_widget()
+    for angle, pixel in ((QPoint(0, -120), QPoint()), (QPoint(), QPoint(0, 8))):
+        QApplication.sendEvent(viewport, wheel(angle, pixel))
+    assert not viewer._on_viewport_wheel(wheel(QPoint(), QPoint()))
+    assert received == ["next", "prev"]
+
+    viewer.set_wheel_action("zoom")
+    assert viewer._wheel_action is _WheelAction.ZOOM
+    viewer.close()
+
+
+def test_viewport_click_and_drag(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    viewer.set_live_replay_enabled(True)
+    replays = []
+    viewer.replayRequested.connect(lambda: replays.append(True))
+    viewport = viewer.viewport_widget()
+    QTest.mouseClick(viewport, Qt.MouseButton.LeftButton, pos=QPoint(50, 50))
+    assert replays == [True]
+
+    viewer.set_zoom(2.0)
+    qapp.processEvents()
+    h_bar = viewer._scroll_area.horizontalScrollBar()
+    start = h_bar.value()
+    QTest.mousePress(viewport, Qt.MouseButton.LeftButton, pos=QPoint(200, 150))
+    QTest.mouseMove(viewport, QPoint(150, 150))
+    QTest.mouseMove(viewport, QPoint(100, 150))
+    QTest.mouseRelease(viewport, Qt.MouseButton.LeftButton, pos=QPoint(100, 150))
+    assert h_bar.value() > start
+    assert replays == [True]
+    viewer.close()
+
+
+def test_sub_fit_zoom_scales_from_fit_master(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    master = viewer._display_master
+    assert master is None or master.size() == viewer._base_size
+    viewer.set_zoom(0.5)
+    viewer._smooth_timer.stop()
+    viewer._render_pixmap_smooth()
+    master = viewer._display_master
+    assert master is not None
+    assert master.size() == viewer._base_size
+    assert viewer._label.pixmap().width() < master.width()
+
+    viewer.resize(520, 380)
+    qapp.processEvents()
+    assert viewer._display_master is None or viewer._display_master.size() == viewer._base_size
+    viewer.clear()
+    assert viewer._display_master is None
+    viewer.close()
+
+
+def _large_jpeg(tmp_path):
+    source = tmp_path / "large.jpg"
+    image = QImage(4000, 3000, QImage.Format.Format_RGB32)
+    image.fill(QColor("#336699"))
+    assert image.save(str(source), "JPEG")
+    return source
+
+
+def test_set_image_path_decodes_at_display_resolution(qapp, tmp_path):
+    source = _large_jpeg(tmp_path)
+
+    viewer = ImageViewer()
+    viewer.resize(400, 300)
+    viewer.show()
+    qapp.processEvents()
+    assert viewer.set_image_path(source)
+    pixmap = viewer.pixmap()
+    assert pixmap is not None
+    viewport = viewer.viewport_widget().size()
+    assert pixmap.width() <= viewport.width() * viewer._max_zoom * viewer.devicePixelRatioF() + 1
+    assert pixmap.width() / pixmap.height() == pytest.approx(4 / 3, rel=0.01)
+
+    assert not viewer.set_image_path(tmp_path / "missing.jpg")
+    assert viewer.pixmap() is None
+    viewer.close()
+
+
+def test_set_image_path_decodes_in_full_before_layout(qapp, tmp_path):
+    viewer = ImageViewer()
+    assert viewer.set_image_path(_large_jpeg(tmp_path))
+    assert viewer.pixmap().size() == QSize(4000, 3000)
+    assert viewer._decode_bound is None
+    viewer.close()
+
+
+def test_set_image_path_redecodes_when_viewport_grows(qapp, tmp_path):
+    viewer = ImageViewer()
+    viewer.resize(200, 150)
+    viewer.show()
+    qapp.processEvents()
+    assert viewer.set_image_path(_large_jpeg(tmp_path))
+    qapp.processEvents()
+    small = viewer.pixmap().width()
+    assert small < 4000
+    viewer.set_zoom(2.0)
+
+    viewer.resize(600, 450)
+    qapp.processEvents()
+    assert viewer.pixmap().width() > small
+    assert viewer.zoom_factor() == pytest.approx(2.0)
+
+    viewer.set_pixmap(QPixmap(QSize(10, 10)))
+    assert viewer._image_path is None
+    viewer.close()
+
+
+def test_pixmap_survives_clear(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    pixmap = viewer.pixmap()
+    assert pixmap is viewer._pixmap
+    viewer.clear()
+    assert viewer.pixmap() is None
+    assert pixmap.size() == QSize(1600, 1200)
+    viewer.close()
+
+
+def test_render_during_pan_is_fast_until_release(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    viewer.set_zoom(0.5)
+    viewer._smooth_timer.stop()
+    viewer._render_pixmap_smooth()
+    viewer._scaled_cache.clear()
+
+    viewer._is_panning = True
+    viewer._pan_start_pos = QPoint(10, 10)
+    viewer._render_pixmap()
+    assert viewer._smooth_timer.isActive()
+    assert not viewer._scaled_cache
+
+    release = QMouseEvent(
+        QEvent.Type.MouseButtonRelease,
+        QPointF(10, 10),
+        QPointF(10, 10),
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.NoButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+    assert viewer._on_viewport_release(release)
+    assert not viewer._smooth_timer.isActive()
+    assert viewer._label.pixmap().cacheKey() in {
+        pixmap.cacheKey() for pixmap in viewer._scaled_cache.values()
+    }
+    viewer.close()
+
+
+def test_minified_zoom_above_fit_keeps_smooth_rendition(qapp):
+    viewer = _viewer_with_pixmap(qapp)
+    # Zoom 2 shows the 1600x1200 source at 0.5x, which the painter's
+    # bilinear filter would alias.
+    viewer.set_zoom(2.0)
+    label = viewer._label
+    assert not label.has_source()
+    assert label.pixmap().size() == QSize(800, 600)
+    viewer._smooth_timer.stop()
+    viewer._render_pixmap_smooth()
+    assert label.pixmap().cacheKey() in {
+        pixmap.cacheKey() for pixmap in viewer._scaled_cache.values()
+    }
+    viewer.close()